@@ -1,9 +1,11 @@
 """Verify the grounded ceiling/upside findings against the league's own 7-yr record."""
-import csv, json, math
+import csv, json, math, sys
 from pathlib import Path
 from collections import defaultdict
 
 ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / "models"))
+import espn_store  # noqa: E402
 YEARS = range(2019, 2026)
 repl = json.loads((ROOT/"data"/"processed"/"replacement_levels.json").read_text())["historical"]
 
@@ -25,9 +27,12 @@ def norm_pos(p):
 picks = []  # dict per pick
 standings = {}  # (owner, year) -> (final, points_for)
 for y in YEARS:
-    for r in csv.DictReader(open(ROOT/f"data/raw/espn/{y}/standings.csv", encoding="utf-8")):
+    st = espn_store.load("standings", ["owner", "final_standing", "points_for"], [y], add_year=False)
+    for r in st.to_dict("records"):
         standings[(r["owner"], y)] = (int(r["final_standing"]), float(r["points_for"]))
-    for r in csv.DictReader(open(ROOT/f"data/raw/espn/{y}/draft.csv", encoding="utf-8")):
+    dr = espn_store.load("draft", ["player_id", "overall_pick", "round_num", "owner", "position",
+                                   "player_name"], [y], add_year=False)
+    for r in dr.fillna({"position": "", "player_name": ""}).to_dict("records"):
         try:
             pid = int(r["player_id"]); ov = int(r["overall_pick"]); rd = int(r["round_num"])
         except ValueError:
@@ -1,15 +1,23 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, stream_with_context
 from flask_cors import CORS
 import os
 import time
 import requests
 import json
 import re
-import csv
 from dotenv import load_dotenv
 import anthropic
 import traceback
+import contextlib
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+import coach_pool
+import feeds
 import headshots as headshots_mod
+from models import board_store, draft_session, mentions, speculate
 
 # ---------------------------
 # Init
@@ -28,6 +36,22 @@ COACH_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-opus-4-8")
 COACH_EFFORT = os.getenv("ANTHROPIC_EFFORT", "medium")
 TIMEOUT = 20
 TTL_SECONDS = 600  # 10 minutes cache
+STALE_SECONDS = 3600  # past TTL, serve the old copy this long while one caller refreshes
+CACHE_MAX_ENTRIES = 64
+# Refresh the external feeds on background threads (feeds.py). 0 = the old on-request fetches.
+BACKGROUND_FEEDS = os.getenv("DRAFTIQ_BACKGROUND_FEEDS", "1") != "0"
+BOARD_SEASON = "2026REG"
+COMPARE_MAX_CANDIDATES = 16     # /api/odds/compare: one shortlist's worth
+# Speculative best-pick (models/speculate.py): pre-warm the coach call for the likeliest
+# room at your next turn once it is at least this likely. 0 = shortlists only.
+PREWARM_COACH = os.getenv("DRAFTIQ_PREWARM_COACH", "1") != "0"
+PREWARM_MIN_PROB = 0.2
+# Coach calls run on a bounded pool off the request thread (coach_pool.py). Pick-clock
+# calls (best-pick, opinion) give up after COACH_DEADLINE seconds and answer with the
+# deterministic fallback; chat and the closing brief get the longer one.
+COACH_IN_FLIGHT = int(os.getenv("DRAFTIQ_COACH_IN_FLIGHT", "3"))
+COACH_DEADLINE = float(os.getenv("DRAFTIQ_COACH_DEADLINE", "30"))
+COACH_LONG_DEADLINE = float(os.getenv("DRAFTIQ_COACH_LONG_DEADLINE", "90"))
 
 # Only construct the client if a key is present, so the rankings endpoints still
 # work without an Anthropic key configured.
@@ -137,19 +161,111 @@ def load_alias_map():
         return {}
 
 # ---------------------------
-# Simple in-memory cache
+# In-memory feed cache — bounded, thread-safe, single-flight
 # ---------------------------
-_cache = {}  # { key: (expiry_ts, data) }
+class _Flight:
+    """One in-progress fetch for a key; everyone else waiting on it reads the result."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.data = None
+        self.error = None
+
+
+class FeedCache:
+    """TTL + LRU cache for the slow SportsData feeds (20s timeouts).
+
+    On draft night the frontend polls several endpoints at once, so a shared expiry
+    used to fire one duplicate fetch per request. Now exactly one caller fetches a
+    key (the others wait on its _Flight), and once an entry is past TTL but inside
+    STALE_SECONDS callers get the old copy immediately while a background thread
+    refreshes it. A failed refresh keeps the old copy; a failed cold fetch raises
+    to every waiter, like the old uncached call did."""
+
+    def __init__(self, ttl=TTL_SECONDS, stale=STALE_SECONDS, max_entries=CACHE_MAX_ENTRIES):
+        self.ttl, self.stale, self.max_entries = ttl, stale, max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # { key: (expiry_ts, data) }, least recently used first
+        self._flights = {}             # { key: _Flight } while a fetch is running
+        self._stats = {"hits": 0, "stale": 0, "misses": 0, "waits": 0, "errors": 0,
+                       "fetches": 0, "fetchMsTotal": 0.0, "fetchMsMax": 0.0}
+
+    def get(self, key, fetch_fn):
+        now = time.time()
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None and now >= ent[0] + self.stale:
+                ent = None                                 # too old to serve
+            if ent is not None:
+                self._entries.move_to_end(key)
+                if now < ent[0]:
+                    self._stats["hits"] += 1
+                    return ent[1]
+                self._stats["stale"] += 1
+                if key not in self._flights:               # revalidate in the background
+                    flight = self._flights[key] = _Flight()
+                    threading.Thread(target=self._fill, args=(key, fetch_fn, flight),
+                                     daemon=True).start()
+                return ent[1]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats["misses"] += 1
+            else:
+                self._stats["waits"] += 1
+        if leader:
+            self._fill(key, fetch_fn, flight)
+        else:
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.data
+
+    def _fill(self, key, fetch_fn, flight):
+        t0 = time.perf_counter()
+        try:
+            flight.data = fetch_fn()
+        except Exception as e:
+            flight.error = e
+        ms = (time.perf_counter() - t0) * 1000
+        with self._lock:
+            st = self._stats
+            st["fetches"] += 1
+            st["fetchMsTotal"] += ms
+            st["fetchMsMax"] = max(st["fetchMsMax"], ms)
+            if flight.error is None:
+                self._entries[key] = (time.time() + self.ttl, flight.data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                st["errors"] += 1
+            del self._flights[key]
+        flight.done.set()
+
+    def stats(self):
+        """Counters for /api/health: hit/stale/miss/wait/error counts + fetch latency."""
+        with self._lock:
+            st = dict(self._stats)
+            st["entries"] = len(self._entries)
+            st["inFlight"] = len(self._flights)
+        st["fetchMsAvg"] = round(st["fetchMsTotal"] / st["fetches"], 1) if st["fetches"] else None
+        st["fetchMsTotal"] = round(st["fetchMsTotal"], 1)
+        st["fetchMsMax"] = round(st["fetchMsMax"], 1)
+        return st
+
+
+_cache = FeedCache()
+COACH = coach_pool.CoachPool(workers=COACH_IN_FLIGHT, deadline=COACH_DEADLINE)
+SPECULATOR = speculate.Speculator(coach=COACH)
+# Draft-state results (shortlist / spy / ghost / title odds), keyed by _state_key():
+# an unchanged room answers from memory; a new pick is a new key.
+RESULTS = draft_session.ResultCache()
+
 
 def _get_cached(key, fetch_fn):
-    now = time.time()
-    if key in _cache:
-        exp, data = _cache[key]
-        if now < exp:
-            return data
-    data = fetch_fn()
-    _cache[key] = (now + TTL_SECONDS, data)
-    return data
+    return _cache.get(key, fetch_fn)
 
 # ---------------------------
 # External fetchers
@@ -178,6 +294,47 @@ def _fetch_byes(season: str):
     resp.raise_for_status()
     return resp.json()
 
+def _fetch_week1_odds():
+    from models import week1_odds
+    return week1_odds.get(2026, 1)
+
+def _peek_week1_odds():
+    from models import week1_odds
+    return week1_odds.peek(2026, 1)
+
+def _poll_espn_draft():
+    """One live-draft poll: the shared watcher maps any new picks and wakes streams."""
+    from models import espn_sync
+    espn_sync.WATCH.poll(_load_board_rows())
+    return espn_sync.WATCH.league
+
+# ---------------------------
+# Background feeds — every external source the board / odds / live-sync endpoints
+# read, refreshed on its own cadence off the request path (see feeds.py)
+# ---------------------------
+FEEDS = feeds.Refresher()
+FEEDS.add(f"byes:{BOARD_SEASON}", lambda: _fetch_byes(BOARD_SEASON), every=6 * 3600)
+FEEDS.add("headshots:sportsdata", _fetch_headshots, every=TTL_SECONDS)
+FEEDS.add("headshots:espn", headshots_mod.get_map, every=3600, seed=headshots_mod.peek_map)
+FEEDS.add("week1_odds", _fetch_week1_odds, every=1800, seed=_peek_week1_odds)
+# the live draft poll (espn_sync.DraftWatcher.POLL): parked until /api/espn/draft or
+# its stream first reads it, and again once nobody has watched for 5 minutes
+FEEDS.add("espn:2026", _poll_espn_draft, every=2, idle_after=300, retry=8)
+
+
+@app.before_request
+def _start_feeds():
+    if BACKGROUND_FEEDS and not FEEDS.started:
+        FEEDS.start()
+
+
+def _feed(name, fallback):
+    """A background feed's latest snapshot (None until its first fetch lands) — no
+    network. `fallback()` is the old on-request fetch, used only with feeds off."""
+    if FEEDS.started:
+        return FEEDS.value(name)
+    return fallback()
+
 # ---------------------------
 # Utilities
 # ---------------------------
@@ -394,18 +551,25 @@ def ai_opinion():
         if COACH_EFFORT:  # set ANTHROPIC_EFFORT="" to drop the effort knob entirely
             output_config["effort"] = COACH_EFFORT
 
-        resp = client.messages.create(
-            model=COACH_MODEL,
-            max_tokens=1024,
-            system=system_blocks,
-            output_config=output_config,
-            messages=[
-                {
-                    "role": "user",
-                    "content": "Evaluate this candidate for my next pick. Context JSON:\n"
-                    + json.dumps(ctx),
-                }
-            ],
+        # Off the request thread; a newer pick for the same team drops this ask.
+        meta = body.get("meta", {}) or {}
+        resp = COACH.call(
+            lambda: client.messages.create(
+                model=COACH_MODEL,
+                max_tokens=1024,
+                system=system_blocks,
+                output_config=output_config,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": "Evaluate this candidate for my next pick. Context JSON:\n"
+                        + json.dumps(ctx),
+                    }
+                ],
+                timeout=COACH_DEADLINE,
+            ),
+            channel=("opinion", body.get("myTeamName")),
+            state=(meta.get("pickNumber"), meta.get("teams")),
         )
 
         if resp.stop_reason == "refusal":
@@ -435,7 +599,6 @@ def ai_opinion():
             for v in roster.values():
                 if isinstance(v, dict) and v.get("position"):
                     b = _posb(v["position"]); filled[b] = filled.get(b, 0) + 1
-        meta = body.get("meta", {}) or {}
         try:
             pick_no, teams = int(meta.get("pickNumber") or 0), int(meta.get("teams") or 10)
         except Exception:
@@ -462,6 +625,10 @@ def ai_opinion():
 
         return jsonify({"opinion": opinion, "usedTendencies": tendencies})
 
+    except coach_pool.CoachSuperseded:
+        return jsonify({"error": "superseded by a newer pick", "superseded": True}), 409
+    except coach_pool.CoachTimeout as e:
+        return jsonify({"error": str(e), "timedOut": True}), 504
     except Exception as e:
         print("Error in /api/ai/opinion:", e)
         traceback.print_exc()
@@ -532,17 +699,23 @@ def ai_closing():
         output_config = {"format": closing_format}
         if COACH_EFFORT:
             output_config["effort"] = COACH_EFFORT
-        resp = client.messages.create(
-            model=COACH_MODEL, max_tokens=1500, system=system_blocks,
-            output_config=output_config,
-            messages=[{"role": "user",
-                       "content": "My drafted roster (JSON). Give my closing plan to win the league:\n"
-                       + json.dumps(roster)}],
+        resp = COACH.call(
+            lambda: client.messages.create(
+                model=COACH_MODEL, max_tokens=1500, system=system_blocks,
+                output_config=output_config,
+                messages=[{"role": "user",
+                           "content": "My drafted roster (JSON). Give my closing plan to win the league:\n"
+                           + json.dumps(roster)}],
+                timeout=COACH_LONG_DEADLINE,
+            ),
+            deadline=COACH_LONG_DEADLINE,
         )
         if resp.stop_reason == "refusal":
             return jsonify({"error": "Model declined to answer"}), 502
         parsed = json.loads(next(b.text for b in resp.content if b.type == "text"))
         return jsonify({"closing": parsed})
+    except coach_pool.CoachTimeout as e:
+        return jsonify({"error": str(e), "timedOut": True}), 504
     except Exception as e:
         print("Error in /api/ai/closing:", e)
         traceback.print_exc()
@@ -607,7 +780,7 @@ def rankings():
             key = (_norm(h.get("Name")), _norm_team(h.get("Team")))
             headshot_by_name_team[key] = url
 
-    espn_heads = headshots_mod.get_map()   # primary headshot source (see headshots.py)
+    espn_heads = _feed("headshots:espn", headshots_mod.get_map) or _EMPTY   # primary (see headshots.py)
 
     merged = []
     for p in baker_data or []:
@@ -692,33 +865,20 @@ def get_ranked_players_alias():
     return rankings()
 
 
-@app.route("/api/board", methods=["GET"])
-def board():
-    """The calibrated DraftIQ board (models/build_board.py -> board_2026.csv): every
-    player scored in league rules with VORP + DraftIQ value, plus headshots merged in.
-    Shaped for the frontend's normalizePlayer (playerId/name/team/position/points/adp)."""
-    if not os.path.exists(BOARD_PATH):
-        return jsonify([]), 404
-    season = request.args.get("season", "2026REG")
-    with open(BOARD_PATH, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
+# /api/board is the same ~1,400-row payload until one of its inputs changes, and
+# the UI re-fetches it constantly on draft night. Build it once per input version,
+# keep it as JSON + gzip bytes, and answer If-None-Match with a 304.
+_board_payload = {"inputs": None, "etag": None, "raw": b"", "gz": b""}
+_board_payload_lock = threading.Lock()
+# "no data" stand-ins with a fixed identity — a fresh {} / [] per request would never
+# match the memo above while a feed is empty or down.
+_EMPTY = MappingProxyType({})
+_NONE = ()
 
-    # bye weeks by NFL team
-    try:
-        byes = _get_cached(f"byes:{season}", lambda: _fetch_byes(season))
-    except Exception:
-        byes = []
-    bye_by_team = {str(b.get("Team", "")).upper(): b.get("Week") for b in (byes or [])}
 
-    # Headshots: ESPN's public roster feed is the primary source (free, freshest,
-    # ~99% board coverage). SportsData's feed is kept only as a fallback for the
-    # day its Headshots endpoint is actually in the plan — today it returns
-    # "Scrambled" for every URL, which _is_valid_headshot now rejects.
-    espn_heads = headshots_mod.get_map()
-    try:
-        headshots = _get_cached("headshots", _fetch_headshots)
-    except Exception:
-        headshots = []
+def _build_board(rows, byes, espn_heads, headshots, w1):
+    """Rows -> the frontend's board dicts (headshots, byes, week-1 matchup merged in)."""
+    bye_by_team = {str(b.get("Team", "")).upper(): b.get("Week") for b in (byes or [])}
     hs_by_id = {}
     for h in headshots or []:
         pid = str(h.get("PlayerID")) if h.get("PlayerID") is not None else None
@@ -740,8 +900,9 @@ def board():
     w1_dst, w1_k = {}, {}
     try:
         from models import week1_odds
-        w1_dst = week1_odds.dst_ranks(2026, 1)
-        w1_k = week1_odds.k_context(2026, 1)
+        if w1:
+            w1_dst = week1_odds.dst_ranks(2026, 1, blob=w1)
+            w1_k = week1_odds.k_context(2026, 1, blob=w1)
     except Exception as e:
         print(f"/api/board: week-1 odds unavailable ({e})")
 
@@ -788,7 +949,97 @@ def board():
             "w1OppTotal": w1.get("impliedOppTotal") if w1 else None,
             "w1OwnTotal": w1.get("impliedTeamTotal") if w1 else None,
         })
-    return jsonify(out)
+    return out
+
+
+@app.route("/api/board", methods=["GET"])
+def board():
+    """The calibrated DraftIQ board (models/build_board.py -> board_2026.csv): every
+    player scored in league rules with VORP + DraftIQ value, plus headshots merged in.
+    Shaped for the frontend's normalizePlayer (playerId/name/team/position/points/adp).
+    Served pre-serialized (gzip when accepted) with a strong ETag; rebuilt only when the
+    board file, byes, headshots or week-1 lines change."""
+    rows = _load_board_rows()
+    if not rows:
+        return jsonify([]), 404
+    season = request.args.get("season", "2026REG")
+
+    # bye weeks by NFL team
+    try:
+        if season == BOARD_SEASON:
+            byes = _feed(f"byes:{season}", lambda: _get_cached(f"byes:{season}",
+                                                               lambda: _fetch_byes(season)))
+        else:
+            byes = _get_cached(f"byes:{season}", lambda: _fetch_byes(season))
+    except Exception:
+        byes = _NONE
+
+    # Headshots: ESPN's public roster feed is the primary source (free, freshest,
+    # ~99% board coverage). SportsData's feed is kept only as a fallback for the
+    # day its Headshots endpoint is actually in the plan — today it returns
+    # "Scrambled" for every URL, which _is_valid_headshot now rejects.
+    espn_heads = _feed("headshots:espn", headshots_mod.get_map) or _EMPTY
+    try:
+        headshots = _feed("headshots:sportsdata", lambda: _get_cached("headshots", _fetch_headshots))
+    except Exception:
+        headshots = _NONE
+    try:
+        # feeds off: through the TTL cache, so an unchanged blob keeps its identity
+        # (week1_odds.get re-reads its JSON file into a new dict on every call)
+        w1 = _feed("week1_odds", lambda: _get_cached("week1_odds", _fetch_week1_odds))
+    except Exception as e:
+        print(f"/api/board: week-1 odds unavailable ({e})")
+        w1 = None
+
+    # every input is a snapshot that is replaced, never edited, when it refreshes —
+    # so identity is the version (the entry holds them, so ids can't be reused)
+    inputs = (rows, byes, espn_heads, headshots, w1)
+    with _board_payload_lock:
+        cur = _board_payload
+        if cur["inputs"] is None or any(a is not b for a, b in zip(cur["inputs"], inputs)):
+            raw = app.json.dumps(_build_board(*inputs)).encode("utf-8")
+            cur.update(inputs=inputs, raw=raw, gz=gzip.compress(raw, 6),
+                       etag="board-" + hashlib.sha1(raw).hexdigest()[:20])
+        etag, raw, gz = cur["etag"], cur["raw"], cur["gz"]
+
+    use_gz = "gzip" in (request.headers.get("Accept-Encoding") or "").lower()
+    tag = etag + ("-gz" if use_gz else "")     # strong ETags are per-encoding
+    if request.if_none_match.contains(tag) or request.if_none_match.contains(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(gz if use_gz else raw, mimetype="application/json")
+        if use_gz:
+            resp.headers["Content-Encoding"] = "gzip"
+    resp.set_etag(tag)
+    resp.headers["Vary"] = "Accept-Encoding"
+    resp.headers["Cache-Control"] = "no-cache"       # always revalidate; 304 is ~free
+    return resp
+
+
+@app.route("/api/board/pick-odds", methods=["GET"])
+def board_pick_odds():
+    """The board's survival + VONA at any pick, for any seat: ?pick=N&seat=S (seat
+    defaults to whoever is on the clock). Arrays are aligned with /api/board's rows.
+    Read from the per-pick tables build_board persists (models/pick_tables.py) —
+    two index reads, no re-ranking."""
+    from models import pick_tables
+    board = board_store.get(BOARD_PATH)
+    if not len(board):
+        return jsonify({"error": "board not built"}), 404
+    tables = pick_tables.get(board)
+    try:
+        pick = int(request.args.get("pick", 1))
+        seat = int(request.args.get("seat") or pick_tables.seat_at(pick, tables.teams))
+    except ValueError:
+        return jsonify({"error": "pick and seat must be integers"}), 400
+    if not (1 <= pick <= tables.rounds * tables.teams and 1 <= seat <= tables.teams):
+        return jsonify({"error": f"pick must be 1-{tables.rounds * tables.teams}, "
+                                 f"seat 1-{tables.teams}"}), 400
+    return jsonify({
+        "pick": pick, "seat": seat, "nextPick": tables.next_pick(pick, seat),
+        "survival": [round(x, 3) for x in tables.survival(pick, seat).tolist()],
+        "vona": [round(x, 2) for x in tables.vona(pick, seat).tolist()],
+    })
 
 
 @app.route("/api/trade", methods=["POST"])
@@ -809,92 +1060,162 @@ def api_trade():
 
 
 def _load_board_rows():
-    """The full DraftIQ board (data/processed/board_2026.csv) as a list of dicts."""
-    rows = []
-    if os.path.exists(BOARD_PATH):
-        with open(BOARD_PATH, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
-    return rows
+    """The full DraftIQ board (data/processed/board_2026.csv) as typed, read-only rows.
+    Parsed once per file version by models/board_store.py — not on every request."""
+    return board_store.rows(BOARD_PATH)
+
+
+@contextlib.contextmanager
+def _draft_session(picks, team_order, teams):
+    """`with _draft_session(...) as sess:` — this room's live DraftSession
+    (models/draft_session.py), caught up to `picks` and held under its .lock for
+    the block. Only picks it hasn't seen are applied."""
+    from models import draft_session
+    sess = draft_session.session_for(board_store.get(BOARD_PATH), team_order, teams)
+    with sess.lock:
+        sess.sync(picks)
+        yield sess
+
+
+def _engine_inputs_version():
+    """(mtime, size) of the files the engines read besides the board — the manager
+    profiles and the alias map — so an edit to either never serves a stale result."""
+    out = []
+    for p in (PROFILES_PATH, os.path.join(os.path.dirname(__file__), "data", "team_aliases.json")):
+        try:
+            st = os.stat(p)
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return out
 
 
-@app.route("/api/ai/best-pick", methods=["POST"])
-def ai_best_pick():
-    """The fused 'Optimal Pick Right Now'. A deterministic need/survival/run-aware shortlist
-    (models.pick_engine, re-scored at the LIVE pick) is handed to Claude, which names THE
-    pick + 2-3 NAMED alternatives + urgency, choosing ONLY from the available shortlist. The
-    deterministic layer owns legality/urgency; the LLM owns which legal player + the prose."""
-    try:
-        from models import pick_engine
+def _state_key(kind, picks, **params):
+    """RESULTS / SPECULATOR key: draft_session.state_key over the live board, the pick
+    log, the query kind + params and the engines' other inputs."""
+    return draft_session.state_key(board_store.get(BOARD_PATH), picks, kind=kind,
+                                   inputs=_engine_inputs_version(), **params)
 
-        body = request.get_json(force=True)
-        my_roster = body.get("myRoster", {}) or {}
-        drafted = body.get("drafted", []) or []
-        picks = body.get("picks", []) or []
-        meta = body.get("meta", {}) or {}
-        overall_pick = int(meta.get("pickNumber") or 1)
-        teams = int(meta.get("teams") or 10)
-        rounds = int(meta.get("rounds") or 16)
-        my_slot = body.get("mySlot")
-        bench = body.get("bench") or []        # your bench players (for positional saturation)
-        team_order = body.get("teamOrder") or []
-        team_rosters = body.get("teamRosters")
-        if not team_rosters and picks:                      # derive per-team rosters from the pick log
-            team_rosters = {}
-            for pk in picks:
-                t = pk.get("team")
-                if t:
-                    team_rosters.setdefault(t, []).append(
-                        {"name": pk.get("name"), "position": pk.get("pos")})
 
-        rows = _load_board_rows()
-        if not rows:
-            return jsonify({"error": "board not built — run python models/build_board.py"}), 503
-        sl = pick_engine.shortlist(rows, set(drafted), my_roster, picks, overall_pick,
-                                   teams=teams, team_order=team_order,
-                                   team_rosters=team_rosters or {}, my_slot=my_slot, rounds=rounds,
-                                   bench=bench, profiles=load_profiles_by_owner(active_only=True),
-                                   alias_map=load_alias_map())
-        shortlist, anchor = sl["shortlist"], sl["anchor"]
-        if not shortlist:
-            return jsonify({"error": "no available players in contention"}), 200
-        names = {c["name"] for c in shortlist}
-        by_name = {c["name"]: c for c in shortlist}
-        umeta = {"nextPick": sl["meta"]["nextPick"], "picksUntilNext": sl["meta"]["picksUntilNext"],
-                 "nextTurnPick": sl["meta"].get("nextTurnPick"),
-                 "backToBack": sl["meta"].get("backToBack"),
-                 "flat": sl["flat"], "round": sl["meta"]["round"]}
+def _wants_stream():
+    """The coach endpoints stream (Server-Sent Events) when asked: ?stream=1 or an
+    Accept: text/event-stream header. Otherwise they answer with one JSON body."""
+    return (request.args.get("stream") in ("1", "true")
+            or "text/event-stream" in (request.headers.get("Accept") or ""))
+
+
+def _event_stream(events):
+    return app.response_class(stream_with_context(events), mimetype="text/event-stream",
+                              headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
-        def _card(name, why):
-            c = by_name.get(name)
-            if not c:
+
+def _coach_stream(params, emit):
+    """COACH.stream worker: client.messages.stream(**params), emit()-ing each text
+    delta. Returns the final Message (same shape messages.create returns), or None
+    once the listener is gone — leaving the `with` closes the model's stream."""
+    with client.messages.stream(**params) as stream:
+        for text in stream.text_stream:
+            if not emit(text):
                 return None
-            return {"name": c["name"], "position": c["position"], "team": c.get("team"),
-                    "adp": c.get("adp"), "tier": c.get("tier"), "vorp": c.get("vorp"),
-                    "proj": c.get("proj"), "fills": c.get("fits"), "confidence": c.get("confidence"),
-                    "urgency": c["urgency"], "oneLineWhy": why or c.get("why")}
+        return stream.get_final_message()
 
-        # ---- no-LLM fallback: deterministic anchor + top alternatives (still fully usable) ----
-        if client is None:
-            wait = next((c for c in shortlist if c["urgency"] == "can-wait"), None)
-            return jsonify({
-                "optimalPick": _card(anchor, None),
-                "alternatives": [_card(c["name"], None) for c in shortlist[1:3]],
-                "waitSignal": (f"You can wait on {wait['name']} — ADP {wait['adp']} is past your next pick."
-                               if wait else ""),
-                "synthesis": ("Value is flat here (everyone ~replacement) — filling your open starter with the "
-                              "best available." if sl["flat"] else "Best value at your biggest need right now."),
-                "confidence": 60, "agreesWithModel": True, "overrideApplied": False,
-                "deterministicAnchor": anchor, "shortlist": shortlist, "urgencyMeta": umeta,
-            })
-
-        # ---- LLM synthesis over the NAMED shortlist ----
-        system_blocks = coach_system_blocks()
-        best_pick_format = {
-            "type": "json_schema",
-            "schema": {
-                "type": "object", "additionalProperties": False,
-                "properties": {
-                    "optimalPick": {
+
+def _best_pick_request(body):
+    """/api/ai/best-pick's inputs, parsed once (the prefetch posts the same body)."""
+    meta = body.get("meta", {}) or {}
+    return {"myRoster": body.get("myRoster", {}) or {},
+            "drafted": body.get("drafted", []) or [],
+            "picks": body.get("picks", []) or [],
+            "pickNumber": int(meta.get("pickNumber") or 1),
+            "teams": int(meta.get("teams") or 10),
+            "rounds": int(meta.get("rounds") or 16),
+            "mySlot": body.get("mySlot"),
+            "bench": body.get("bench") or [],                # your bench players (for positional saturation)
+            "teamOrder": body.get("teamOrder") or [],
+            "teamRosters": body.get("teamRosters")}          # else the session's, from the pick log
+
+
+def _best_pick_key(req):
+    """The draft-state key `req`'s shortlist (and any precomputed answer) lives under."""
+    params = {k: v for k, v in req.items() if k != "picks"}
+    params["drafted"] = sorted(set(params["drafted"]))
+    return _state_key("shortlist", req["picks"], **params)
+
+
+def _best_pick_shortlist(sess, req):
+    """The deterministic shortlist for `req`, on a session synced to its picks."""
+    return sess.shortlist(req["myRoster"], req["pickNumber"], drafted_names=req["drafted"],
+                          team_rosters=req["teamRosters"], my_slot=req["mySlot"],
+                          rounds=req["rounds"], bench=req["bench"],
+                          profiles=load_profiles_by_owner(active_only=True),
+                          alias_map=load_alias_map())
+
+
+def _cached_shortlist(req, key=None):
+    """`req`'s shortlist on the room's live session — from RESULTS when this exact
+    room + request was already asked (panel refreshes, the chat, a re-render)."""
+    def compute():
+        with _draft_session(req["picks"], req["teamOrder"], req["teams"]) as sess:
+            return _best_pick_shortlist(sess, req)
+    return RESULTS.get("shortlist", key or _best_pick_key(req), compute)
+
+
+def _best_pick_umeta(sl):
+    return {"nextPick": sl["meta"]["nextPick"], "picksUntilNext": sl["meta"]["picksUntilNext"],
+            "nextTurnPick": sl["meta"].get("nextTurnPick"),
+            "backToBack": sl["meta"].get("backToBack"),
+            "flat": sl["flat"], "round": sl["meta"]["round"]}
+
+
+def _best_pick_card(sl, name, why):
+    """A shortlist player as a best-pick card (None if `name` isn't on the shortlist)."""
+    c = next((c for c in sl["shortlist"] if c["name"] == name), None)
+    if not c:
+        return None
+    return {"name": c["name"], "position": c["position"], "team": c.get("team"),
+            "adp": c.get("adp"), "tier": c.get("tier"), "vorp": c.get("vorp"),
+            "proj": c.get("proj"), "fills": c.get("fits"), "confidence": c.get("confidence"),
+            "urgency": c["urgency"], "oneLineWhy": why or c.get("why")}
+
+
+def _best_pick_anchor(sl):
+    """The no-LLM card: deterministic anchor + top alternatives (still fully usable).
+    Served without a coach, past the coach deadline, and first on a streamed pick."""
+    shortlist, anchor = sl["shortlist"], sl["anchor"]
+    wait = next((c for c in shortlist if c["urgency"] == "can-wait"), None)
+    return {
+        "optimalPick": _best_pick_card(sl, anchor, None),
+        "alternatives": [_best_pick_card(sl, c["name"], None) for c in shortlist[1:3]],
+        "waitSignal": (f"You can wait on {wait['name']} — ADP {wait['adp']} is past your next pick."
+                       if wait else ""),
+        "synthesis": ("Value is flat here (everyone ~replacement) — filling your open starter with the "
+                      "best available." if sl["flat"] else "Best value at your biggest need right now."),
+        "confidence": 60, "agreesWithModel": True, "overrideApplied": False,
+        "deterministicAnchor": anchor, "shortlist": shortlist, "urgencyMeta": _best_pick_umeta(sl),
+    }
+
+
+def _best_pick_params(req, sl):
+    """messages.create kwargs for the coach's pick over the NAMED shortlist."""
+    shortlist, anchor = sl["shortlist"], sl["anchor"]
+    system_blocks = coach_system_blocks()
+    best_pick_format = {
+        "type": "json_schema",
+        "schema": {
+            "type": "object", "additionalProperties": False,
+            "properties": {
+                "optimalPick": {
+                    "type": "object", "additionalProperties": False,
+                    "properties": {
+                        "name": {"type": "string"}, "position": {"type": "string"},
+                        "urgency": {"type": "string", "enum": ["pick-now", "lean-now", "can-wait"]},
+                        "oneLineWhy": {"type": "string"},
+                    },
+                    "required": ["name", "position", "urgency", "oneLineWhy"],
+                },
+                "alternatives": {
+                    "type": "array",
+                    "items": {
                         "type": "object", "additionalProperties": False,
                         "properties": {
                             "name": {"type": "string"}, "position": {"type": "string"},
@@ -903,112 +1224,261 @@ def ai_best_pick():
                         },
                         "required": ["name", "position", "urgency", "oneLineWhy"],
                     },
-                    "alternatives": {
-                        "type": "array",
-                        "items": {
-                            "type": "object", "additionalProperties": False,
-                            "properties": {
-                                "name": {"type": "string"}, "position": {"type": "string"},
-                                "urgency": {"type": "string", "enum": ["pick-now", "lean-now", "can-wait"]},
-                                "oneLineWhy": {"type": "string"},
-                            },
-                            "required": ["name", "position", "urgency", "oneLineWhy"],
-                        },
-                    },
-                    "waitSignal": {"type": "string"},
-                    "synthesis": {"type": "string"},
-                    "confidence": {"type": "integer"},
                 },
-                "required": ["optimalPick", "alternatives", "waitSignal", "synthesis", "confidence"],
+                "waitSignal": {"type": "string"},
+                "synthesis": {"type": "string"},
+                "confidence": {"type": "integer"},
             },
+            "required": ["optimalPick", "alternatives", "waitSignal", "synthesis", "confidence"],
+        },
+    }
+    user_payload = {
+        "meta": {"pickNumber": req["pickNumber"], "round": sl["meta"]["round"], "teams": req["teams"],
+                 "mySlot": req["mySlot"], "picksUntilNext": sl["meta"]["picksUntilNext"],
+                 "nextPick": sl["meta"]["nextPick"],
+                 "nextTurnPick": sl["meta"].get("nextTurnPick"),
+                 "backToBack": sl["meta"].get("backToBack"), "flat": sl["flat"]},
+        "myOpenStarters": sl["meta"].get("openStarters", []),
+        "anchor": anchor,
+        "whoPicksBeforeMe": [{"team": t["team"], "needs": t["needs"], "tendency": t.get("profile")}
+                             for t in sl["intervening"]],
+        "activeRuns": sl["meta"].get("runs", []),
+        "shortlist": [{k: c.get(k) for k in ("name", "position", "team", "proj", "adp", "vorp",
+                      "tier", "survival", "adjSurvival", "urgency", "fits", "why",
+                      "ecr", "sos")} for c in shortlist],
+    }
+    instruction = (
+        "Note: shortlist[].survival = the probability the player is still available at your "
+        "NEXT TURN (meta.nextTurnPick), NOT the literal next pick. When meta.backToBack is "
+        "true you hold THIS pick and the next one right now — nobody can draft between your "
+        "paired picks, so never claim a player 'won't survive' to the paired pick; urgency is "
+        "entirely about who survives the wait to meta.nextTurnPick. myOpenStarters is the "
+        "AUTHORITATIVE list of your open starting slots — never claim a slot is open or "
+        "filled contrary to it. "
+        "shortlist[].ecr = FantasyPros expert-consensus OVERALL rank (independent of our "
+        "model — a big ecr-vs-our-ranking gap means experts see role/news our projections miss); "
+        "sos = season strength-of-schedule, 1=brutal..5=easy. "
+        "Pick my OPTIMAL player to draft right now. Choose optimalPick.name and EVERY "
+        "alternatives[].name ONLY from shortlist[].name — never invent a player not in the "
+        "shortlist. Default to `anchor` unless a clear shortlist signal (a positional run in "
+        "whoPicksBeforeMe/activeRuns, a tier cliff on an open required starter, or bye stacking) "
+        "justifies overriding it; if you override, explain in synthesis. When meta.flat is true, "
+        "VORP is noise (everyone ~replacement) — decide on ceiling, role/opportunity, tier cliffs "
+        "among startable players, runs, and which shortlist players the intervening managers take "
+        "before nextPick. Give a crisp one-line why for each — every oneLineWhy (including for "
+        "players you would NOT pick yourself) must state the AFFIRMATIVE case: the one factual "
+        "reason to take that player now. Never write a why that argues against its own player; "
+        "your disagreement with the ranking belongs ONLY in synthesis, where it is shown as a "
+        "labeled dissent. Also give a waitSignal naming a player you can safely wait on, and a "
+        "1-2 sentence synthesis. Context JSON:\n" + json.dumps(user_payload)
+    )
+    output_config = {"format": best_pick_format}
+    if COACH_EFFORT:
+        output_config["effort"] = COACH_EFFORT
+    return {"model": COACH_MODEL, "max_tokens": 1024, "system": system_blocks,
+            "output_config": output_config,
+            "messages": [{"role": "user", "content": instruction}],
+            "timeout": COACH_DEADLINE}
+
+
+def _best_pick_finish(sl, resp):
+    """The coach's finished message -> payload. Every LLM-named player is validated
+    against the shortlist (falling back to the anchor); a refusal degrades to it."""
+    shortlist, anchor = sl["shortlist"], sl["anchor"]
+    names = {c["name"] for c in shortlist}
+    umeta = _best_pick_umeta(sl)
+
+    def _card(name, why):
+        return _best_pick_card(sl, name, why)
+
+    if resp.stop_reason == "refusal":   # degrade to the deterministic anchor
+        return {
+            "optimalPick": _card(anchor, None),
+            "alternatives": [_card(c["name"], None) for c in shortlist[1:3]],
+            "waitSignal": "", "synthesis": "", "confidence": 55,
+            "agreesWithModel": True, "overrideApplied": False,
+            "deterministicAnchor": anchor, "shortlist": shortlist, "urgencyMeta": umeta,
         }
-        user_payload = {
-            "meta": {"pickNumber": overall_pick, "round": sl["meta"]["round"], "teams": teams,
-                     "mySlot": my_slot, "picksUntilNext": sl["meta"]["picksUntilNext"],
-                     "nextPick": sl["meta"]["nextPick"],
-                     "nextTurnPick": sl["meta"].get("nextTurnPick"),
-                     "backToBack": sl["meta"].get("backToBack"), "flat": sl["flat"]},
-            "myOpenStarters": sl["meta"].get("openStarters", []),
-            "anchor": anchor,
-            "whoPicksBeforeMe": [{"team": t["team"], "needs": t["needs"], "tendency": t.get("profile")}
-                                 for t in sl["intervening"]],
-            "activeRuns": sl["meta"].get("runs", []),
-            "shortlist": [{k: c.get(k) for k in ("name", "position", "team", "proj", "adp", "vorp",
-                          "tier", "survival", "adjSurvival", "urgency", "fits", "why",
-                          "ecr", "sos")} for c in shortlist],
-        }
-        instruction = (
-            "Note: shortlist[].survival = the probability the player is still available at your "
-            "NEXT TURN (meta.nextTurnPick), NOT the literal next pick. When meta.backToBack is "
-            "true you hold THIS pick and the next one right now — nobody can draft between your "
-            "paired picks, so never claim a player 'won't survive' to the paired pick; urgency is "
-            "entirely about who survives the wait to meta.nextTurnPick. myOpenStarters is the "
-            "AUTHORITATIVE list of your open starting slots — never claim a slot is open or "
-            "filled contrary to it. "
-            "shortlist[].ecr = FantasyPros expert-consensus OVERALL rank (independent of our "
-            "model — a big ecr-vs-our-ranking gap means experts see role/news our projections miss); "
-            "sos = season strength-of-schedule, 1=brutal..5=easy. "
-            "Pick my OPTIMAL player to draft right now. Choose optimalPick.name and EVERY "
-            "alternatives[].name ONLY from shortlist[].name — never invent a player not in the "
-            "shortlist. Default to `anchor` unless a clear shortlist signal (a positional run in "
-            "whoPicksBeforeMe/activeRuns, a tier cliff on an open required starter, or bye stacking) "
-            "justifies overriding it; if you override, explain in synthesis. When meta.flat is true, "
-            "VORP is noise (everyone ~replacement) — decide on ceiling, role/opportunity, tier cliffs "
-            "among startable players, runs, and which shortlist players the intervening managers take "
-            "before nextPick. Give a crisp one-line why for each — every oneLineWhy (including for "
-            "players you would NOT pick yourself) must state the AFFIRMATIVE case: the one factual "
-            "reason to take that player now. Never write a why that argues against its own player; "
-            "your disagreement with the ranking belongs ONLY in synthesis, where it is shown as a "
-            "labeled dissent. Also give a waitSignal naming a player you can safely wait on, and a "
-            "1-2 sentence synthesis. Context JSON:\n" + json.dumps(user_payload)
-        )
-        output_config = {"format": best_pick_format}
-        if COACH_EFFORT:
-            output_config["effort"] = COACH_EFFORT
-        resp = client.messages.create(
-            model=COACH_MODEL, max_tokens=1024, system=system_blocks,
-            output_config=output_config,
-            messages=[{"role": "user", "content": instruction}],
-        )
 
-        if resp.stop_reason == "refusal":   # degrade to the deterministic anchor
-            return jsonify({
-                "optimalPick": _card(anchor, None),
-                "alternatives": [_card(c["name"], None) for c in shortlist[1:3]],
-                "waitSignal": "", "synthesis": "", "confidence": 55,
-                "agreesWithModel": True, "overrideApplied": False,
-                "deterministicAnchor": anchor, "shortlist": shortlist, "urgencyMeta": umeta,
-            })
+    parsed = json.loads(next(b.text for b in resp.content if b.type == "text"))
+    # validate every LLM-named player against the shortlist; fall back to the anchor.
+    opt_name = parsed.get("optimalPick", {}).get("name")
+    override = opt_name not in names
+    if override:
+        opt_name = anchor
+    optimal = _card(opt_name, None if override else parsed["optimalPick"].get("oneLineWhy"))
+    alts = []
+    for a in parsed.get("alternatives", []):
+        nm = a.get("name")
+        if nm in names and nm != opt_name and all(nm != x["name"] for x in alts):
+            alts.append(_card(nm, a.get("oneLineWhy")))
+    for c in shortlist:                 # backfill if the LLM named too few valid alternatives
+        if len(alts) >= 3:
+            break
+        if c["name"] != opt_name and all(c["name"] != x["name"] for x in alts):
+            alts.append(_card(c["name"], c.get("why")))
+    return {
+        "optimalPick": optimal,
+        "alternatives": alts[:3],
+        "waitSignal": parsed.get("waitSignal", ""),
+        "synthesis": parsed.get("synthesis", ""),
+        "confidence": parsed.get("confidence"),
+        "agreesWithModel": (opt_name == anchor),
+        "overrideApplied": override,
+        "deterministicAnchor": anchor,
+        "shortlist": shortlist,
+        "urgencyMeta": umeta,
+    }
 
-        parsed = json.loads(next(b.text for b in resp.content if b.type == "text"))
-        # validate every LLM-named player against the shortlist; fall back to the anchor.
-        opt_name = parsed.get("optimalPick", {}).get("name")
-        override = opt_name not in names
-        if override:
-            opt_name = anchor
-        optimal = _card(opt_name, None if override else parsed["optimalPick"].get("oneLineWhy"))
-        alts = []
-        for a in parsed.get("alternatives", []):
-            nm = a.get("name")
-            if nm in names and nm != opt_name and all(nm != x["name"] for x in alts):
-                alts.append(_card(nm, a.get("oneLineWhy")))
-        for c in shortlist:                 # backfill if the LLM named too few valid alternatives
-            if len(alts) >= 3:
-                break
-            if c["name"] != opt_name and all(c["name"] != x["name"] for x in alts):
-                alts.append(_card(c["name"], c.get("why")))
-        return jsonify({
-            "optimalPick": optimal,
-            "alternatives": alts[:3],
-            "waitSignal": parsed.get("waitSignal", ""),
-            "synthesis": parsed.get("synthesis", ""),
-            "confidence": parsed.get("confidence"),
-            "agreesWithModel": (opt_name == anchor),
-            "overrideApplied": override,
-            "deterministicAnchor": anchor,
-            "shortlist": shortlist,
-            "urgencyMeta": umeta,
-        })
+
+def _best_pick_payload(req, sl, run=None, coach=True):
+    """(payload, status) for a computed shortlist: the coach's pick over it, or the
+    deterministic anchor when there is no coach (or `coach=False`). `run(params)`
+    makes the coach call — COACH.call from a request, so it can time out or be
+    superseded; the default calls straight through (a pre-warm is already on the pool)."""
+    if not sl["shortlist"]:
+        return {"error": "no available players in contention"}, 200
+    if client is None or not coach:
+        return _best_pick_anchor(sl), 200
+    params = _best_pick_params(req, sl)
+    resp = run(params) if run is not None else client.messages.create(**params)
+    return _best_pick_finish(sl, resp), 200
+
+
+@app.route("/api/ai/best-pick", methods=["POST"])
+def ai_best_pick():
+    """The fused 'Optimal Pick Right Now'. A deterministic need/survival/run-aware shortlist
+    (models.pick_engine, re-scored at the LIVE pick) is handed to Claude, which names THE
+    pick + 2-3 NAMED alternatives + urgency, choosing ONLY from the available shortlist. The
+    deterministic layer owns legality/urgency; the LLM owns which legal player + the prose.
+    A room /api/ai/best-pick/prefetch already speculated is served from memory: the
+    coach's answer if it was pre-warmed, else the precomputed shortlist.
+    The coach runs on the COACH pool: past COACH_DEADLINE the card is the deterministic
+    anchor (coachTimedOut), and once a newer pick for this seat arrives this request is
+    dropped with a 409 — the UI has already moved on. ?stream=1 (or Accept:
+    text/event-stream) streams it instead: the anchor card first, then the coach."""
+    try:
+        req = _best_pick_request(request.get_json(force=True))
+        if not _load_board_rows():
+            return jsonify({"error": "board not built — run python models/build_board.py"}), 503
+        key = _best_pick_key(req)
+        channel = ("best-pick", tuple(req["teamOrder"]), req["mySlot"])
+        hit = SPECULATOR.lookup(key)
+        sl = hit["value"] if hit is not None else _cached_shortlist(req, key)
+        if _wants_stream():
+            return _event_stream(_best_pick_events(req, sl, hit, channel, key))
+        try:
+            if hit is not None and hit["warm"] is not None:
+                try:                                       # done, or still in flight — join it
+                    payload, status = COACH.wait(hit["warm"], channel, key)
+                    return jsonify({**payload, "precomputed": "coach"}), status
+                except (coach_pool.CoachTimeout, coach_pool.CoachSuperseded):
+                    raise
+                except Exception:
+                    traceback.print_exc()                  # the pre-warm failed; answer live
+            payload, status = _best_pick_payload(
+                req, sl, run=lambda params: COACH.call(lambda: client.messages.create(**params),
+                                                       channel, key))
+        except coach_pool.CoachSuperseded:
+            return jsonify({"error": "superseded by a newer pick", "superseded": True}), 409
+        except coach_pool.CoachTimeout:
+            payload, status = _best_pick_payload(req, sl, coach=False)
+            payload = {**payload, "coachTimedOut": True}
+        if hit is not None:
+            payload = {**payload, "precomputed": "shortlist"}
+        return jsonify(payload), status
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
+
+
+def _best_pick_events(req, sl, hit, channel, key):
+    """/api/ai/best-pick as Server-Sent Events. `anchor` — the deterministic card —
+    goes out as soon as the shortlist is ready; `delta` {text} follows as the coach's
+    JSON streams in; `final` is the payload the plain endpoint returns, validated
+    against the shortlist once the stream completes (the anchor card again, with
+    coachTimedOut, past the deadline). `superseded` / `error` end the stream early."""
+    tag = {"precomputed": "shortlist"} if hit is not None else {}
+    if not sl["shortlist"]:
+        yield _sse("final", {"error": "no available players in contention"})
+        return
+    anchor = _best_pick_anchor(sl)
+    yield _sse("anchor", {**anchor, **tag})
+    if client is None:
+        yield _sse("final", {**anchor, **tag})
+        return
+    try:
+        if hit is not None and hit["warm"] is not None:
+            try:
+                payload, _ = COACH.wait(hit["warm"], channel, key)
+                yield _sse("final", {**payload, "precomputed": "coach"})
+                return
+            except (coach_pool.CoachTimeout, coach_pool.CoachSuperseded):
+                raise
+            except Exception:
+                traceback.print_exc()
+        params = _best_pick_params(req, sl)
+        resp = None
+        for kind, v in COACH.stream(lambda emit: _coach_stream(params, emit), channel, key):
+            if kind == "chunk":
+                yield _sse("delta", {"text": v})
+            else:
+                resp = v
+        payload = _best_pick_finish(sl, resp)
+    except coach_pool.CoachSuperseded:
+        yield _sse("superseded", {"error": "superseded by a newer pick", "superseded": True})
+        return
+    except coach_pool.CoachTimeout:
+        payload = {**anchor, "coachTimedOut": True}
+    except Exception as e:
+        traceback.print_exc()
+        yield _sse("error", {"error": str(e)})
+        return
+    yield _sse("final", {**payload, **tag})
+
+
+def _speculate_best_pick(req, next_pick, emit, stale):
+    """Speculator job: the likeliest rooms at my next pick, each with the shortlist
+    /api/ai/best-pick would compute there; the likeliest also pre-warms the coach."""
+    from models import opponent_ai
+    with _draft_session(req["picks"], req["teamOrder"], req["teams"]) as sess:
+        base = sess.copy()
+    prof_of = opponent_ai.team_profiles(req["teamOrder"], load_profiles_by_owner(active_only=False),
+                                        load_alias_map())            # spy mode's priors
+    rooms = speculate.likely_states(base, req["pickNumber"], int(req["mySlot"]), req["rounds"],
+                                    prof_of, stale=stale)
+    for k, (prob, room) in enumerate(rooms):
+        if stale():
+            return
+        tail = room.log[len(req["picks"]):]
+        r = {**req, "picks": room.log, "pickNumber": next_pick,
+             "drafted": req["drafted"] + [pk["name"] for pk in tail]}
+        sl = _best_pick_shortlist(room, r)
+        warm = None
+        if k == 0 and client is not None and PREWARM_COACH and prob >= PREWARM_MIN_PROB:
+            warm = (lambda r=r, sl=sl: _best_pick_payload(r, sl))
+        emit(_best_pick_key(r), prob, sl, warm)
+
+
+@app.route("/api/ai/best-pick/prefetch", methods=["POST"])
+def ai_best_pick_prefetch():
+    """SPECULATE (models/speculate.py): the UI posts the best-pick body whenever a pick
+    syncs and it is NOT your turn. The likeliest rooms at your next turn get their
+    shortlist precomputed in the background — and the likeliest its coach call — so
+    /api/ai/best-pick answers from memory when the turn arrives. Returns at once."""
+    try:
+        req = _best_pick_request(request.get_json(force=True))
+        if not _load_board_rows() or req["mySlot"] is None:
+            return jsonify({"queued": False, "nextPick": None}), 200
+        nxt = speculate.next_turn(req["pickNumber"], int(req["mySlot"]), req["teams"], req["rounds"])
+        # rosters the client overrides, or a drafted list that disagrees with the log,
+        # can't be carried forward to the predicted rooms — nothing to speculate
+        if (nxt is None or nxt == req["pickNumber"] or req["teamRosters"] is not None
+                or set(req["drafted"]) != {pk.get("name") for pk in req["picks"]}):
+            return jsonify({"queued": False, "nextPick": nxt}), 200
+        queued = SPECULATOR.run(lambda emit, stale: _speculate_best_pick(req, nxt, emit, stale),
+                                key=_best_pick_key(req))
+        return jsonify({"queued": queued is not None, "nextPick": nxt}), 202
     except Exception as e:
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
@@ -1080,10 +1550,9 @@ def ai_chat():
     'should I take a QB now or wait?') and Claude answers grounded in the LIVE draft
     state: the pick engine's shortlist/anchor/survival at the current pick, the roster,
     recent picks, and the best remaining players by position. Multi-turn: the client
-    sends recent chat history back so follow-ups keep their context."""
+    sends recent chat history back so follow-ups keep their context. ?stream=1 (or
+    Accept: text/event-stream) streams the answer as it's written (_chat_events)."""
     try:
-        from models import pick_engine
-
         body = request.get_json(force=True)
         if client is None:
             return jsonify({"error": "ANTHROPIC_API_KEY not set on the server"}), 503
@@ -1091,166 +1560,193 @@ def ai_chat():
         if not question:
             return jsonify({"error": "empty question"}), 400
 
-        my_roster = body.get("myRoster", {}) or {}
-        drafted = body.get("drafted", []) or []
-        picks = body.get("picks", []) or []
-        meta = body.get("meta", {}) or {}
-        overall_pick = int(meta.get("pickNumber") or 1)
-        teams = int(meta.get("teams") or 10)
-        rounds = int(meta.get("rounds") or 18)
-        my_slot = body.get("mySlot")
-        bench = body.get("bench") or []
-        team_order = body.get("teamOrder") or []
+        params, engine, overall_pick = _chat_prompt(body, question)
+        if _wants_stream():
+            return _event_stream(_chat_events(params, engine, overall_pick))
+        try:
+            resp = COACH.call(lambda: client.messages.create(**params), deadline=COACH_LONG_DEADLINE)
+        except coach_pool.CoachTimeout as e:
+            payload, status = _chat_timeout(engine, overall_pick, e)
+            return jsonify(payload), status
+        return jsonify(_chat_answer(resp, engine, overall_pick))
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
 
-        rows = _load_board_rows()
-        drafted_set = set(drafted)
 
-        # The engine's live view — same machinery the verdict card runs on, so the chat
-        # can explain exactly what the model is doing. Non-fatal if it can't run.
-        engine = {}
-        try:
-            team_rosters = {}
-            for pk in picks:
-                t = pk.get("team")
-                if t:
-                    team_rosters.setdefault(t, []).append(
-                        {"name": pk.get("name"), "position": pk.get("pos")})
-            sl = pick_engine.shortlist(rows, drafted_set, my_roster, picks, overall_pick,
-                                       teams=teams, team_order=team_order,
-                                       team_rosters=team_rosters, my_slot=my_slot,
-                                       rounds=rounds, bench=bench,
-                                       profiles=load_profiles_by_owner(active_only=True),
-                                       alias_map=load_alias_map())
-            engine = {
-                "anchor": sl["anchor"],
-                "flatMode": sl["flat"],
-                "nextPick": sl["meta"]["nextPick"],
-                "picksUntilNext": sl["meta"]["picksUntilNext"],
-                "nextTurnPick": sl["meta"].get("nextTurnPick"),
-                "backToBack": sl["meta"].get("backToBack"),
-                "openStarters": sl["meta"].get("openStarters", []),
-                "activeRuns": sl["meta"].get("runs", []),
-                "whoPicksBeforeMe": [{"team": t["team"], "needs": t["needs"],
-                                      "tendency": t.get("profile")} for t in sl["intervening"]],
-                "shortlist": [{k: c.get(k) for k in ("name", "position", "team", "proj",
-                              "adp", "vorp", "tier", "survival", "urgency", "fits", "why",
-                              "ecr", "sos")} for c in sl["shortlist"]],
-            }
-        except Exception:
-            traceback.print_exc()
+def _chat_prompt(body, question):
+    """(messages.create kwargs, engine view, pick) for a chat question: the live draft
+    state the coach answers from, the bounded history and the instruction."""
+    my_roster = body.get("myRoster", {}) or {}
+    drafted = body.get("drafted", []) or []
+    picks = body.get("picks", []) or []
+    meta = body.get("meta", {}) or {}
+    overall_pick = int(meta.get("pickNumber") or 1)
+    teams = int(meta.get("teams") or 10)
+    rounds = int(meta.get("rounds") or 18)
+    my_slot = body.get("mySlot")
+    bench = body.get("bench") or []
+    team_order = body.get("teamOrder") or []
+
+    board = board_store.get(BOARD_PATH)
+    rows = board.rows
+    names = mentions.get(board)          # name keys, built once per board version
+    drafted_set = set(drafted)
+
+    # The engine's live view — same machinery the verdict card runs on, so the chat
+    # can explain exactly what the model is doing. Non-fatal if it can't run.
+    engine = {}
+    try:
+        sl = _cached_shortlist({**_best_pick_request(body), "rounds": rounds, "teamRosters": None})
+        engine = {
+            "anchor": sl["anchor"],
+            "flatMode": sl["flat"],
+            "nextPick": sl["meta"]["nextPick"],
+            "picksUntilNext": sl["meta"]["picksUntilNext"],
+            "nextTurnPick": sl["meta"].get("nextTurnPick"),
+            "backToBack": sl["meta"].get("backToBack"),
+            "openStarters": sl["meta"].get("openStarters", []),
+            "activeRuns": sl["meta"].get("runs", []),
+            "whoPicksBeforeMe": [{"team": t["team"], "needs": t["needs"],
+                                  "tendency": t.get("profile")} for t in sl["intervening"]],
+            "shortlist": [{k: c.get(k) for k in ("name", "position", "team", "proj",
+                          "adp", "vorp", "tier", "survival", "urgency", "fits", "why",
+                          "ecr", "sos")} for c in sl["shortlist"]],
+        }
+    except Exception:
+        traceback.print_exc()
 
-        # Best remaining by position — lets the chat answer 'who's left at TE?' style
-        # questions beyond the shortlist. norm-matched against the drafted list.
-        from models.scoring import norm_name
-        gone = {norm_name(n) for n in drafted_set}
-        top_avail = {}
-        for r in rows:
-            pos = r.get("pos")
-            if norm_name(r.get("name", "")) in gone:
+    # Best remaining by position — lets the chat answer 'who's left at TE?' style
+    # questions beyond the shortlist. norm-matched against the drafted list.
+    from models.scoring import norm_name
+    gone = {norm_name(n) for n in drafted_set}
+    top_avail = {}
+    for r, key in zip(rows, names.norm):
+        pos = r.get("pos")
+        if key in gone:
+            continue
+        bucket = top_avail.setdefault(pos, [])
+        if len(bucket) < 6:
+            try:
+                bucket.append({"name": r["name"], "team": r.get("team"),
+                               "proj": round(float(r.get("league_pts") or 0)),
+                               "vorp": round(float(r.get("vorp") or 0), 1),
+                               "adp": float(r["adp"]) if r.get("adp") else None,
+                               "fp_adp": float(r["fp_adp"]) if r.get("fp_adp") else None,
+                               "ecr": float(r["ecr"]) if r.get("ecr") else None})
+            except (ValueError, KeyError):
                 continue
-            bucket = top_avail.setdefault(pos, [])
-            if len(bucket) < 6:
+
+    # Any player the user NAMES gets his full board row attached — the
+    # top-6-per-position window missed deep names (KC Concepcion, Jayden
+    # Higgins) and the coach rightly refused to invent numbers for them.
+    qtext = " ".join([question] + [str(m.get("content") or "")
+                                   for m in (body.get("history") or [])])
+    mentioned = []
+    for i in names.find(qtext, limit=10):       # full / suffix-less / 5+ letter surname
+        r = rows[i]
+        row = {"name": board.names[i], "pos": r.get("pos"), "team": r.get("team"),
+               "alreadyDrafted": names.norm[i] in gone}
+        for k in ("league_pts", "vorp", "rank", "adp", "ecr", "fp_adp",
+                  "fp_best", "fp_worst", "fp_std", "fp_up", "fp_bust", "wk25"):
+            v = r.get(k)
+            if v not in (None, ""):
                 try:
-                    bucket.append({"name": r["name"], "team": r.get("team"),
-                                   "proj": round(float(r.get("league_pts") or 0)),
-                                   "vorp": round(float(r.get("vorp") or 0), 1),
-                                   "adp": float(r["adp"]) if r.get("adp") else None,
-                                   "fp_adp": float(r["fp_adp"]) if r.get("fp_adp") else None,
-                                   "ecr": float(r["ecr"]) if r.get("ecr") else None})
-                except (ValueError, KeyError):
-                    continue
-
-        # Any player the user NAMES gets his full board row attached — the
-        # top-6-per-position window missed deep names (KC Concepcion, Jayden
-        # Higgins) and the coach rightly refused to invent numbers for them.
-        import re as _re
-        qtext = " ".join([question] + [str(m.get("content") or "")
-                                       for m in (body.get("history") or [])]).lower()
-        qnorm = " ".join(_re.sub(r"[^a-z0-9 ]", " ", qtext).split())
-        _SUFFIX = {"jr", "sr", "ii", "iii", "iv", "v"}
-        mentioned = []
-        for r in rows:
-            nm = str(r.get("name") or "")
-            toks = _re.sub(r"[^a-z0-9 ]", " ", nm.lower()).split()
-            if not toks:
-                continue
-            full = " ".join(toks)                                   # 'marvin harrison jr'
-            core = [t for t in toks if t not in _SUFFIX] or toks
-            core_full = " ".join(core)                              # 'marvin harrison'
-            last = core[-1]                                         # real surname, not 'jr'
-            if (full in qnorm or core_full in qnorm
-                    or (len(last) >= 5 and _re.search(r"\b" + _re.escape(last) + r"\b", qnorm))):
-                row = {"name": nm, "pos": r.get("pos"), "team": r.get("team"),
-                       "alreadyDrafted": norm_name(nm) in gone}
-                for k in ("league_pts", "vorp", "rank", "adp", "ecr", "fp_adp",
-                          "fp_best", "fp_worst", "fp_std", "fp_up", "fp_bust", "wk25"):
-                    v = r.get(k)
-                    if v not in (None, ""):
-                        try:
-                            row[k] = round(float(v), 1)
-                        except ValueError:
-                            row[k] = v
-                mentioned.append(row)
-            if len(mentioned) >= 10:
-                break
-
-        state = {
-            "meta": {"pickNumber": overall_pick, "round": (overall_pick - 1) // teams + 1,
-                     "teams": teams, "rounds": rounds, "mySlot": my_slot},
-            "myRoster": my_roster, "myBench": bench,
-            "recentPicks": picks[-12:],
-            "engine": engine,
-            "bestAvailableByPosition": top_avail,
-            "mentionedPlayers": mentioned,
-        }
+                    row[k] = round(float(v), 1)
+                except ValueError:
+                    row[k] = v
+        mentioned.append(row)
+
+    state = {
+        "meta": {"pickNumber": overall_pick, "round": (overall_pick - 1) // teams + 1,
+                 "teams": teams, "rounds": rounds, "mySlot": my_slot},
+        "myRoster": my_roster, "myBench": bench,
+        "recentPicks": picks[-12:],
+        "engine": engine,
+        "bestAvailableByPosition": top_avail,
+        "mentionedPlayers": mentioned,
+    }
 
-        # Bounded multi-turn history from the client (keeps follow-ups coherent).
-        history = []
-        for m in (body.get("history") or [])[-10:]:
-            role, content = m.get("role"), (m.get("content") or "").strip()
-            if role in ("user", "assistant") and content:
-                history.append({"role": role, "content": content})
-        while history and history[0]["role"] != "user":
-            history.pop(0)
-
-        instruction = (
-            "You are answering a free-form question from the user MID-DRAFT. Ground every claim "
-            "in the DRAFT STATE JSON below — cite the actual numbers (VORP, survival %, ADP/market, "
-            "tier, projections) that drive your answer, and never invent players or stats not in "
-            "the data. `engine` is the DraftIQ pick engine's live view: `anchor` is the model's "
-            "current #1, `shortlist[].survival` is each player's probability of still being "
-            "available at the user's NEXT TURN (engine.nextTurnPick — NOT the literal next pick: "
-            "when engine.backToBack is true the user holds this pick AND the next one right now, "
-            "so nobody can take a player between them; never say a player is 'gone by' a paired "
-            "pick — urgency is only about surviving the wait to nextTurnPick), and `flatMode` "
-            "means VORP is currently noise. `engine.openStarters` is the authoritative list of "
-            "open starting slots — never contradict it. "
-            "If the question is about why the model/coach recommends something, explain using "
-            "those fields. `mentionedPlayers` carries the full board row (our rank/vorp + market "
-            "fp_adp/ecr + expert spread fp_best/fp_std when available) for every player named in "
-            "the conversation — use it so you never have to say a named player isn't in the data. "
-            "Answer in plain prose (no headers, no markdown tables), <=160 words "
-            "unless the question genuinely needs more, and end with a clear recommendation when "
-            "one is asked for.\n\nDRAFT STATE JSON:\n" + json.dumps(state)
-            + "\n\nQUESTION: " + question
-        )
-        kwargs = {}
-        if COACH_EFFORT:
-            kwargs["output_config"] = {"effort": COACH_EFFORT}
-        resp = client.messages.create(
-            model=COACH_MODEL, max_tokens=1024, system=coach_system_blocks(),
-            messages=history + [{"role": "user", "content": instruction}], **kwargs,
-        )
-        if resp.stop_reason == "refusal":
-            return jsonify({"answer": "Coach declined that one — try rephrasing.",
-                            "refused": True})
-        answer = "".join(b.text for b in resp.content if b.type == "text").strip()
-        return jsonify({"answer": answer,
-                        "anchor": engine.get("anchor"),
-                        "pick": overall_pick})
+    # Bounded multi-turn history from the client (keeps follow-ups coherent).
+    history = []
+    for m in (body.get("history") or [])[-10:]:
+        role, content = m.get("role"), (m.get("content") or "").strip()
+        if role in ("user", "assistant") and content:
+            history.append({"role": role, "content": content})
+    while history and history[0]["role"] != "user":
+        history.pop(0)
+
+    instruction = (
+        "You are answering a free-form question from the user MID-DRAFT. Ground every claim "
+        "in the DRAFT STATE JSON below — cite the actual numbers (VORP, survival %, ADP/market, "
+        "tier, projections) that drive your answer, and never invent players or stats not in "
+        "the data. `engine` is the DraftIQ pick engine's live view: `anchor` is the model's "
+        "current #1, `shortlist[].survival` is each player's probability of still being "
+        "available at the user's NEXT TURN (engine.nextTurnPick — NOT the literal next pick: "
+        "when engine.backToBack is true the user holds this pick AND the next one right now, "
+        "so nobody can take a player between them; never say a player is 'gone by' a paired "
+        "pick — urgency is only about surviving the wait to nextTurnPick), and `flatMode` "
+        "means VORP is currently noise. `engine.openStarters` is the authoritative list of "
+        "open starting slots — never contradict it. "
+        "If the question is about why the model/coach recommends something, explain using "
+        "those fields. `mentionedPlayers` carries the full board row (our rank/vorp + market "
+        "fp_adp/ecr + expert spread fp_best/fp_std when available) for every player named in "
+        "the conversation — use it so you never have to say a named player isn't in the data. "
+        "Answer in plain prose (no headers, no markdown tables), <=160 words "
+        "unless the question genuinely needs more, and end with a clear recommendation when "
+        "one is asked for.\n\nDRAFT STATE JSON:\n" + json.dumps(state)
+        + "\n\nQUESTION: " + question
+    )
+    kwargs = {}
+    if COACH_EFFORT:
+        kwargs["output_config"] = {"effort": COACH_EFFORT}
+    params = {"model": COACH_MODEL, "max_tokens": 1024, "system": coach_system_blocks(),
+              "messages": history + [{"role": "user", "content": instruction}],
+              "timeout": COACH_LONG_DEADLINE, **kwargs}
+    return params, engine, overall_pick
+
+
+def _chat_timeout(engine, overall_pick, err):
+    """(payload, status) when the coach misses the chat deadline: the engine's anchor."""
+    if not engine.get("anchor"):
+        return {"error": str(err), "timedOut": True}, 504
+    return {"answer": (f"The coach is taking too long to answer — ask again in a "
+                       f"moment. The pick engine's #1 here is {engine['anchor']}."),
+            "anchor": engine["anchor"], "pick": overall_pick, "timedOut": True}, 200
+
+
+def _chat_answer(resp, engine, overall_pick):
+    if resp.stop_reason == "refusal":
+        return {"answer": "Coach declined that one — try rephrasing.", "refused": True}
+    answer = "".join(b.text for b in resp.content if b.type == "text").strip()
+    return {"answer": answer, "anchor": engine.get("anchor"), "pick": overall_pick}
+
+
+def _chat_events(params, engine, overall_pick):
+    """/api/ai/chat as Server-Sent Events: `engine` (the pick engine's live view and
+    anchor, ready before the coach starts), `delta` {text} as the answer streams,
+    then `done` — the body the plain endpoint returns. `error` ends it early."""
+    yield _sse("engine", {"anchor": engine.get("anchor"), "pick": overall_pick, "engine": engine})
+    try:
+        resp = None
+        for kind, v in COACH.stream(lambda emit: _coach_stream(params, emit),
+                                    deadline=COACH_LONG_DEADLINE):
+            if kind == "chunk":
+                yield _sse("delta", {"text": v})
+            else:
+                resp = v
+        payload = _chat_answer(resp, engine, overall_pick)
+    except coach_pool.CoachTimeout as e:
+        payload, status = _chat_timeout(engine, overall_pick, e)
+        if status != 200:
+            yield _sse("error", payload)
+            return
     except Exception as e:
         traceback.print_exc()
-        return jsonify({"error": str(e)}), 500
+        yield _sse("error", {"error": str(e)})
+        return
+    yield _sse("done", payload)
+
 
 # ---------------------------
 # Overnight features — GHOST DRAFT / TITLE ODDS / SPY / WHEEL PLAN
@@ -1269,24 +1765,56 @@ def _sim_ctx(body):
     }
 
 
+def _sims_arg(body):
+    """A fixed `sims` count from the body: None when not asked for, else an int >= 1
+    (the endpoints cap it at season_sim.MAX_SIMS). Raises ValueError otherwise."""
+    raw = body.get("sims")
+    if raw is None or raw == "":
+        return None
+    try:
+        sims = int(raw)
+    except (TypeError, ValueError):
+        sims = 0
+    if isinstance(raw, bool) or sims < 1:
+        raise ValueError(f"sims must be a whole number >= 1, got {raw!r}")
+    return sims
+
+
+def _positive_arg(body, key):
+    """A tuning number (`targetSE`, `budgetMs`) from the body: None when not given,
+    else a float > 0. Raises ValueError otherwise."""
+    raw = body.get(key)
+    if raw is None or raw == "":
+        return None
+    try:
+        val = float(raw)
+    except (TypeError, ValueError):
+        val = 0.0
+    if isinstance(raw, bool) or not val > 0 or val == float("inf"):
+        raise ValueError(f"{key} must be a number > 0, got {raw!r}")
+    return val
+
+
 @app.route("/api/sim/opponents", methods=["POST"])
 def sim_opponents():
     """GHOST DRAFT: play every opponent pick forward (manager priors + ADP noise +
     roster need) until the user's seat is back on the clock, or to the end."""
     try:
-        from models import opponent_ai
         body = request.get_json(force=True)
         c = _sim_ctx(body)
-        rows = _load_board_rows()
-        if not rows:
+        if not _load_board_rows():
             return jsonify({"error": "board not built"}), 503
-        res = opponent_ai.simulate(
-            rows, c["picks"], c["team_order"], c["overall"], c["my_slot"] or 0,
-            teams=c["teams"], rounds=c["rounds"],
-            profiles=load_profiles_by_owner(active_only=True), alias_map=load_alias_map(),
-            seed=body.get("seed"),
-            stop_at_my_pick=(body.get("mode") != "toEnd"))
-        return jsonify(res)
+        seed, to_end = body.get("seed"), body.get("mode") == "toEnd"
+
+        def compute():                  # seeded (default: by pick) — a pure function of the room
+            with _draft_session(c["picks"], c["team_order"], c["teams"]) as sess:
+                return sess.ghost(
+                    c["overall"], c["my_slot"] or 0, rounds=c["rounds"],
+                    profiles=load_profiles_by_owner(active_only=True), alias_map=load_alias_map(),
+                    seed=seed, stop_at_my_pick=not to_end)
+        key = _state_key("ghost", c["picks"], **{k: v for k, v in c.items() if k != "picks"},
+                         seed=seed, toEnd=to_end)
+        return jsonify(RESULTS.get("ghost", key, compute))
     except Exception as e:
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
@@ -1295,33 +1823,86 @@ def sim_opponents():
 @app.route("/api/odds", methods=["POST"])
 def api_odds():
     """TITLE ODDS: Monte Carlo the season (league-calibrated weekly variance,
-    real 2026 playoff format) from the current rosters + remaining board."""
+    real 2026 playoff format) from the current rosters + remaining board. Sims
+    until the odds are within `targetSE` (or `budgetMs` is spent) unless a fixed
+    `sims` is asked for; each probability comes with its 95% interval."""
     try:
-        from models import season_sim
-        from models.pick_engine import normalize_pos
+        from models import draft_session, season_sim
         body = request.get_json(force=True)
         team_rosters = body.get("teamRosters", {}) or {}
         drafted = {str(n) for n in (body.get("drafted") or [])}
-        rows = _load_board_rows()
-        if not rows:
+        try:
+            sims = _sims_arg(body)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        board = board_store.get(BOARD_PATH)
+        if not board.rows:
             return jsonify({"error": "board not built"}), 503
-        by_key, by_name = {}, {}
-        for r in rows:
-            try:
-                pts = float(r.get("league_pts") or 0)
-            except (TypeError, ValueError):
-                pts = 0.0
-            pos = normalize_pos(r.get("pos"))
-            by_key.setdefault((r["name"], pos), pts)
-            by_name.setdefault(r["name"], pts)
-
-        def lookup(name, pos):
-            return by_key.get((name, pos)) or by_name.get(name) or 0.0
-
-        avail = [r for r in rows if r["name"] not in drafted]
-        odds = season_sim.title_odds(team_rosters, avail, lookup,
-                                     n_sims=int(body.get("sims") or 1000))
-        return jsonify({"odds": odds, "weeklySd": round(season_sim.weekly_sd(), 1)})
+
+        def compute():
+            avail = [r for r in board.rows if r["name"] not in drafted]
+            lookup = draft_session.pts_lookup(board)
+            if sims:                        # fixed count, the old contract
+                odds = season_sim.title_odds(team_rosters, avail, lookup,
+                                             n_sims=min(sims, season_sim.MAX_SIMS))
+            else:                           # adaptive: until `focus` teams (default all) are tight
+                odds = season_sim.title_odds(
+                    team_rosters, avail, lookup, n_sims=season_sim.FIRST_BATCH,
+                    target_se=float(body.get("targetSE") or season_sim.LIVE_SE),
+                    budget_ms=float(body.get("budgetMs") or season_sim.LIVE_BUDGET_MS),
+                    focus=body.get("focus") or None)
+            ran = next(iter(odds.values()))["sims"] if odds else 0
+            return {"odds": odds, "weeklySd": round(season_sim.weekly_sd(), 1), "sims": ran}
+        # seeded sims: the same rosters + board give the same odds (an adaptive run's
+        # count can vary with its time budget; the first answer stands for the room)
+        key = _state_key("odds", [], teamRosters=team_rosters, drafted=sorted(drafted), sims=sims,
+                         **{k: body.get(k) for k in ("targetSE", "budgetMs", "focus")})
+        return jsonify(RESULTS.get("odds", key, compute))
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/odds/compare", methods=["POST"])
+def api_odds_compare():
+    """PICK vs PICK: title-odds deltas for adding each of `candidates` ([{name,
+    position}], e.g. the shortlist) to `myTeam`'s current roster, all scored on one
+    shared set of simulated seasons (season_sim.compare) — paired deltas with
+    standard errors, in one call instead of one /api/odds per candidate."""
+    try:
+        from models import draft_session, season_sim
+        body = request.get_json(force=True) or {}
+        team_rosters = body.get("teamRosters", {}) or {}
+        me = body.get("myTeam")
+        cands = (body.get("candidates") or [])[:COMPARE_MAX_CANDIDATES]
+        if me not in team_rosters or not cands:
+            return jsonify({"error": "myTeam must be one of teamRosters, with candidates"}), 400
+        try:
+            sims = _sims_arg(body)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        drafted = {str(n) for n in (body.get("drafted") or [])}
+        board = board_store.get(BOARD_PATH)
+        if not board.rows:
+            return jsonify({"error": "board not built"}), 503
+
+        def compute():
+            avail = [r for r in board.rows if r["name"] not in drafted]
+            mine = team_rosters[me] or []
+            res = season_sim.compare(
+                team_rosters, me, [mine] + [mine + [{"name": c.get("name"),
+                                                     "position": c.get("position") or c.get("pos")}]
+                                            for c in cands],
+                avail, draft_session.pts_lookup(board),
+                n_sims=min(sims or season_sim.COMPARE_SIMS, season_sim.MAX_SIMS))
+            base, rest = res["variants"][0], res["variants"][1:]
+            return {"sims": res["sims"], "baseline": base,
+                    "candidates": [{"name": c.get("name"),
+                                    "position": c.get("position") or c.get("pos"), **v}
+                                   for c, v in zip(cands, rest)]}
+        key = _state_key("compare", [], teamRosters=team_rosters, drafted=sorted(drafted),
+                         myTeam=me, candidates=cands, sims=sims)
+        return jsonify(RESULTS.get("compare", key, compute))
     except Exception as e:
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
@@ -1332,28 +1913,31 @@ def api_spy():
     """SPY dossier: one opponent's tendency profile + their model-predicted next
     picks (probabilities from the same engine that drives GHOST DRAFT)."""
     try:
-        from models import opponent_ai
         body = request.get_json(force=True)
         c = _sim_ctx(body)
         target = body.get("team")
-        rows = _load_board_rows()
-        if not rows or not target:
+        if not _load_board_rows() or not target:
             return jsonify({"error": "board not built or no team named"}), 400
-        avail, states, _ = opponent_ai.build_state(rows, c["picks"], c["team_order"], c["teams"])
-        st = states.get(target)
-        if st is None:
-            return jsonify({"error": f"unknown team {target}"}), 400
         owner = load_alias_map().get(target)
         prof = load_profiles_by_owner(active_only=False).get(owner) if owner else None
-        rnd = (c["overall"] - 1) // c["teams"] + 1
-        preds = opponent_ai.predict(st, avail, rnd, c["rounds"], prof, c["picks"], c["teams"])
+
+        def compute():
+            with _draft_session(c["picks"], c["team_order"], c["teams"]) as sess:
+                st = sess.states.get(target)
+                return (sess.spy(target, c["overall"], c["rounds"], prof),
+                        st.open_starters() if st is not None else None)
+        key = _state_key("spy", c["picks"], **{k: v for k, v in c.items() if k != "picks"},
+                         team=target)
+        preds, needs = RESULTS.get("spy", key, compute)
+        if preds is None:
+            return jsonify({"error": f"unknown team {target}"}), 400
         return jsonify({
             "team": target, "owner": owner,
             "profile": ({k: prof.get(k) for k in
                          ("summary", "confidence", "titles", "avg_finish", "drafts",
                           "qb_first_round_avg", "rb_in_first4", "wr_in_first4")}
                         if prof else None),
-            "needs": st.open_starters(),
+            "needs": needs,
             "predictions": preds,
         })
     except Exception as e:
@@ -1364,11 +1948,18 @@ def api_spy():
 @app.route("/api/wheel-plan", methods=["POST"])
 def api_wheel_plan():
     """WHEEL planner: best two-pick pair at the turn + Monte-Carlo survival
-    forecast for the 18-pick wait (models/wheel.py)."""
+    forecast for the 18-pick wait (models/wheel.py). Room sims run until survival
+    odds are within `targetSE` (or `budgetMs` is spent); a fixed `sims` overrides
+    (large counts run on a process pool)."""
     try:
         from models import wheel
         body = request.get_json(force=True)
         c = _sim_ctx(body)
+        try:
+            sims = _sims_arg(body)
+            target_se, budget_ms = _positive_arg(body, "targetSE"), _positive_arg(body, "budgetMs")
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         rows = _load_board_rows()
         if not rows:
             return jsonify({"error": "board not built"}), 503
@@ -1378,7 +1969,8 @@ def api_wheel_plan():
                          team_rosters=body.get("teamRosters"), my_slot=c["my_slot"],
                          rounds=c["rounds"], bench=body.get("bench") or [],
                          profiles=load_profiles_by_owner(active_only=True),
-                         alias_map=load_alias_map())
+                         alias_map=load_alias_map(), n_sims=sims,
+                         target_se=target_se, budget_ms=budget_ms)
         return jsonify(res)
     except Exception as e:
         traceback.print_exc()
@@ -1393,18 +1985,81 @@ def espn_draft():
     try:
         from models import espn_sync
         year = int(request.args.get("year", 2026))
-        rows = _load_board_rows()
-        return jsonify(espn_sync.get_draft(rows, year))
+        if year == 2026 and FEEDS.started:
+            FEEDS.value("espn:2026")            # a read keeps the background poll awake
+            snap = espn_sync.WATCH.snapshot()
+            if snap is None:                     # background poll hasn't connected (yet)
+                return jsonify({"connected": False, "error": _espn_error()}), 502
+            return jsonify(snap)
+        return jsonify(espn_sync.get_draft(_load_board_rows(), year))
     except Exception as e:
         traceback.print_exc()
         return jsonify({"connected": False, "error": str(e)}), 502
 
 
+def _espn_error():
+    return FEEDS.status()["espn:2026"]["error"] or "connecting to ESPN…"
+
+
+def _sse(event, data, eid=None):
+    return (f"id: {eid}\n" if eid is not None else "") + f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route("/api/espn/draft/stream", methods=["GET"])
+def espn_draft_stream():
+    """LIVE DRAFT SYNC, pushed (Server-Sent Events). One server-side watcher polls
+    ESPN; this stream sends each new pick once as `event: pick` (id "<epoch>:<overall>").
+    Reconnects resume from Last-Event-ID; `event: reset` means ESPN's draft was
+    edited — drop what you have, the full list follows. `event: status` reports
+    connection state. 503 when background feeds are off (poll /api/espn/draft)."""
+    from models import espn_sync
+    if not FEEDS.started:
+        return jsonify({"error": "background feeds are off — poll /api/espn/draft"}), 503
+    watch = espn_sync.WATCH
+    last = request.headers.get("Last-Event-ID") or request.args.get("lastEventId") or ""
+    try:
+        ep, _, n = last.partition(":")
+        epoch, last_id = int(ep), int(n)
+    except ValueError:
+        epoch, last_id = None, 0
+    if epoch is not None and epoch != watch.epoch:
+        last_id = 0                              # an id from before a rewrite counts for nothing
+
+    def stream(epoch, last_id):
+        yield "retry: 3000\n\n"
+        sent_status = None
+        while True:
+            FEEDS.value("espn:2026")             # an open stream keeps the poll awake
+            picks, now_epoch = watch.wait_since(last_id, epoch, timeout=15)
+            snap_league = watch.league
+            status = {"connected": snap_league is not None,
+                      "league": getattr(getattr(snap_league, "settings", None), "name", None),
+                      "error": None if snap_league is not None else _espn_error()}
+            if status != sent_status:
+                yield _sse("status", status)
+                sent_status = status
+            if epoch is not None and now_epoch != epoch:
+                yield _sse("reset", {"pickCount": len(picks)})
+                # resume from the rewritten list, even when it came back shorter or empty
+                last_id = picks[-1]["overall"] if picks else 0
+            epoch = now_epoch
+            for pk in picks:
+                yield _sse("pick", pk, f"{epoch}:{pk['overall']}")
+                last_id = pk["overall"]
+            if not picks:
+                yield ": keepalive\n\n"
+
+    return _event_stream(stream(epoch, last_id))
+
+
 @app.route("/api/sim/tournament", methods=["POST"])
 def sim_tournament():
     """WAR GAMES: N complete drafts from the CURRENT state (model drives your picks,
     opponent AI drives theirs), each finished season Monte-Carlo'd. Returns your
-    title-odds distribution + which early position sequences actually win."""
+    title-odds distribution + which early position sequences actually win.
+    With {"stream": true} it's Server-Sent Events instead: `event: run` per finished
+    draft (title odds, sequence, your picks) as the pool completes them, then
+    `event: summary` with the full read (`event: error` if it dies midway)."""
     try:
         from models import tournament
         body = request.get_json(force=True) or {}
@@ -1412,16 +2067,31 @@ def sim_tournament():
         rows = _load_board_rows()
         if not rows:
             return jsonify({"error": "board not built"}), 503
-        res = tournament.run(
+        n = max(4, min(int(body.get("n") or 12), tournament.MAX_RUNS))
+        runs = tournament.iter_runs(
             rows, c["picks"], c["team_order"], c["overall"],
-            my_slot=c["my_slot"] or 10, teams=c["teams"], rounds=c["rounds"],
-            n=max(4, min(int(body.get("n") or 12), 24)),
+            my_slot=c["my_slot"] or 10, teams=c["teams"], rounds=c["rounds"], n=n,
             profiles=load_profiles_by_owner(active_only=True), alias_map=load_alias_map())
-        return jsonify(res)
+        if not body.get("stream"):
+            return jsonify(tournament.summarize(list(runs)))
     except Exception as e:
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+    def stream():
+        done = []
+        yield _sse("start", {"n": n})
+        try:
+            for r in runs:
+                done.append(r)
+                yield _sse("run", {**r, "done": len(done), "n": n})
+            yield _sse("summary", tournament.summarize(done))
+        except Exception as e:
+            traceback.print_exc()
+            yield _sse("error", {"error": str(e), "done": len(done)})
+
+    return _event_stream(stream())
+
 
 @app.route("/api/health", methods=["GET"])
 def api_health():
@@ -1434,9 +2104,11 @@ def api_health():
         checks.append({"name": name, "ok": bool(ok), "detail": detail})
 
     try:
-        st = os.stat(BOARD_PATH)
-        age_h = (time.time() - st.st_mtime) / 3600
-        rows = _load_board_rows()
+        bd = board_store.get(BOARD_PATH)
+        if not bd.version[0]:
+            raise FileNotFoundError(BOARD_PATH)
+        age_h = (time.time() - bd.version[0] / 1e9) / 3600
+        rows = bd.rows
         n_dst = sum(1 for r in rows if r.get("pos") == "DST")
         n_idp = sum(1 for r in rows if r.get("pos") == "IDP")
         n_skill = sum(1 for r in rows if r.get("pos") in ("QB", "RB", "WR", "TE"))
@@ -1491,11 +2163,14 @@ def api_health():
         add("OPPONENT INTEL", False, str(e))
     ok = all(c["ok"] for c in checks)
     return jsonify({"ok": ok, "at": datetime.datetime.now().isoformat(timespec="seconds"),
-                    "checks": checks})
+                    "checks": checks, "cache": _cache.stats(), "feeds": FEEDS.status(),
+                    "speculate": SPECULATOR.stats(), "coach": COACH.stats(),
+                    "results": RESULTS.stats()})
 
 
 # ---------------------------
 # Main
 # ---------------------------
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5001, debug=True)
+    # threaded: a request waiting on the coach never holds up the deterministic endpoints
+    app.run(host="0.0.0.0", port=5001, debug=True, threaded=True)
@@ -0,0 +1,221 @@
+"""Coach call executor — LLM calls run OFF the Flask worker, bounded and cancellable.
+
+Why this module exists: /api/ai/opinion, /api/ai/best-pick, /api/ai/chat and
+/api/ai/closing each called client.messages.create on the request thread and sat
+there until the model answered — 10-30s at medium effort. When the pick advanced
+mid-call, the old request kept its worker (and its Anthropic slot) for an answer
+the UI had already thrown away, and enough of those stacked up could starve the
+deterministic endpoints the draft board polls.
+
+Now every coach call is submitted to one small pool and the handler only WAITS:
+
+  * bounded   — at most `workers` calls in flight across the whole app (the
+                speculative pre-warm in models/speculate.py shares the pool);
+                the rest queue, and queue time counts against their deadline.
+  * deadline  — the handler stops waiting after `deadline` seconds and raises
+                CoachTimeout; the endpoint answers with its deterministic
+                fallback (best-pick: the pick engine's anchor) instead.
+  * supersede — a call made for a `channel` (one room's best-pick card, one
+                team's opinion drawer) carries the draft `state` it was asked
+                at. A call on the same channel at a DIFFERENT state wakes every
+                older waiter with CoachSuperseded and cancels their queued work,
+                so a request for a pick that has already gone is dropped at once.
+
+A call that is already running can't be pulled back from the API; it finishes in
+the background (bounded by the SDK timeout the caller passes) and its answer is
+discarded. A STREAMED call can: `stream` hands the worker an emit() that returns
+False once nobody is listening, and the worker closes the model stream there.
+Nothing here touches the network itself.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CoachTimeout(Exception):
+    """The coach didn't answer within the request's deadline."""
+
+
+class CoachSuperseded(Exception):
+    """A newer draft state on the same channel replaced this request."""
+
+
+class _Waiter:
+    __slots__ = ("future", "state", "wake", "superseded", "chunks", "gone")
+
+    def __init__(self, state, chunks=None):
+        self.future, self.state = None, state
+        self.wake = threading.Event()
+        self.superseded = False
+        self.chunks = chunks          # stream(): the worker's emitted chunks, then None
+        self.gone = False             # stream(): the listener has stopped reading
+
+    def attach(self, future):
+        self.future = future
+        future.add_done_callback(lambda f: self.notify())     # runs now if already done
+        return self
+
+    def notify(self):
+        self.wake.set()
+        if self.chunks is not None:
+            self.chunks.put(None)
+
+
+class CoachPool:
+    """The process's coach executor. `call` from request handlers; `submit` for
+    fire-and-forget work (pre-warms) that someone may `wait` on later."""
+
+    def __init__(self, workers=3, deadline=30.0):
+        self.workers = workers
+        self.deadline = deadline
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="coach")
+        self._lock = threading.Lock()
+        self._channels = {}           # channel -> (state, [live _Waiter])
+        self._running = 0
+        self._stats = {"calls": 0, "ok": 0, "errors": 0, "timeouts": 0,
+                       "superseded": 0, "skipped": 0, "waitMsTotal": 0.0, "waitMsMax": 0.0}
+
+    def submit(self, fn):
+        """Queue fn() on the pool; returns its Future (ThreadPoolExecutor-compatible)."""
+        return self._pool.submit(self._guard, fn, None)
+
+    def _guard(self, fn, waiter):
+        if waiter is not None and waiter.superseded:   # dropped while queued: never call out
+            with self._lock:
+                self._stats["skipped"] += 1
+            return None
+        with self._lock:
+            self._running += 1
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def call(self, fn, channel=None, state=None, deadline=None):
+        """fn()'s result, run on the pool. Raises CoachTimeout past `deadline`
+        seconds (default: the pool's), CoachSuperseded if a call on `channel` at
+        another `state` arrives first, or whatever fn raised."""
+        waiter = _Waiter(state)
+        waiter.attach(self._pool.submit(self._guard, fn, waiter))
+        return self._wait(waiter, channel, deadline, own=True)
+
+    def wait(self, future, channel=None, state=None, deadline=None):
+        """Like call(), for a Future that's already running (a speculative pre-warm).
+        The future itself is shared, so it is never cancelled from here."""
+        return self._wait(_Waiter(state).attach(future), channel, deadline, own=False)
+
+    def stream(self, fn, channel=None, state=None, deadline=None):
+        """call() for a streamed answer: fn(emit) runs on the pool, emit(chunk)-ing as
+        it goes, and this generator yields ("chunk", chunk) on the caller's thread for
+        each, then ("result", fn's return value). Same deadline (for the whole call)
+        and supersede rules, raised mid-stream. emit() returns False once the caller
+        has stopped listening — superseded, timed out or disconnected — so fn can
+        close its upstream stream instead of reading it to the end."""
+        waiter = _Waiter(state, queue.Queue())
+
+        def emit(chunk):
+            if waiter.gone or waiter.superseded:
+                return False
+            waiter.chunks.put(("chunk", chunk))
+            return True
+
+        waiter.attach(self._pool.submit(self._guard, lambda: fn(emit), waiter))
+        t0 = time.perf_counter()
+        end = t0 + (self.deadline if deadline is None else deadline)
+        self._join(waiter, channel)
+        try:
+            while True:
+                try:
+                    item = waiter.chunks.get(timeout=max(0.0, end - time.perf_counter()))
+                except queue.Empty:
+                    item = None
+                if waiter.superseded:
+                    waiter.future.cancel()
+                    self._count("superseded", t0)
+                    raise CoachSuperseded(channel)
+                if item is not None:
+                    yield item
+                elif waiter.future.done():
+                    try:
+                        out = waiter.future.result()
+                    except Exception:
+                        self._count("errors", t0)
+                        raise
+                    self._count("ok", t0)
+                    yield "result", out
+                    return
+                elif time.perf_counter() >= end:
+                    waiter.future.cancel()
+                    self._count("timeouts", t0)
+                    raise CoachTimeout(f"no coach answer in {self.deadline if deadline is None else deadline:g}s")
+        finally:
+            waiter.gone = True
+            self._leave(waiter, channel)
+
+    def _join(self, waiter, channel):
+        with self._lock:
+            self._stats["calls"] += 1
+            if channel is not None:
+                cur, live = self._channels.get(channel, (waiter.state, []))
+                if cur != waiter.state:             # the room moved on: drop the older asks
+                    for old in live:
+                        old.superseded = True
+                        old.notify()
+                    live = []
+                live.append(waiter)
+                self._channels[channel] = (waiter.state, live)
+
+    def _leave(self, waiter, channel):
+        if channel is not None:
+            with self._lock:
+                cur, live = self._channels.get(channel, (None, []))
+                if waiter in live:
+                    live.remove(waiter)
+                if not live and cur == waiter.state:
+                    self._channels.pop(channel, None)
+
+    def _wait(self, waiter, channel, deadline, own):
+        t0 = time.perf_counter()
+        self._join(waiter, channel)
+        try:
+            woke = waiter.wake.wait(self.deadline if deadline is None else deadline)
+            if waiter.superseded:
+                if own:
+                    waiter.future.cancel()
+                self._count("superseded", t0)
+                raise CoachSuperseded(channel)
+            if not woke:
+                if own:
+                    waiter.future.cancel()
+                self._count("timeouts", t0)
+                raise CoachTimeout(f"no coach answer in {self.deadline if deadline is None else deadline:g}s")
+            try:
+                out = waiter.future.result()
+            except Exception:
+                self._count("errors", t0)
+                raise
+            self._count("ok", t0)
+            return out
+        finally:
+            self._leave(waiter, channel)
+
+    def _count(self, outcome, t0):
+        ms = (time.perf_counter() - t0) * 1000
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["waitMsTotal"] += ms
+            self._stats["waitMsMax"] = max(self._stats["waitMsMax"], ms)
+
+    def stats(self):
+        """Counters for /api/health: outcomes, running/queued calls, handler wait time."""
+        with self._lock:
+            st = dict(self._stats)
+            st["running"] = self._running
+            st["queued"] = self._pool._work_queue.qsize()
+            st["workers"] = self.workers
+        st["waitMsAvg"] = round(st["waitMsTotal"] / st["calls"], 1) if st["calls"] else None
+        st["waitMsTotal"] = round(st["waitMsTotal"], 1)
+        st["waitMsMax"] = round(st["waitMsMax"], 1)
+        return st
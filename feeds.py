@@ -0,0 +1,129 @@
+"""Background feed refresher — keeps the external feeds warm OFF the request path.
+
+Why this module exists: every outside source the board and odds endpoints lean on
+(SportsData byes + headshots, the 32-team ESPN roster sweep in headshots.py, ESPN
+week-1 lines in models/week1_odds.py, the live espn-api League) used to be
+fetched BY the first request after its cache expired — so on draft night /api/board
+could stall on a 20s SportsData timeout, and /api/espn/draft on ESPN.
+
+Now each source is a Feed with its own cadence and its own daemon thread. The
+thread fetches, then publishes a new Snapshot (value, fetched-at, last error) by
+swapping one reference; request handlers read `value(name)` — no network, no lock.
+Snapshots are never mutated after publication: a refresh replaces, never edits.
+
+  * A failed refresh keeps the previous value (and records the error), so a dead
+    feed degrades to "last good copy", never to "request blocks". The next try
+    comes `retry` seconds later — sooner than a slow feed's cadence, later than
+    a fast poll's, so a dead ESPN isn't hammered (or logged) every 2 seconds.
+  * `seed` runs once at registration — the disk caches headshots.py and
+    week1_odds.py already keep — so the very first request has data too.
+  * `idle_after` parks a feed nobody has read for that long (the 2-second ESPN
+    draft poll shouldn't run all week); the next read wakes it and gets the
+    last snapshot immediately while it refreshes. Such a feed starts parked, so
+    it never polls until its first read.
+
+The API starts the threads on its first request (see api.py), so importing api
+(scripts, the Flask reloader's watcher process) never spawns pollers.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    value: object
+    at: float                 # when fetched; 0.0 = seeded from disk / never fetched
+    error: str = None         # last refresh failure, cleared on success
+
+
+class Feed:
+    def __init__(self, name, fetch, every, seed=None, idle_after=None, retry=60):
+        self.name = name
+        self.fetch = fetch
+        self.every = every
+        self.idle_after = idle_after
+        self.retry = retry
+        self.snapshot = Snapshot(None, 0.0)
+        # an idle-able feed starts parked: nothing polls it until someone first reads it
+        self.last_read = 0.0 if idle_after else time.time()
+        self.refreshes = 0
+        self._wake = threading.Event()
+        self._parked = False
+        if seed is not None:
+            try:
+                self.snapshot = Snapshot(seed(), 0.0)
+            except Exception as e:
+                self.snapshot = Snapshot(None, 0.0, f"seed failed: {e}")
+
+    def read(self):
+        self.last_read = time.time()
+        if self._parked:
+            self._wake.set()
+        return self.snapshot
+
+    def refresh(self):
+        """Fetch now and publish; returns True on success. Never raises."""
+        t0 = time.time()
+        try:
+            value = self.fetch()
+        except Exception as e:
+            old = self.snapshot
+            self.snapshot = Snapshot(old.value, old.at, str(e)[:200])
+            print(f"feeds: {self.name} refresh failed ({e}) — keeping last copy")
+            return False
+        self.snapshot = Snapshot(value, t0)
+        self.refreshes += 1
+        return True
+
+    def _loop(self):
+        while True:
+            if self.idle_after and time.time() - self.last_read > self.idle_after:
+                self._parked = True
+                if time.time() - self.last_read > self.idle_after:   # a read may have raced the flag
+                    self._wake.wait()
+                self._parked = False
+            self._wake.clear()
+            ok = self.refresh()
+            self._wake.wait(self.every if ok else self.retry)
+
+
+class Refresher:
+    """The process's set of feeds. `add` at import time, `start` once."""
+
+    def __init__(self):
+        self._feeds = {}
+        self._lock = threading.Lock()
+        self.started = False
+
+    def add(self, name, fetch, every, seed=None, idle_after=None, retry=60):
+        self._feeds[name] = Feed(name, fetch, every, seed, idle_after, retry)
+
+    def __contains__(self, name):
+        return name in self._feeds
+
+    def value(self, name, default=None):
+        """Latest published value (or `default` if never fetched). No I/O."""
+        feed = self._feeds.get(name)
+        if feed is None:
+            return default
+        v = feed.read().value
+        return default if v is None else v
+
+    def start(self):
+        with self._lock:
+            if self.started:
+                return
+            self.started = True
+            for f in self._feeds.values():
+                threading.Thread(target=f._loop, name=f"feed:{f.name}", daemon=True).start()
+
+    def status(self):
+        """{name: {ageSec, error, refreshes, parked}} for /api/health."""
+        now = time.time()
+        out = {}
+        for f in self._feeds.values():
+            s = f.snapshot
+            out[f.name] = {"ageSec": round(now - s.at) if s.at else None,
+                           "error": s.error, "refreshes": f.refreshes, "parked": f._parked}
+        return out
@@ -144,6 +144,17 @@ def get_map(force=False):
     return _mem["players"]
 
 
+def peek_map():
+    """Whatever is already cached (memory, else disk) — never touches the network.
+    Seeds the API's background refresher (feeds.py) so the first board has faces."""
+    if _mem["players"]:
+        return _mem["players"]
+    disk = _load_disk()
+    if disk:
+        _mem.update(disk)
+    return _mem["players"]
+
+
 def resolve(name, team=None, pos=None, players=None):
     """Best headshot URL for a board row (D/ST -> team logo). None if unknown."""
     p = (pos or "").upper().replace("/", "").replace(".", "")
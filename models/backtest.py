@@ -11,16 +11,15 @@ Run: python models/backtest.py
 """
 from __future__ import annotations
 
-import glob
 import json
-import os
 from pathlib import Path
 
 import pandas as pd
 from scipy.stats import spearmanr
 
+import espn_store
+
 ROOT = Path(__file__).resolve().parents[1]
-RAW = ROOT / "data" / "raw" / "espn"
 PROC = ROOT / "data" / "processed"
 REPL = json.loads((PROC / "replacement_levels.json").read_text(encoding="utf-8"))["historical"]
 
@@ -40,13 +39,7 @@ def bucket(pos: str) -> str:
 
 def load_picks() -> pd.DataFrame:
     seasons = pd.read_csv(PROC / "player_seasons.csv")[["player_id", "year", "pos", "points"]]
-    frames = []
-    for f in sorted(glob.glob(str(RAW / "*" / "draft.csv"))):
-        year = int(os.path.basename(os.path.dirname(f)))
-        d = pd.read_csv(f)
-        d["year"] = year
-        frames.append(d)
-    picks = pd.concat(frames, ignore_index=True)
+    picks = espn_store.load("draft")
     # join actual season points + backfill position from player_seasons (full coverage)
     picks = picks.merge(seasons, on=["player_id", "year"], how="left", suffixes=("", "_act"))
     picks["pos_b"] = picks["pos"].fillna("").map(bucket)
@@ -74,11 +67,8 @@ def team_season_table(picks: pd.DataFrame) -> pd.DataFrame:
         })
     ts = pd.DataFrame(rows)
     # attach standings
-    st = []
-    for f in sorted(glob.glob(str(RAW / "*" / "standings.csv"))):
-        year = int(os.path.basename(os.path.dirname(f)))
-        s = pd.read_csv(f); s["year"] = year; st.append(s)
-    standings = pd.concat(st, ignore_index=True)
+    standings = espn_store.load("standings", columns=["owner", "final_standing",
+                                                     "reg_season_standing", "wins", "points_for"])
     standings["final_standing"] = standings["final_standing"].fillna(standings["reg_season_standing"])
     return ts.merge(standings[["year", "owner", "final_standing", "wins", "points_for"]],
                     on=["year", "owner"], how="left")
@@ -0,0 +1,205 @@
+"""Process-wide board store — board_2026.csv parsed ONCE, not on every request.
+
+Every draft-night endpoint used to open the CSV and run csv.DictReader over ~1,400
+rows, and then every model float()-parsed the same strings again. Under live sync
+that happens several times per pick, all of it on the critical path.
+
+This module holds one immutable `Board` snapshot per process:
+
+  * rows     — tuple of read-only row views (types.MappingProxyType) with the
+               numeric columns already typed (float / int / None for blanks) and
+               `pos` normalized. Drop-in for the old list-of-dicts board_rows:
+               `.get`, `[...]`, `{**r}` all work; mutation raises.
+  * columns  — the same data column-wise: names, normalized name keys, positions,
+               and read-only float64 NumPy arrays (NaN = blank) for the models
+               that want arrays.
+  * version  — (mtime_ns, size) of the file it was parsed from. A rebuilt board
+               (python models/build_board.py) is picked up on the next `get()`.
+
+Pure / no network. Run `python models/board_store.py` for a self-test.
+"""
+from __future__ import annotations
+
+import csv
+import threading
+import types
+from pathlib import Path
+
+import numpy as np
+
+try:  # works both as `python models/board_store.py` and `from models import board_store`
+    from value_engine import normalize_pos
+except ImportError:  # pragma: no cover
+    from models.value_engine import normalize_pos
+
+ROOT = Path(__file__).resolve().parents[1]
+BOARD_PATH = ROOT / "data" / "processed" / "board_2026.csv"
+
+INT_COLS = ("rank", "pos_rank")
+FLOAT_COLS = ("league_pts", "vorp", "draft_value", "adp", "sd_pts", "fp_pts", "ecr",
+              "ecr_tier", "sos", "fp_adp", "fp_best", "fp_worst", "fp_std", "fp_up",
+              "fp_bust", "wk25")
+
+
+def norm_key(s) -> str:
+    """Lowercase alphanumerics only — the pick engine's drafted-name match key."""
+    return "".join(ch for ch in str(s or "").lower() if ch.isalnum())
+
+
+def _num(v, cast=float):
+    if v is None or v == "":
+        return None
+    try:
+        return cast(float(v))
+    except (TypeError, ValueError):
+        return None
+
+
+class Board:
+    """One parsed, immutable board snapshot. Never mutate anything it hands out."""
+
+    def __init__(self, raw_rows: list[dict], version: tuple = (0, 0), path: Path | None = None):
+        self.path = path
+        self.version = version
+        rows = []
+        for r in raw_rows:
+            row = dict(r)
+            for k in INT_COLS:
+                if k in row:
+                    row[k] = _num(row[k], int)
+            for k in FLOAT_COLS:
+                if k in row:
+                    row[k] = _num(row[k])
+            row["pos"] = normalize_pos(row.get("pos") or row.get("position"))
+            rows.append(types.MappingProxyType(row))
+        self.rows: tuple = tuple(rows)
+        self.names: tuple[str, ...] = tuple(str(r.get("name") or "") for r in rows)
+        self.keys: tuple[str, ...] = tuple(norm_key(n) for n in self.names)
+        self.pos: tuple[str, ...] = tuple(r["pos"] for r in rows)
+        self._cols: dict[str, np.ndarray] = {}
+        self._derived: dict = {}
+        self._by_key: dict[str, list[int]] | None = None
+        self._by_name: dict[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def indices_of(self, key: str) -> list[int]:
+        """Row indices whose normalized name key (`norm_key`) matches."""
+        if self._by_key is None:
+            by_key: dict[str, list[int]] = {}
+            for i, k in enumerate(self.keys):
+                by_key.setdefault(k, []).append(i)
+            self._by_key = by_key
+        return self._by_key.get(key, [])
+
+    def indices_named(self, name: str) -> list[int]:
+        """Row indices whose name matches exactly (the opponent model's match)."""
+        if self._by_name is None:
+            by_name: dict[str, list[int]] = {}
+            for i, n in enumerate(self.names):
+                by_name.setdefault(n, []).append(i)
+            self._by_name = by_name
+        return self._by_name.get(name, [])
+
+    def cached(self, name: str, build):
+        """Per-snapshot memo for anything a model derives from the board alone
+        (sort keys, typed arrays). `build(board)` runs once per board version."""
+        if name not in self._derived:
+            self._derived[name] = build(self)
+        return self._derived[name]
+
+    def col(self, name: str) -> np.ndarray:
+        """Read-only float64 column (NaN where blank). Built lazily, then shared."""
+        arr = self._cols.get(name)
+        if arr is None:
+            arr = np.array([np.nan if (v := _num(r.get(name))) is None else v
+                            for r in self.rows], dtype=float)
+            arr.setflags(write=False)
+            self._cols[name] = arr
+        return arr
+
+    @property
+    def etag(self) -> str:
+        return f"{self.version[0]:x}-{self.version[1]:x}"
+
+
+_lock = threading.Lock()
+_current: dict[Path, Board] = {}
+_adopted: dict[int, Board] = {}
+
+
+def _stat_version(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get(path: Path | str | None = None) -> Board:
+    """The current board. Re-parsed only when the file's mtime/size changes; a
+    missing file yields an empty Board (callers already treat no rows as 'not built')."""
+    path = Path(path) if path else BOARD_PATH
+    ver = _stat_version(path)
+    cur = _current.get(path)
+    if cur is not None and cur.version == ver:
+        return cur
+    with _lock:
+        cur = _current.get(path)
+        if cur is not None and cur.version == ver:
+            return cur
+        if ver is None:
+            board = Board([], (0, 0), path)
+        else:
+            with open(path, newline="", encoding="utf-8") as f:
+                board = Board(list(csv.DictReader(f)), ver, path)
+        _current[path] = board
+        return board
+
+
+def rows(path: Path | str | None = None) -> tuple:
+    """Shorthand for get().rows — the drop-in replacement for csv.DictReader(board)."""
+    return get(path).rows
+
+
+def board_for(board_rows) -> Board:
+    """The stored snapshot `board_rows` came from, or a one-off Board parsed from
+    them (self-tests and callers that still pass csv.DictReader lists)."""
+    for b in list(_current.values()) + list(_adopted.values()):
+        if b.rows is board_rows:
+            return b
+    board = Board(list(board_rows))
+    if isinstance(board_rows, tuple) and board_rows and isinstance(board_rows[0], types.MappingProxyType):
+        # another snapshot's read-only rows (this module imported under its other name,
+        # models.board_store vs board_store) can't change under us — keep the parse
+        board.rows = board_rows
+        if len(_adopted) >= 4:
+            _adopted.pop(next(iter(_adopted)))
+        _adopted[id(board_rows)] = board
+    return board
+
+
+if __name__ == "__main__":     # python models/board_store.py — self-test
+    import time
+
+    t0 = time.perf_counter()
+    b = get()
+    t1 = time.perf_counter()
+    b2 = get()
+    t2 = time.perf_counter()
+    print(f"parsed {len(b)} rows in {(t1 - t0) * 1000:.1f}ms; cached get() {(t2 - t1) * 1e6:.0f}us")
+    assert b is b2, "unchanged file must return the same snapshot"
+    r = b.rows[0]
+    print(f"  row 0: {r['name']} {r['pos']} league_pts={r['league_pts']!r} rank={r['rank']!r}")
+    assert isinstance(r["league_pts"], float) and isinstance(r["rank"], int)
+    try:
+        r["name"] = "x"            # type: ignore[index]
+        raise SystemExit("rows must be read-only")
+    except TypeError:
+        pass
+    pts = b.col("league_pts")
+    assert not pts.flags.writeable and len(pts) == len(b)
+    print(f"  league_pts column: mean {np.nanmean(pts):.1f}, blanks in adp: "
+          f"{int(np.isnan(b.col('adp')).sum())}")
+    print("SELF-TEST PASSED")
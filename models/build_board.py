@@ -2,7 +2,8 @@
 
 Pipeline: SportsData projections -> score in THIS league's rules (models.scoring)
 -> value engine with the 2026 structure (models.value_engine) -> ranked board.
-Writes data/processed/board_2026.csv (the cheat sheet) and is reused by api.py.
+Writes data/processed/board_2026.csv (the cheat sheet) and is reused by api.py,
+plus the per-pick survival / next-available tables beside it (models/pick_tables.py).
 
 Run: python models/build_board.py
 """
@@ -18,13 +19,15 @@ import requests
 from dotenv import load_dotenv
 
 try:  # works both as `python models/build_board.py` and `from models import build_board`
+    import board_store
     import dst
     import espn_proj
     import fp_blend
+    import pick_tables
     from scoring import load_scoring, score_row
     from value_engine import League, rank_board, STREAM_DISCOUNT
 except ImportError:  # pragma: no cover
-    from models import dst, espn_proj, fp_blend
+    from models import board_store, dst, espn_proj, fp_blend, pick_tables
     from models.scoring import load_scoring, score_row
     from models.value_engine import League, rank_board, STREAM_DISCOUNT
 
@@ -269,6 +272,11 @@ def build(season: str = "2026REG", scoring_year: int = 2026,
         .rename(columns={"points": "league_pts"})
     out.to_csv(path, index=False)
     print(f"board -> {path.relative_to(ROOT)} ({len(out)} players)")
+    # rank_board above only describes pick 1; persist survival / next-available value
+    # for every pick and seat (models/pick_tables.py), keyed to the CSV as readers see it
+    meta = pick_tables.write(board_store.get(path), teams=CFG["2026"]["teams"])
+    print(f"pick tables -> {pick_tables.SURVIVAL_PATH.name}, {pick_tables.NEXT_VALUE_PATH.name} "
+          f"({meta['rounds']} rounds x {meta['teams']} seats)")
     return out
 
 
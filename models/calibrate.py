@@ -12,15 +12,14 @@ Run: python models/calibrate.py
 """
 from __future__ import annotations
 
-import glob
 import json
-import os
 from pathlib import Path
 
 import pandas as pd
 
+import espn_store
+
 ROOT = Path(__file__).resolve().parents[1]
-RAW = ROOT / "data" / "raw" / "espn"
 PROC = ROOT / "data" / "processed"
 PROC.mkdir(parents=True, exist_ok=True)
 CFG = json.loads((ROOT / "data" / "league_config.json").read_text(encoding="utf-8"))
@@ -44,9 +43,10 @@ def bucket(pos: str) -> str:
 
 def build_player_seasons() -> pd.DataFrame:
     frames = []
-    for f in sorted(glob.glob(str(RAW / "*" / "box_players.csv"))):
-        year = int(os.path.basename(os.path.dirname(f)))
-        d = pd.read_csv(f)
+    for year in espn_store.years("box_players"):
+        d = espn_store.load("box_players", years=[year], add_year=False,
+                            columns=["player_id", "player_name", "position", "points",
+                                     "week", "started"])
         d["pos"] = d["position"].map(bucket)
         # one row per player-week -> sum to a league-scored season total
         g = d.groupby("player_id").agg(
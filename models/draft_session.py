@@ -0,0 +1,389 @@
+"""Live draft state, advanced one pick at a time.
+
+Every draft-night endpoint used to rebuild the whole room from the pick log on
+every request: opponent_ai.build_state copied all ~1,400 board rows and replayed
+every pick into fresh TeamStates, the odds endpoint re-derived availability and a
+points lookup, and so on — work that grows with the length of the log, so round 16
+was several times slower than round 1 for exactly the same question.
+
+A DraftSession holds that state and applies each new pick once:
+
+  * availability — two masks over the board, because the models disagree on what
+                   "drafted" means: the pick engine matches normalized names
+                   (board_store.norm_key), the opponent model exact names.
+  * rosters      — one opponent_ai.TeamState per team (slots + bench) and the
+                   per-team {name, position} lists the pick engine reads.
+  * position boards — each position's rows sorted by league_pts with a cursor
+                   that only ever moves forward past drafted players (best_at).
+  * the pick log itself, for run-heat (pick_engine.run_heat reads its last 2 rounds).
+
+apply() is O(rows sharing the drafted name). sync() takes the client's full log
+and applies only the picks the session hasn't seen; if an earlier pick was
+edited or undone it rebuilds from scratch, so the answers are always identical to
+the from-the-log versions.
+
+Queries — shortlist / spy / ghost / odds — are the same engines the endpoints call,
+fed from the live state. Sessions are shared per room via session_for(); hold
+`session.lock` across sync() + query so a stale client can't rewind the state
+under another request. copy() forks the state for hypothetical picks.
+
+state_key() fingerprints a (board, log, query); ResultCache keeps the answers
+under it, so a panel refresh on an unchanged room never recomputes them.
+
+Pure / no network. Run `python models/draft_session.py` for a self-test.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:  # works both as `python models/draft_session.py` and `from models import draft_session`
+    import board_store
+    import opponent_ai as oa
+    import pick_engine
+    import season_sim
+    from pick_engine import normalize_pos, run_heat
+except ImportError:  # pragma: no cover
+    from models import board_store
+    from models import opponent_ai as oa
+    from models import pick_engine
+    from models import season_sim
+    from models.pick_engine import normalize_pos, run_heat
+
+MAX_SESSIONS = 8
+
+
+def _build_pos_boards(board) -> dict[str, np.ndarray]:
+    pts = np.nan_to_num(board.col("league_pts"), nan=0.0)
+    pos = np.array(board.pos, dtype=object)
+    out = {}
+    for p in sorted(set(board.pos)):
+        ix = np.flatnonzero(pos == p)
+        out[p] = ix[np.argsort(-pts[ix], kind="stable")]
+    return out
+
+
+def pos_boards(board) -> dict[str, np.ndarray]:
+    """Row indices per position, best league_pts first (board order breaks ties).
+    Built once per board snapshot."""
+    return board.cached("pos_boards", _build_pos_boards)
+
+
+def _pts_maps(board) -> tuple[dict, dict]:
+    by_key, by_name = {}, {}
+    for r, pts in zip(board.rows, np.nan_to_num(board.col("league_pts"), nan=0.0)):
+        by_key.setdefault((r["name"], r["pos"]), float(pts))
+        by_name.setdefault(r["name"], float(pts))
+    return by_key, by_name
+
+
+def pts_lookup(board):
+    """(name, pos) -> season points, falling back to name-only — season_sim's lookup."""
+    by_key, by_name = board.cached("pts_lookup", _pts_maps)
+
+    def lookup(name, pos):
+        return by_key.get((name, pos)) or by_name.get(name) or 0.0
+    return lookup
+
+
+def _sig(pk: dict) -> tuple:
+    return (pk.get("overall"), pk.get("name"), pk.get("team"), pk.get("pos"))
+
+
+def state_key(board, picks_log: list[dict], **params) -> str:
+    """Canonical fingerprint of a draft state + query: the board snapshot, the pick
+    log reduced to what the engines read of it (overall, name, team, pos — the
+    same signature sync() compares), and the query's params as sorted-key JSON.
+    Equal keys mean every deterministic query here gives the same answer."""
+    h = hashlib.sha1(f"{board.etag}:{id(board)}\n".encode("utf-8"))
+    for pk in picks_log or []:
+        h.update(repr(_sig(pk)).encode("utf-8"))
+    h.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+class DraftSession:
+    """One room's live state. Not thread-safe by itself — see `lock`."""
+
+    def __init__(self, board, team_order: list[str], teams: int = 10):
+        self.board = board
+        self.team_order = list(team_order or [])
+        self.teams = teams
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        n = len(self.board)
+        self.avail = np.ones(n, dtype=bool)        # exact-name (opponent model)
+        self.avail_key = np.ones(n, dtype=bool)    # normalized-name (pick engine)
+        self.states = {nm: oa.TeamState(nm) for nm in self.team_order}
+        self.rosters: dict[str, list[dict]] = {}
+        self.log: list[dict] = []
+        self.drafted: set = set()
+        self._sigs: list[tuple] = []
+        self._cursor = dict.fromkeys(pos_boards(self.board), 0)
+
+    def copy(self) -> "DraftSession":
+        """An independent copy of the live state, to play hypothetical picks on
+        (models/speculate.py) without touching the room's own session."""
+        c = DraftSession.__new__(DraftSession)
+        c.board, c.team_order, c.teams = self.board, self.team_order, self.teams
+        c.lock = threading.RLock()
+        c.avail, c.avail_key = self.avail.copy(), self.avail_key.copy()
+        c.states = {nm: st.copy() for nm, st in self.states.items()}
+        c.rosters = {t: list(r) for t, r in self.rosters.items()}
+        c.log, c.drafted, c._sigs = list(self.log), set(self.drafted), list(self._sigs)
+        c._cursor = dict(self._cursor)
+        return c
+
+    # -- updates ---------------------------------------------------------------
+    def apply(self, pk: dict) -> None:
+        """One pick ({name, team, pos, ...}). Row resolution matches build_state:
+        the same-name row at the logged position, else the first same-name row."""
+        nm = pk.get("name")
+        named = self.board.indices_named(nm)
+        for i in named:
+            self.avail[i] = False
+        for i in self.board.indices_of(board_store.norm_key(nm)):
+            self.avail_key[i] = False
+        want = normalize_pos(pk.get("pos")) if pk.get("pos") else None
+        rows = self.board.rows
+        row = (next((rows[i] for i in named if want and rows[i]["pos"] == want), None)
+               or (rows[named[0]] if named else {"name": nm, "pos": want or "IDP", "adp": None}))
+        t = pk.get("team")
+        if t in self.states:
+            self.states[t].place(row)
+        if t:
+            self.rosters.setdefault(t, []).append({"name": nm, "position": pk.get("pos")})
+        self.drafted.add(nm)
+        self.log.append(pk)
+        self._sigs.append(_sig(pk))
+
+    def sync(self, picks_log: list[dict]) -> int:
+        """Catch up to the client's full pick log; returns how many picks were applied.
+        Only the new tail is applied unless the known prefix changed (undo / edit)."""
+        picks_log = picks_log or []
+        k = len(self._sigs)
+        if len(picks_log) < k or [_sig(p) for p in picks_log[:k]] != self._sigs:
+            self.reset()
+            k = 0
+        for pk in picks_log[k:]:
+            self.apply(pk)
+        return len(picks_log) - k
+
+    # -- views -----------------------------------------------------------------
+    def available_rows(self) -> list:
+        """Undrafted rows in board order (a fresh list — callers may consume it)."""
+        rows = self.board.rows
+        return [rows[i] for i in np.flatnonzero(self.avail)]
+
+    def best_at(self, pos: str, n: int = 5) -> list:
+        """Top `n` undrafted rows at a position by league_pts."""
+        order = pos_boards(self.board).get(normalize_pos(pos))
+        if order is None:
+            return []
+        c = self._cursor[normalize_pos(pos)]
+        while c < len(order) and not self.avail[order[c]]:
+            c += 1
+        self._cursor[normalize_pos(pos)] = c
+        out = []
+        for i in order[c:]:
+            if self.avail[i]:
+                out.append(self.board.rows[i])
+                if len(out) == n:
+                    break
+        return out
+
+    def heat(self) -> dict:
+        return run_heat(self.log, self.teams)
+
+    # -- queries ---------------------------------------------------------------
+    def shortlist(self, my_roster: dict, overall_pick: int, drafted_names=None,
+                  team_rosters: dict | None = None, **kw) -> dict:
+        """pick_engine.shortlist on the live state. `drafted_names` (the client's
+        list) only matters when it disagrees with the log; rosters default to the log's."""
+        available = self.avail_key
+        if drafted_names is not None and set(drafted_names) != self.drafted:
+            available = None
+        return pick_engine.shortlist(self.board.rows, drafted_names if available is None else (),
+                                     my_roster, self.log, overall_pick, teams=self.teams,
+                                     team_order=self.team_order,
+                                     team_rosters=team_rosters or self.rosters,
+                                     available=available, **kw)
+
+    def spy(self, team: str, overall_pick: int, rounds: int = 18,
+            prof: dict | None = None, top: int = 3) -> list[dict] | None:
+        """opponent_ai.predict for one team (None if it isn't in the room)."""
+        st = self.states.get(team)
+        if st is None:
+            return None
+        rnd = (overall_pick - 1) // self.teams + 1
+        return oa.predict(st, self.available_rows(), rnd, rounds, prof, self.log, self.teams, top)
+
+    def ghost(self, overall_pick: int, my_slot: int, rounds: int = 18,
+              profiles: dict | None = None, alias_map: dict | None = None,
+              seed: int | None = None, stop_at_my_pick: bool = True) -> dict:
+        """opponent_ai.simulate from the live state (played on copies)."""
+        states = {nm: st.copy() for nm, st in self.states.items()}
+        return oa.play(self.board, self.avail, states, self.log, self.team_order, overall_pick,
+                       my_slot, self.teams, rounds,
+                       oa.team_profiles(self.team_order, profiles, alias_map),
+                       seed, stop_at_my_pick)
+
+    def odds(self, team_rosters: dict | None = None, n_sims: int = 1000) -> dict:
+        """season_sim.title_odds over the log's rosters and the undrafted board."""
+        return season_sim.title_odds(team_rosters or self.rosters, self.available_rows(),
+                                     pts_lookup(self.board), n_sims=n_sims)
+
+
+class ResultCache:
+    """LRU of deterministic query results (shortlist, spy, ghost, title odds) keyed
+    by state_key(), with per-kind hit rates.
+
+    Every one of those is a pure function of the board, the pick log and its own
+    params, and several UI panels ask the same question of the same room — so an
+    unchanged room answers from here, and a new pick (a new key) is the only thing
+    that "invalidates": the old room's entries just age out of the LRU. One caller
+    computes a key while concurrent askers wait on it (no duplicate work); a
+    failed compute is not cached. Callers must not mutate what get() returns."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._flights: dict = {}
+        self._stats: dict[str, dict] = {}
+
+    def get(self, kind: str, key: str, compute):
+        with self._lock:
+            st = self._stats.setdefault(kind, {"hits": 0, "misses": 0, "waits": 0})
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                st["hits"] += 1
+                return self._entries[key]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = {"done": threading.Event(), "value": None, "error": None}
+                st["misses"] += 1
+            else:
+                st["waits"] += 1
+        if not leader:
+            flight["done"].wait()
+        else:
+            try:
+                flight["value"] = compute()
+            except Exception as e:
+                flight["error"] = e
+            with self._lock:
+                if flight["error"] is None:
+                    self._entries[key] = flight["value"]
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                del self._flights[key]
+            flight["done"].set()
+        if flight["error"] is not None:
+            raise flight["error"]
+        return flight["value"]
+
+    def stats(self) -> dict:
+        """{kind: hits/misses/waits/hitRate} plus totals, for /api/health."""
+        with self._lock:
+            out = {k: dict(v) for k, v in self._stats.items()}
+            n = len(self._entries)
+        for v in out.values():
+            asked = v["hits"] + v["misses"] + v["waits"]
+            v["hitRate"] = round((v["hits"] + v["waits"]) / asked, 3) if asked else None
+        hits = sum(v["hits"] + v["waits"] for v in out.values())
+        asked = hits + sum(v["misses"] for v in out.values())
+        return {"entries": n, "hitRate": round(hits / asked, 3) if asked else None, "kinds": out}
+
+
+_lock = threading.Lock()
+_sessions: OrderedDict = OrderedDict()
+
+
+def session_for(board, team_order: list[str], teams: int = 10) -> DraftSession:
+    """The shared session for this room on this board snapshot (a rebuilt board
+    starts a fresh one). Least-recently-used rooms are dropped past MAX_SESSIONS."""
+    key = (id(board), tuple(team_order or ()), teams)
+    with _lock:
+        s = _sessions.get(key)
+        if s is None or s.board is not board:
+            s = _sessions[key] = DraftSession(board, team_order, teams)
+        _sessions.move_to_end(key)
+        while len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+        return s
+
+
+if __name__ == "__main__":     # python models/draft_session.py — self-test
+    import time
+
+    board = board_store.get()
+    rows = board.rows
+    order = [f"Team{i}" for i in range(1, 11)]
+    log = []
+    for p in range(1, 101):
+        seat = oa.slot_for_pick(p, 10)
+        r = rows[p - 1]
+        log.append({"overall": p, "team": order[seat - 1], "name": r["name"], "pos": r["pos"]})
+
+    s = session_for(board, order, 10)
+    with s.lock:
+        t0 = time.perf_counter()
+        s.sync(log[:99])
+        t1 = time.perf_counter()
+        applied = s.sync(log)
+        t2 = time.perf_counter()
+    print(f"99 picks in {(t1 - t0) * 1000:.1f}ms; pick 100 alone {(t2 - t1) * 1e6:.0f}us (applied {applied})")
+    assert applied == 1
+
+    # every query must match the from-the-log version exactly
+    avail, states, _ = oa.build_state(rows, log, order, 10)
+    assert [r["name"] for r in s.available_rows()] == [r["name"] for r in avail]
+    assert all(s.states[t].slots.keys() == states[t].slots.keys() and
+               s.states[t].n_empty() == states[t].n_empty() for t in order)
+    g1 = s.ghost(101, 3, seed=5)
+    g2 = oa.simulate(rows, log, order, 101, 3, seed=5)
+    assert g1 == g2, "ghost diverged from simulate"
+    rnd = 11
+    assert s.spy("Team4", 101) == oa.predict(states["Team4"], avail, rnd, 18, None, log, 10)
+    roster = {"QB": None}
+    sl1 = s.shortlist(roster, 101, drafted_names=[p["name"] for p in log], my_slot=3)
+    sl2 = pick_engine.shortlist(rows, {p["name"] for p in log}, roster, log, 101, teams=10,
+                                team_order=order, team_rosters=s.rosters, my_slot=3)
+    assert sl1 == sl2, "shortlist diverged"
+    print(f"  ghost {len(g1['picks'])} picks to seat 3; shortlist top: "
+          f"{sl1['shortlist'][0]['name'] if sl1['shortlist'] else None}; "
+          f"best RB left: {[r['name'] for r in s.best_at('RB', 3)]}")
+
+    # an undo rewinds (rebuild), then replays
+    with s.lock:
+        s.sync(log[:50])
+        assert len(s.log) == 50 and s.avail.sum() > len(avail)
+        s.sync(log)
+    assert [r["name"] for r in s.available_rows()] == [r["name"] for r in avail]
+    # copies are independent; state keys follow the log and the query, nothing else
+    fork = s.copy()
+    fork.apply({"overall": 101, "team": "Team4", "name": avail[0]["name"], "pos": avail[0]["pos"]})
+    assert len(s.log) == 100 and s.avail.sum() == fork.avail.sum() + 1
+    k = state_key(board, log, pick=101, slot=3)
+    assert k == state_key(board, [dict(p, extra=1) for p in log], slot=3, pick=101)
+    assert k != state_key(board, log[:-1], pick=101, slot=3) != state_key(board, log, pick=102, slot=3)
+    cache, calls = ResultCache(max_entries=2), []
+    for _ in range(3):
+        got = cache.get("spy", k, lambda: calls.append(1) or s.spy("Team4", 101))
+    assert got == s.spy("Team4", 101) and len(calls) == 1
+    cache.get("spy", "other", lambda: 1)
+    cache.get("spy", "third", lambda: 2)             # evicts k (least recently used)
+    cache.get("spy", k, lambda: calls.append(1))
+    st = cache.stats()
+    assert len(calls) == 2 and st["kinds"]["spy"]["hits"] == 2 and st["entries"] == 2
+    odds = s.odds(n_sims=200)
+    print(f"  odds for {len(odds)} teams computed from live rosters")
+    print("SELF-TEST PASSED")
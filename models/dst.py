@@ -47,6 +47,11 @@ import pandas as pd
 import requests
 from dotenv import load_dotenv
 
+try:
+    import espn_store
+except ImportError:  # pragma: no cover
+    from models import espn_store
+
 ROOT = Path(__file__).resolve().parents[1]
 load_dotenv(dotenv_path=str(ROOT / ".env"))
 KEY = os.getenv("SPORTSDATA_BAKER_KEY")
@@ -96,10 +101,8 @@ NAME_TO_ABBR.update({"Football Team": "WSH", "Redskins": "WSH", "Washington": "W
 def _season_frames(years) -> dict[int, pd.DataFrame]:
     out: dict[int, pd.DataFrame] = {}
     for yr in years:
-        p = ROOT / "data" / "raw" / "espn" / str(yr) / "box_players.csv"
-        if not p.exists():
-            continue
-        b = pd.read_csv(p)
+        b = espn_store.load("box_players", years=[yr], add_year=False,
+                            columns=["player_name", "position", "points", "is_playoff"])
         b = b[b["position"].astype(str).str.upper().isin(["D/ST", "DST"])]
         b = b[~b["is_playoff"].astype(str).str.lower().eq("true")]
         g = (b.groupby("player_name", as_index=False)
@@ -0,0 +1,298 @@
+"""Columnar store for the ESPN league history (data/raw/espn/<year>/<table>.csv).
+
+Nine analyses read the same per-year CSVs: weekly_model, calibrate, dst,
+season_sim.weekly_sd, backtest, opponent_profiles, inseason's start/sit check,
+scripts/league_dna and _verify_ceiling. Each one used to glob them, run
+pd.read_csv over every column of every year, and then throw most of that away.
+
+This module ingests each (table, year) CSV ONCE into a typed column-per-file
+partition and serves reads from there:
+
+    data/processed/espn_store/<table>/<year>/meta.json   dtypes + source version
+                                             c<k>.npy    one column each
+
+  * typed once   — the partition keeps exactly the dtypes pd.read_csv inferred
+                   for that file (bools stay bools, a year whose final_standing
+                   has blanks stays float), so a load is frame-for-frame what
+                   reading the CSV gave. Text columns are dictionary-encoded
+                   (int32 codes + a value list in meta.json).
+  * projection   — `columns=` reads only those column files.
+  * predicates   — `where=` filters are evaluated on just their own columns
+                   (text filters against the dictionary, not every row), and only
+                   the surviving rows of the projected columns are materialized.
+  * partitions   — `years=` skips whole years without opening them.
+
+Columns are memory-mapped, so a read touches only the pages it uses. Every
+partition records the (mtime, size) of the CSV it came from and is re-ingested
+when the CSV changes (scripts/pull_espn.py rewrites them), so the store never
+serves stale history. If the store can't be written, reads fall back to the CSV.
+
+The store itself is a cache (git-ignored); `python models/espn_store.py --ingest`
+builds it up front. Pure / no network. Run `python models/espn_store.py` for a self-test.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+RAW = ROOT / "data" / "raw" / "espn"
+STORE = ROOT / "data" / "processed" / "espn_store"
+TABLES = ("box_players", "draft", "rosters", "standings", "weekly_scores")
+
+_OPS = {
+    "==": lambda a, v: a == v, "!=": lambda a, v: a != v,
+    "<": lambda a, v: a < v, "<=": lambda a, v: a <= v,
+    ">": lambda a, v: a > v, ">=": lambda a, v: a >= v,
+    "in": lambda a, v: np.isin(a, list(v)),
+}
+
+_lock = threading.Lock()
+_meta: dict[Path, dict] = {}          # partition dir -> meta.json, per source version
+
+
+def years(table: str) -> list[int]:
+    """Every season with this table on disk, oldest first."""
+    return sorted(int(p.parent.name) for p in RAW.glob(f"*/{table}.csv") if p.parent.name.isdigit())
+
+
+_years = years                        # load()'s `years=` argument shadows the function
+
+
+def _source_version(src: Path) -> list[int] | None:
+    try:
+        st = src.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _write(df: pd.DataFrame, part: Path, version: list[int]) -> dict:
+    """One CSV's frame -> column files + meta.json, built in a scratch directory and
+    swapped in whole. Readers may still have the old partition's columns mapped; they
+    keep reading those files (now unlinked) and never see a half-written one."""
+    part.parent.mkdir(parents=True, exist_ok=True)
+    tmp = part.parent / f".{part.name}.{uuid.uuid4().hex}.tmp"
+    tmp.mkdir()
+    try:
+        cols = []
+        for k, name in enumerate(df.columns):
+            s = df[name]
+            if s.dtype.kind in "biuf":
+                np.save(tmp / f"c{k}.npy", s.to_numpy())
+                cols.append({"name": name, "dtype": str(s.dtype)})
+            else:
+                codes, uniques = pd.factorize(s, use_na_sentinel=True)
+                np.save(tmp / f"c{k}.npy", codes.astype(np.int32))
+                cols.append({"name": name, "dtype": str(s.dtype), "values": uniques.tolist()})
+        meta = {"source": version, "rows": len(df), "columns": cols}
+        (tmp / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+        old = None
+        if part.exists():                  # a directory can't be replaced over a full one
+            old = part.parent / f".{part.name}.{uuid.uuid4().hex}.old"
+            os.replace(part, old)
+        os.replace(tmp, part)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    if old is not None:
+        shutil.rmtree(old, ignore_errors=True)
+    return meta
+
+
+def _partition(table: str, year: int) -> tuple[Path, dict] | None:
+    """(partition dir, meta) for an up-to-date partition, ingesting it if needed.
+    None when the CSV doesn't exist; raises OSError if the store can't be written."""
+    src = RAW / str(year) / f"{table}.csv"
+    version = _source_version(src)
+    if version is None:
+        return None
+    part = STORE / table / str(year)
+    meta = _meta.get(part)
+    if meta is not None and meta["source"] == version:
+        return part, meta
+    with _lock:
+        try:
+            meta = json.loads((part / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = None
+        if meta is None or meta.get("source") != version:
+            meta = _write(pd.read_csv(src), part, version)
+        _meta[part] = meta
+    return part, meta
+
+
+def ingest(tables=TABLES, force: bool = False) -> int:
+    """Build (or refresh) every partition up front; returns how many are ready.
+    `force` re-ingests even partitions whose CSV hasn't changed."""
+    n = 0
+    for table in tables:
+        for yr in years(table):
+            if force:
+                part = STORE / table / str(yr)
+                _meta.pop(part, None)
+                (part / "meta.json").unlink(missing_ok=True)
+            n += _partition(table, yr) is not None
+    return n
+
+
+def _open(part: Path, meta: dict, name: str) -> tuple[np.ndarray, dict]:
+    """(memory-mapped column, its meta entry) — mapped once per partition version."""
+    hit = meta.get("_open", {}).get(name)
+    if hit is not None:
+        return hit
+    with _lock:
+        cols = meta.setdefault("_open", {})
+        if name not in cols:
+            found = next(((k, c) for k, c in enumerate(meta["columns"]) if c["name"] == name), None)
+            if found is None:
+                raise KeyError(f"{name!r} is not a column of {part.relative_to(STORE)}")
+            k, col = found[0], dict(found[1])
+            if "values" in col:                               # code -1 -> NaN
+                col["_values"] = np.array(col["values"] + [np.nan], dtype=object)
+            col["_dtype"] = pd.api.types.pandas_dtype(col["dtype"])
+            cols[name] = (np.load(part / f"c{k}.npy", mmap_mode="r"), col)
+        return cols[name]
+
+
+def _column(part: Path, meta: dict, name: str, rows=None):
+    arr, col = _open(part, meta, name)
+    arr = np.array(arr if rows is None else arr[rows])
+    if "values" not in col:
+        return arr
+    return pd.array(col["_values"][arr], dtype=col["_dtype"])
+
+
+def _mask(part: Path, meta: dict, where) -> np.ndarray | None:
+    mask = None
+    for name, op, value in where or ():
+        arr, col = _open(part, meta, name)
+        if "values" in col:               # text: decide per dictionary entry, then per code
+            hit = np.array([bool(_OPS[op](np.array([v], dtype=object), value)[0])
+                            for v in col["values"]] + [op == "!="])
+            m = hit[arr]
+        else:
+            m = np.asarray(_OPS[op](arr, value), dtype=bool)
+        mask = m if mask is None else mask & m
+    return mask
+
+
+def _from_csv(table: str, year: int, columns, where) -> pd.DataFrame:
+    df = pd.read_csv(RAW / str(year) / f"{table}.csv")
+    for name, op, value in where or ():
+        df = df[_OPS[op](df[name].to_numpy(), value)]
+    return (df if columns is None else df[columns]).reset_index(drop=True)
+
+
+def load(table: str, columns: list[str] | None = None, years: list[int] | None = None,
+         where: list[tuple] | None = None, add_year: bool = True) -> pd.DataFrame:
+    """One table across seasons as a single frame — what concatenating pd.read_csv
+    of each year's CSV gave, with a trailing `year` column (add_year).
+
+    columns  only these columns (default all)
+    years    only these seasons (default every one on disk)
+    where    [(column, op, value)] row filters, ANDed; op in == != < <= > >= in
+             (`in` takes a list). Text values compare as stored; NaN never matches
+             ==/in and always matches !=."""
+    on_disk = _years(table)
+    yrs = on_disk if years is None else [y for y in sorted(years) if y in on_disk]
+    frames = []
+    for yr in yrs:
+        try:
+            hit = _partition(table, yr)
+        except OSError:                    # read-only checkout: read the CSV directly
+            hit = None
+            d = _from_csv(table, yr, columns, where)
+        if hit is not None:
+            part, meta = hit
+            mask = _mask(part, meta, where)
+            rows = None if mask is None else np.flatnonzero(mask)
+            names = [c["name"] for c in meta["columns"]] if columns is None else columns
+            d = pd.DataFrame({nm: _column(part, meta, nm, rows) for nm in names},
+                             index=pd.RangeIndex(meta["rows"] if rows is None else rows.size))
+        if add_year:
+            d["year"] = yr
+        frames.append(d)
+    if not frames:
+        return pd.DataFrame(columns=list(columns or []) + (["year"] if add_year else []))
+    return pd.concat(frames, ignore_index=True)
+
+
+def version(tables=TABLES) -> str:
+    """Fingerprint of the source CSVs behind `tables` (changes on any re-pull)."""
+    h = hashlib.sha1()
+    for table in tables:
+        for yr in years(table):
+            h.update(f"{table}/{yr}:{_source_version(RAW / str(yr) / f'{table}.csv')}\n".encode())
+    return h.hexdigest()
+
+
+def cached(name: str, tables, build, salt: str = "", refresh: bool = False) -> pd.DataFrame:
+    """A frame derived from `tables` (feature matrices and the like), pickled under
+    the store and rebuilt only when those tables' CSVs — or `salt`, e.g. the
+    deriving code — change. Older versions of `name` are dropped on rebuild."""
+    key = hashlib.sha1((version(tables) + salt).encode("utf-8")).hexdigest()[:16]
+    path = STORE / "_derived" / f"{name}-{key}.pkl"
+    if not refresh:
+        try:
+            return pd.read_pickle(path)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            pass
+    df = build()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for old in path.parent.glob(f"{name}-*.pkl"):
+            old.unlink(missing_ok=True)
+        tmp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            df.to_pickle(tmp)             # readers only ever see a complete pickle
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except OSError:                       # read-only checkout: just don't cache
+        pass
+    return df
+
+
+if __name__ == "__main__":     # python models/espn_store.py [--ingest] — self-test
+    import sys
+    import time
+
+    if "--ingest" in sys.argv:
+        t0 = time.perf_counter()
+        print(f"ingested {ingest(force='--force' in sys.argv)} partitions into "
+              f"{STORE.relative_to(ROOT)} in {(time.perf_counter() - t0) * 1000:.0f}ms")
+        sys.exit(0)
+
+    ingest()
+    # every partition round-trips to exactly what pd.read_csv reads
+    for table in TABLES:
+        for yr in years(table):
+            pd.testing.assert_frame_equal(load(table, years=[yr], add_year=False),
+                                          pd.read_csv(RAW / str(yr) / f"{table}.csv"))
+    print(f"{sum(len(years(t)) for t in TABLES)} partitions round-trip exactly")
+
+    # projection + predicates == the same filter on the full concat
+    t0 = time.perf_counter()
+    full = pd.concat([pd.read_csv(RAW / str(y) / "box_players.csv").assign(year=y)
+                      for y in years("box_players")], ignore_index=True)
+    t1 = time.perf_counter()
+    got = load("box_players", columns=["player_name", "points"],
+               where=[("position", "in", ["D/ST"]), ("is_playoff", "==", False)])
+    t2 = time.perf_counter()
+    want = full[(full["position"] == "D/ST") & (full["is_playoff"] == False)]   # noqa: E712
+    pd.testing.assert_frame_equal(got, want[["player_name", "points", "year"]].reset_index(drop=True))
+    print(f"box_players D/ST regular season: {len(got)} rows; csv {(t1 - t0) * 1000:.0f}ms "
+          f"vs store {(t2 - t1) * 1000:.1f}ms")
+    got = load("standings", columns=["owner"], years=[2024, 2025, 1999],
+               where=[("owner", "!=", "nobody")])
+    assert sorted(got["year"].unique()) == [2024, 2025]
+    print("SELF-TEST PASSED")
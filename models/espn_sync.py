@@ -12,16 +12,28 @@ and maps each pick onto DraftIQ's world:
 Served at /api/espn/draft. The League object is cached ~8s so UI polling never
 hammers ESPN. Validated by replaying the COMPLETED 2025 draft (204 picks)
 through this exact mapper — see /api/espn/draft?year=2025&debug=1.
+
+Live, one DraftWatcher per process does the polling instead of every client:
+it loads the League once, then re-reads only the draft (one small request)
+every POLL seconds, maps only picks it hasn't seen, and wakes subscribers —
+/api/espn/draft/stream pushes those picks over Server-Sent Events.
 """
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
+import threading
 import time
 import unicodedata
 from pathlib import Path
 
+try:  # works both as `python models/espn_sync.py` and `from models import espn_sync`
+    import board_store
+except ImportError:  # pragma: no cover
+    from models import board_store
+
 ROOT = Path(__file__).resolve().parents[1]
 
 _SUFFIX = re.compile(r"\b(jr|sr|ii|iii|iv|v)\b")
@@ -134,23 +146,114 @@ def map_pick(pk, idx, teams_by_id, own2ui) -> dict:
     }
 
 
-def get_draft(board_rows: list[dict], year: int = 2026) -> dict:
-    lg = STATE.league(year)
-    teams_by_id = {getattr(t, "team_id", None): t for t in (getattr(lg, "teams", None) or [])}
-    own2ui = owner_to_ui()
-    idx = board_index(board_rows)
-    picks = []
-    for i, pk in enumerate(getattr(lg, "draft", None) or [], start=1):
-        m = map_pick(pk, idx, teams_by_id, own2ui)
-        m["overall"] = i
-        picks.append(m)
-    matched = sum(1 for p in picks if p["matched"])
+def _index(board_rows) -> dict:
+    # built once per board snapshot, not on every poll
+    return board_store.board_for(board_rows).cached("espn_sync", lambda b: board_index(b.rows))
+
+
+def _teams_by_id(lg) -> dict:
+    return {getattr(t, "team_id", None): t for t in (getattr(lg, "teams", None) or [])}
+
+
+def _payload(lg, year: int, picks: list[dict]) -> dict:
     return {
         "connected": True,
         "league": getattr(lg.settings, "name", "?"),
         "year": year,
-        "teamCount": len(teams_by_id),
+        "teamCount": len(_teams_by_id(lg)),
         "pickCount": len(picks),
-        "matched": matched,
+        "matched": sum(1 for p in picks if p["matched"]),
         "picks": picks,
     }
+
+
+def get_draft(board_rows: list[dict], year: int = 2026, league=None) -> dict:
+    """The draft so far, mapped onto the board. `league` — an already-loaded
+    espn-api League (the API's background refresher keeps one) — skips the fetch."""
+    lg = league if league is not None else STATE.league(year)
+    teams_by_id = _teams_by_id(lg)
+    own2ui = owner_to_ui()
+    idx = _index(board_rows)
+    picks = []
+    for i, pk in enumerate(getattr(lg, "draft", None) or [], start=1):
+        m = map_pick(pk, idx, teams_by_id, own2ui)
+        m["overall"] = i
+        picks.append(m)
+    return _payload(lg, year, picks)
+
+
+class DraftWatcher:
+    """The live draft, watched once per process and diffed by pick count.
+
+    poll() is called from ONE background thread (the API's feed refresher). The
+    first call loads the full League (teams, player map); after that only the
+    draft is re-read. Picks already mapped are kept; a pick is mapped exactly
+    once. If ESPN's draft shrinks or an already-seen pick changes (commissioner
+    undo/edit), everything is re-mapped and `epoch` bumps so streams can resync.
+    Readers (any thread) use snapshot() / wait_since(), which never touch ESPN."""
+    POLL = 2.0            # seconds between draft-only re-reads while someone is watching
+
+    def __init__(self, year: int = 2026):
+        self.year = year
+        self.league = None
+        self.picks: list[dict] = []        # mapped; picks[i]["overall"] == i + 1
+        self.epoch = 0
+        self._ids: list = []               # ESPN playerId per seen pick (edit detection)
+        self._own2ui: dict = {}
+        self._cond = threading.Condition()
+
+    def poll(self, board_rows) -> int:
+        """One refresh. Returns how many new picks were published. Raises on ESPN errors."""
+        if self.league is None:
+            lg = STATE.league(self.year)
+            self._own2ui = owner_to_ui()
+        else:
+            # refresh_draft() appends to .draft in place, so re-read onto a shallow copy
+            # (same teams, player map, session) and publish it whole below: the League
+            # STATE shares — and the one snapshot() is reading — never sit half-filled
+            lg = copy.copy(self.league)
+            lg.draft = []
+            lg.refresh_draft()
+        raw = list(getattr(lg, "draft", None) or [])
+        ids = [getattr(pk, "playerId", None) for pk in raw]
+        n = len(self._ids)
+        reset = len(raw) < n or ids[:n] != self._ids
+        start = 0 if reset else n
+        teams_by_id, idx = _teams_by_id(lg), _index(board_rows)
+        new = []
+        for i in range(start, len(raw)):
+            m = map_pick(raw[i], idx, teams_by_id, self._own2ui)
+            m["overall"] = i + 1
+            new.append(m)
+        with self._cond:
+            self.league = lg
+            if reset:
+                self.picks = new
+                self.epoch += 1
+            else:
+                self.picks = self.picks + new       # readers may hold the old list
+            self._ids = ids
+            if new or reset:
+                self._cond.notify_all()
+        return len(new)
+
+    def snapshot(self) -> dict | None:
+        """get_draft()'s payload from the watched state (None before the first poll)."""
+        with self._cond:
+            lg, picks = self.league, self.picks
+        return _payload(lg, self.year, picks) if lg is not None else None
+
+    def wait_since(self, last_id: int, epoch: int | None, timeout: float) -> tuple[list[dict], int]:
+        """(picks with overall > last_id, epoch), blocking up to `timeout` seconds for
+        something new. An epoch other than the caller's means the draft was rewritten:
+        everything is returned and the caller should treat it as a fresh list."""
+        with self._cond:
+            def ready():
+                return (epoch is not None and epoch != self.epoch) or len(self.picks) > last_id
+            self._cond.wait_for(ready, timeout)
+            if epoch is not None and epoch != self.epoch:
+                return list(self.picks), self.epoch
+            return self.picks[last_id:], self.epoch
+
+
+WATCH = DraftWatcher()
@@ -9,15 +9,18 @@ Run: python models/inseason.py
 """
 from __future__ import annotations
 
-import glob
 import json
-import os
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+try:
+    import espn_store
+except ImportError:  # pragma: no cover
+    from models import espn_store
+
 ROOT = Path(__file__).resolve().parents[1]
-RAW = ROOT / "data" / "raw" / "espn"
 CFG = json.loads((ROOT / "data" / "league_config.json").read_text(encoding="utf-8"))
 
 SLOT_ELIG = {"QB": ["QB"], "RB": ["RB"], "WR": ["WR"], "TE": ["TE"],
@@ -60,15 +63,161 @@ def optimal_lineup(players: list[dict], spec: list[tuple[str, list[str]]]) -> di
     return {"starters": starters, "bench": bench, "total": round(total, 1)}
 
 
+def _shape(spec: list[tuple[str, list[str]]]):
+    """(greedy fill order, fixed-slot count per position, FLEX-eligible set) — or
+    None when the FLEX slots don't all share one eligibility set, the one shape
+    the sorted-array forms below can't answer (optimal_lineup still can)."""
+    order = [(slot, list(elig)) for slot, elig in sorted(spec, key=lambda s: len(s[1]))]
+    fixed: dict[str, int] = {}
+    flex = [set(elig) for _, elig in order if len(elig) > 1]
+    if any(not elig for _, elig in order) or any(f != flex[0] for f in flex):
+        return None
+    for _, elig in order:
+        if len(elig) == 1:
+            fixed[elig[0]] = fixed.get(elig[0], 0) + 1
+    return order, fixed, (flex[0] if flex else set())
+
+
+class Lineup:
+    """optimal_lineup's total for one roster, kept as per-position sorted arrays so
+    "the total with player X added (or removed)" is a marginal query, not a re-solve.
+
+    The greedy fill is exact for exclusive slots + FLEX, which makes its answer
+    simple: each position's fixed slots take that position's top-n, and the FLEX
+    slots take the best of what's left at the FLEX positions (the pool). Adding
+    or removing one player moves at most one value into or out of a position's
+    top-n and at most one into or out of the pool's top-F, so a query touches
+    only the k starter values — O(k), however long the roster or the wire is.
+    Totals are summed in the same slot order optimal_lineup uses and rounded the
+    same way, so `total_with(fa) - total` is exactly what the full re-solve gave."""
+
+    def __init__(self, players: list[dict], spec: list[tuple[str, list[str]]]):
+        self.players, self.spec = list(players), spec
+        self._shape = _shape(spec)
+        if self._shape is None:
+            self.total = optimal_lineup(self.players, spec)["total"]
+            return
+        order, fixed, flex = self._shape
+        by_pos: dict[str, list[float]] = {}
+        for p in self.players:
+            by_pos.setdefault(bucket(p["pos"]), []).append(p.get("proj") or 0)
+        self.by_pos = {b: sorted(v, reverse=True) for b, v in by_pos.items()}
+        self.pool = sorted((v for b, vals in self.by_pos.items() if b in flex
+                            for v in vals[fixed.get(b, 0):]), reverse=True)
+        self.n_flex = len(order) - sum(fixed.values())
+        self.total = self._sum({})
+
+    def _sum(self, tops: dict[str, list[float]], flex: list[float] | None = None) -> float:
+        """The lineup total with some positions' starters (and the FLEX picks)
+        replaced, summed in fill order like optimal_lineup."""
+        order, fixed, _ = self._shape
+        it = {b: iter(tops.get(b, self.by_pos.get(b, [])[:n])) for b, n in fixed.items()}
+        it_flex = iter(self.pool[:self.n_flex] if flex is None else flex)
+        total = 0
+        for _, elig in order:
+            v = next(it[elig[0]] if len(elig) == 1 else it_flex, None)
+            if v is not None:
+                total += v
+        return round(total, 1)
+
+    def total_with(self, player: dict) -> float:
+        """Lineup total if `player` joined the roster."""
+        if self._shape is None:
+            return optimal_lineup(self.players + [player], self.spec)["total"]
+        _, fixed, flex = self._shape
+        b, v = bucket(player["pos"]), player.get("proj") or 0
+        n = fixed.get(b, 0)
+        tops, spill = {}, v                  # spill: the value that misses the top-n
+        if n:
+            top = sorted(self.by_pos.get(b, [])[:n] + [v], reverse=True)
+            spill = top.pop() if len(top) > n else None
+            tops[b] = top
+        new_flex = None
+        if spill is not None and b in flex and self.n_flex:
+            new_flex = sorted(self.pool[:self.n_flex] + [spill], reverse=True)[:self.n_flex]
+        return self._sum(tops, new_flex)
+
+    def total_without(self, player: dict) -> float:
+        """Lineup total if `player` (matched by position and projection) left."""
+        if self._shape is None:
+            rest = list(self.players)
+            rest.remove(player)
+            return optimal_lineup(rest, self.spec)["total"]
+        _, fixed, flex = self._shape
+        b, v = bucket(player["pos"]), player.get("proj") or 0
+        n, vals = fixed.get(b, 0), self.by_pos.get(b, [])
+        tops, gone = {}, v                   # gone: the value that leaves the pool
+        if n and vals.index(v) < n:
+            tops[b] = vals[:n + 1]
+            tops[b].remove(v)
+            gone = vals[n] if len(vals) > n else None
+        new_flex = None
+        if gone is not None and b in flex:
+            top = self.pool[:self.n_flex + 1]
+            if gone in top[:self.n_flex]:
+                top.remove(gone)
+                new_flex = top[:self.n_flex]
+        return self._sum(tops, new_flex)
+
+
+def lineup_totals(frame: pd.DataFrame, spec: list[tuple[str, list[str]]], by: list[str],
+                  pos: str = "position", proj: str = "points") -> pd.DataFrame:
+    """optimal_lineup's total for every group of `frame` at once (one row per
+    player, grouped by e.g. year/week/team) — columns `total` (rounded like
+    optimal_lineup) and `players` (rows with a projection), indexed by `by`.
+
+    Same reading as Lineup, on whole columns: sort by (group, position, -proj),
+    rank within each group's position to pick its fixed starters, then rank the
+    FLEX-eligible leftovers within the group for the FLEX slots. Starters are
+    summed in fill order, so each total equals the per-roster greedy's."""
+    shape = _shape(spec)
+    if shape is None:
+        raise ValueError("lineup_totals needs every FLEX slot to share one eligibility set")
+    order, fixed, flex = shape
+    d = frame.loc[frame[proj].notna(), list(by) + [pos, proj]]
+    gid = d.groupby(list(by), sort=True).ngroup().to_numpy(dtype=float)
+    keep = gid >= 0                                       # NaN keys drop, as in groupby
+    keys = d.groupby(list(by), sort=True).size()
+    # positions coded in fill order, so each group's fixed starters come out slot by slot
+    rank_of = {b: k for k, b in enumerate(dict.fromkeys(e[0] for _, e in order if len(e) == 1))}
+    code, names = pd.factorize(d[pos], use_na_sentinel=False)
+    buckets = [bucket(x) for x in names]
+    for b in buckets:
+        rank_of.setdefault(b, len(rank_of))
+    bcode = np.array([rank_of[b] for b in buckets], dtype=np.int64)[code][keep]
+    gid, v = gid[keep].astype(np.int64), d[proj].to_numpy(dtype=float)[keep]
+
+    cap = np.zeros(len(rank_of), dtype=np.int64)
+    in_flex = np.zeros(len(rank_of), dtype=bool)
+    for b, k in rank_of.items():
+        cap[k], in_flex[k] = fixed.get(b, 0), b in flex
+    ix = np.lexsort((-v, bcode, gid))
+    g, c = gid[ix], bcode[ix]
+    run = np.r_[True, (g[1:] != g[:-1]) | (c[1:] != c[:-1])]
+    start = np.maximum.accumulate(np.where(run, np.arange(ix.size), 0))
+    starter = (np.arange(ix.size) - start) < cap[c]
+    pool = ix[~starter & in_flex[c]]
+    pool = pool[np.lexsort((-v[pool], gid[pool]))]
+    pg = gid[pool]
+    first = np.r_[True, pg[1:] != pg[:-1]]
+    pstart = np.maximum.accumulate(np.where(first, np.arange(pool.size), 0))
+    flex_pick = pool[(np.arange(pool.size) - pstart) < len(order) - sum(fixed.values())]
+    picked = np.concatenate([ix[starter], flex_pick])
+    total = np.bincount(gid[picked], weights=v[picked], minlength=len(keys))
+    return pd.DataFrame({"total": [round(t, 1) for t in total.tolist()],
+                         "players": keys.to_numpy()}, index=keys.index)
+
+
 def waiver_targets(my_roster: list[dict], free_agents: list[dict],
                    replacement: dict, spec: list, top: int = 12) -> list[dict]:
     """Rank free agents by value over replacement, flagging ones that crack your lineup."""
-    base = optimal_lineup(my_roster, spec)["total"]
+    lineup = Lineup(my_roster, spec)
+    base = lineup.total
     out = []
     for fa in free_agents:
         pos = bucket(fa["pos"])
         vorp = (fa.get("proj") or 0) - replacement.get(pos, 0)
-        starts = optimal_lineup(my_roster + [fa], spec)["total"] - base  # lineup upgrade if added
+        starts = lineup.total_with(fa) - base  # lineup upgrade if added
         out.append({**fa, "vorp": round(vorp, 1), "lineup_gain": round(starts, 1),
                     "starts_now": starts > 0.1})
     return sorted(out, key=lambda x: (-x["lineup_gain"], -x["vorp"]))[:top]
@@ -92,21 +241,22 @@ def trade_eval(my_roster: list[dict], give: list[str], get: list[dict], spec: li
 # --------------------------------------------------------------------------- #
 def _validate_start_sit() -> None:
     spec = slot_spec(CFG["historical"])  # 12-team / 1-FLEX era
+    keys = ["week", "team_id", "team_name"]
     rows = []
-    for f in sorted(glob.glob(str(RAW / "*" / "box_players.csv"))):
-        year = int(os.path.basename(os.path.dirname(f)))
-        d = pd.read_csv(f)
-        d = d[d["is_playoff"] == False] if "is_playoff" in d else d  # regular season
-        for (wk, tid, tname), g in d.groupby(["week", "team_id", "team_name"]):
-            roster = [{"name": r["player_name"], "pos": r["position"], "proj": r["points"]}
-                      for _, r in g.iterrows() if pd.notna(r["points"])]
-            if len(roster) < len(spec):
-                continue
-            actual = g[g["started"] == True]["points"].sum()
-            opt = optimal_lineup(roster, spec)["total"]
-            rows.append({"year": year, "team_name": tname, "owner_team": tid,
-                         "actual": actual, "optimal": opt, "left_on_bench": opt - actual})
-    df = pd.DataFrame(rows)
+    for year in espn_store.years("box_players"):
+        d = espn_store.load("box_players", years=[year], add_year=False,   # regular season
+                            columns=keys + ["player_name", "position", "points", "started"],
+                            where=[("is_playoff", "==", False)])
+        opt = lineup_totals(d, spec, keys)                 # every team-week in one pass
+        opt = opt[opt["players"] >= len(spec)]
+        actual = (d[d["started"] == True].groupby(keys)["points"].sum()
+                  .reindex(opt.index, fill_value=0.0))
+        rows.append(pd.DataFrame({"year": year,
+                                  "team_name": opt.index.get_level_values("team_name"),
+                                  "owner_team": opt.index.get_level_values("team_id"),
+                                  "actual": actual.to_numpy(), "optimal": opt["total"].to_numpy(),
+                                  "left_on_bench": opt["total"].to_numpy() - actual.to_numpy()}))
+    df = pd.concat(rows, ignore_index=True) if rows else pd.DataFrame()
     if df.empty:
         print("No box data — run scripts/pull_espn.py --box first.")
         return
@@ -127,4 +277,33 @@ def _validate_start_sit() -> None:
 
 
 if __name__ == "__main__":
+    import random
+
+    # the marginal and batched forms agree with the full greedy re-solve
+    rng = random.Random(2026)
+    positions = ["QB", "RB", "RB", "WR", "WR", "TE", "K", "D/ST", "LB", "DE"]
+    frames = []
+    for cfg in (CFG["historical"], CFG["2026"]):
+        spec = slot_spec(cfg)
+        for t in range(500):
+            roster = [{"name": f"p{i}", "pos": rng.choice(positions),
+                       "proj": rng.choice([None, 0, 5.0, round(rng.uniform(-2, 30), 1)])}
+                      for i in range(rng.randint(0, 20))]
+            fa = {"name": "fa", "pos": rng.choice(positions), "proj": round(rng.uniform(0, 30), 1)}
+            lu = Lineup(roster, spec)
+            assert lu.total == optimal_lineup(roster, spec)["total"]
+            assert lu.total_with(fa) == optimal_lineup(roster + [fa], spec)["total"]
+            for p in roster[:3]:
+                rest = [q for q in roster if q is not p]
+                assert lu.total_without(p) == optimal_lineup(rest, spec)["total"]
+            if cfg is CFG["historical"]:
+                frames.append(pd.DataFrame({"team": t, "position": [p["pos"] for p in roster],
+                                            "points": [p["proj"] for p in roster]}, dtype=object))
+    spec = slot_spec(CFG["historical"])
+    d = pd.concat(frames, ignore_index=True).astype({"team": int, "points": float})
+    got = lineup_totals(d, spec, ["team"])["total"]
+    for t, g in d.groupby("team"):
+        roster = [{"pos": p, "proj": x} for p, x in zip(g["position"], g["points"]) if pd.notna(x)]
+        assert got.get(t, 0.0) == optimal_lineup(roster, spec)["total"]
+    print("lineup self-test passed (marginal + batched == full re-solve)\n")
     _validate_start_sit()
@@ -0,0 +1,151 @@
+"""Player-mention index — which board players a chat conversation names, in one pass.
+
+/api/ai/chat attaches the full board row of every player the user names (the
+top-6-per-position window misses deep names). It used to find them by looping
+every board row on every question: two re.subs to tokenize the name, two
+substring scans of the whole question + history, and a compiled-on-the-fly
+regex search for the surname — ~1,400 rows of that per message.
+
+The names only change when the board does, so this indexes them once per board
+snapshot (Board.cached) in one dict keyed by token tuples:
+
+  full     ('marvin', 'harrison', 'jr')
+  core     ('marvin', 'harrison')      suffixes jr/sr/ii/iii/iv/v dropped
+  surname  ('harrison',)               the core's last token — only when it has 5+
+                                       letters ('hill', 'cook', 'moore' name too
+                                       many people to count as a mention alone)
+
+Text is tokenized exactly as the chat always did (lowercase, anything but a-z0-9
+splits), and find() walks its tokens once, extending each window only while it is
+still a prefix of some name. A name matches on whole tokens: 'Marvin Harrison' in
+'marvin harrisons' no longer counts (the old substring test let it), surnames were
+already whole words. Hits come back in board order, as the old loop found them.
+
+Pure / no network. Run `python models/mentions.py` for a self-test.
+"""
+from __future__ import annotations
+
+import re
+
+try:  # works both as `python models/mentions.py` and `from models import mentions`
+    from scoring import norm_name
+except ImportError:  # pragma: no cover
+    from models.scoring import norm_name
+
+SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+MIN_SURNAME = 5                 # a bare surname shorter than this isn't a mention
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokens(text) -> list[str]:
+    """Lowercase a-z0-9 runs — the chat's name/question normalization."""
+    return _TOKEN.findall(str(text or "").lower())
+
+
+class MentionIndex:
+    """Token-tuple keys -> board row indices, for one board snapshot."""
+
+    def __init__(self, names):
+        self._rows: dict[tuple, list[int]] = {}
+        self._prefixes: set[tuple] = set()
+        self.longest = 0
+        for i, nm in enumerate(names):
+            toks = tokens(nm)
+            if not toks:
+                continue
+            core = [t for t in toks if t not in SUFFIXES] or toks
+            keys = {tuple(toks), tuple(core)}
+            if len(core[-1]) >= MIN_SURNAME:
+                keys.add((core[-1],))
+            for key in keys:
+                self._rows.setdefault(key, []).append(i)
+                self._prefixes.update(key[:n] for n in range(1, len(key)))
+                self.longest = max(self.longest, len(key))
+        # the drafted-list match key per row (what the chat compares `drafted` on)
+        self.norm = tuple(norm_name(n) for n in names)
+
+    def find(self, text, limit: int | None = None) -> list[int]:
+        """Row indices of every player `text` names, in board order (first `limit`)."""
+        toks = tokens(text)
+        hits: set[int] = set()
+        for i in range(len(toks)):
+            key = ()
+            for t in toks[i:i + self.longest]:
+                key += (t,)
+                rows = self._rows.get(key)
+                if rows:
+                    hits.update(rows)
+                if key not in self._prefixes:
+                    break
+        out = sorted(hits)
+        return out if limit is None else out[:limit]
+
+
+def get(board) -> MentionIndex:
+    """The index for `board`, built once per snapshot."""
+    return board.cached("mentions", lambda b: MentionIndex(b.names))
+
+
+if __name__ == "__main__":     # python models/mentions.py — self-test
+    import random
+    import time
+
+    try:
+        import board_store
+    except ImportError:  # pragma: no cover
+        from models import board_store
+
+    board = board_store.get()
+    t0 = time.perf_counter()
+    idx = get(board)
+    print(f"{len(board)} names, {len(idx._rows)} keys, built in {(time.perf_counter() - t0) * 1000:.1f}ms")
+    assert get(board) is idx
+
+    def legacy(text, limit=10):
+        """The old per-row scan from api.ai_chat."""
+        qnorm = " ".join(re.sub(r"[^a-z0-9 ]", " ", text.lower()).split())
+        out = []
+        for i, r in enumerate(board.rows):
+            toks = re.sub(r"[^a-z0-9 ]", " ", str(r.get("name") or "").lower()).split()
+            if not toks:
+                continue
+            core = [t for t in toks if t not in SUFFIXES] or toks
+            last = core[-1]
+            if (" ".join(toks) in qnorm or " ".join(core) in qnorm
+                    or (len(last) >= 5 and re.search(r"\b" + re.escape(last) + r"\b", qnorm))):
+                out.append(i)
+            if len(out) >= limit:
+                break
+        return out
+
+    # a conversation that names players as whole words finds exactly the same rows
+    rng = random.Random(7)
+    fill = ["should", "I", "take", "over", "or", "wait", "on", "what about", "vs", "?", "!", ","]
+    texts = []
+    for _ in range(300):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            nm = board.names[rng.randrange(len(board))]
+            form = rng.random()
+            if form < 0.3:          # surname only
+                nm = [t for t in tokens(nm) if t not in SUFFIXES][-1:] or [nm]
+                nm = nm[0]
+            elif form < 0.5:        # no suffix
+                nm = " ".join(t for t in nm.split() if t.lower().strip(".") not in SUFFIXES)
+            parts += [nm + rng.choice(["", "'s", "?", ","]), rng.choice(fill)]
+        texts.append(" ".join(parts))
+    texts += ["who's left at TE?", "", "Ja'Marr Chase or Marvin Harrison Jr.?", "Is St. Brown a WR1?"]
+    bad = sum(idx.find(t, 10) != legacy(t) for t in texts)
+    print(f"{len(texts)} conversations: {bad} differ from the per-row scan")
+    assert bad == 0
+
+    t0 = time.perf_counter()
+    for t in texts:
+        legacy(t)
+    t1 = time.perf_counter()
+    for t in texts:
+        idx.find(t, 10)
+    t2 = time.perf_counter()
+    print(f"per conversation: scan {(t1 - t0) / len(texts) * 1e3:.2f}ms vs index "
+          f"{(t2 - t1) / len(texts) * 1e6:.1f}us")
+    print("SELF-TEST PASSED")
@@ -0,0 +1,112 @@
+"""Adaptive Monte-Carlo driver — sim until the answer is tight, not a fixed N times.
+
+Every Monte-Carlo read in DraftIQ is a set of probabilities (title / playoff odds,
+wheel survival odds), and each used to run a fixed count of sims (1000, 25, 400)
+with no error bars. The trouble with that:
+
+  * a fixed N is too many when the answer is already clear (a player who is
+    gone in 25 of 25 rooms) and too few when it isn't (a 50/50 survivor);
+  * with no reported error, a 0.6-point title-odds wiggle between two picks
+    reads like signal when it is sampling noise.
+
+`adaptive()` runs batches through a caller-supplied `batch(start, k)` until every
+governing probability's standard error is at or under `target_se`, the time
+budget is spent, or `max_n` is reached. After each batch it sizes the next one
+from the current worst SE (n grows like (se / target)^2) and from the observed
+time per sim, so it neither dribbles nor overshoots the budget.
+
+Errors are Agresti-Coull / Wilson, not the plain sqrt(p(1-p)/n). The plain
+formula reads a 0-of-25 as "SE 0, done"; these stay honest at 0% and 100%.
+
+Pure numpy. Run `python models/montecarlo.py` for a self-test.
+"""
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+
+Z = 1.96                     # 95% intervals
+
+
+def se(hits, n: int, z: float = Z) -> np.ndarray:
+    """Agresti-Coull standard error of hits/n (never 0 at the edges)."""
+    hits = np.asarray(hits, dtype=float)
+    nt = n + z * z
+    p = (hits + z * z / 2) / nt
+    return np.sqrt(p * (1 - p) / nt)
+
+
+def wilson(hits, n: int, z: float = Z) -> tuple[np.ndarray, np.ndarray]:
+    """Wilson score interval for hits/n — (lo, hi) arrays."""
+    hits = np.asarray(hits, dtype=float)
+    if n <= 0:
+        return np.zeros_like(hits), np.ones_like(hits)
+    p = hits / n
+    d = 1 + z * z / n
+    mid = (p + z * z / (2 * n)) / d
+    half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / d
+    return np.clip(mid - half, 0, 1), np.clip(mid + half, 0, 1)
+
+
+def ci(hits, n: int, digits: int = 4) -> list[list[float]]:
+    """[[lo, hi], ...] rounded for JSON."""
+    lo, hi = wilson(hits, n)
+    return [[round(float(a), digits), round(float(b), digits)] for a, b in zip(lo, hi)]
+
+
+def adaptive(batch, watch, target_se: float, min_n: int, max_n: int,
+             budget_ms: float | None = None, step: int | None = None) -> tuple[dict, int]:
+    """Run `batch(start, k)` — sims start..start+k-1, returning a dict of arrays
+    that SUM across batches — until `watch(totals)` (success counts of the
+    governing probabilities) all have se <= target_se, the budget is spent, or
+    max_n sims have run. Returns (totals, n). `min_n` is the first batch; `step`
+    (default min_n) is the smallest follow-up batch."""
+    t0 = time.perf_counter()
+    step = step or min_n
+    totals: dict = {}
+    n, k = 0, max(1, min(min_n, max_n))
+    while k > 0:
+        part = batch(n, k)
+        totals = part if not totals else {key: totals[key] + part[key] for key in totals}
+        n += k
+        worst = float(np.max(se(watch(totals), n), initial=0.0))
+        if n >= max_n or worst <= target_se:
+            break
+        # n needed scales with (se / target)^2; ask for that, in whole steps
+        want = math.ceil(n * ((worst / target_se) ** 2 - 1))
+        k = max(step, -(-want // step) * step)
+        if budget_ms is not None:
+            spent = (time.perf_counter() - t0) * 1000
+            k = min(k, int((budget_ms - spent) / (spent / n)))
+        k = min(k, max_n - n)
+    return totals, n
+
+
+if __name__ == "__main__":     # python models/montecarlo.py — self-test
+    rng = np.random.default_rng(2026)
+    truth = np.array([0.02, 0.1, 0.5, 0.97])
+
+    def coins(start, k):
+        return {"hits": (rng.random((k, truth.size)) < truth).sum(axis=0)}
+
+    tot, n = adaptive(coins, lambda t: t["hits"], target_se=0.01, min_n=200, max_n=100_000)
+    print(f"target se 0.01 -> {n} sims; p={np.round(tot['hits'] / n, 3)}; "
+          f"worst se {se(tot['hits'], n).max():.4f}")
+    assert se(tot["hits"], n).max() <= 0.01 and n < 4000, "should stop near n = 0.25 / 0.01^2"
+    assert se([0], 25)[0] > 0.02, "0 of 25 is not a certainty"
+
+    covered = np.zeros(truth.size)
+    for _ in range(200):
+        tot, n = adaptive(coins, lambda t: t["hits"], target_se=0.02, min_n=50, max_n=100_000)
+        lo, hi = wilson(tot["hits"], n)
+        covered += (lo <= truth) & (truth <= hi)
+    print(f"95% CI coverage over 200 adaptive runs: {np.round(covered / 200, 3)}")
+    assert np.all(covered / 200 >= 0.85), "intervals under-cover"
+
+    tot, n = adaptive(coins, lambda t: t["hits"], target_se=1e-5, min_n=100, max_n=10**9,
+                      budget_ms=50)
+    print(f"impossible target, 50ms budget -> stopped at {n} sims")
+    assert n < 10**9
+    print("SELF-TEST PASSED")
@@ -15,16 +15,33 @@ per-manager priors read from data/processed/manager_profiles.json — Street rea
 for QBs, Munford hammers RBs, Hubauer/Gilbert wait on QB — weighted by profile
 confidence exactly like the live pick engine does.
 
+That behavior is written once, in _weigh(): the candidate field (window, streamer
+injection, bench-shopping, endgame fillers) and every weight and why. Its two
+callers only differ in how they find the ADP window and the best-at-position:
+  * candidates() / pick_one() / predict() — over a list of available rows. Spy
+    and the speculative pre-warm (models/speculate.py) read these.
+  * Room — the kernel simulate() runs. Availability is a byte mask over the
+    board with forward-only cursors into its ADP order and per-position points
+    order (the board-only orderings are built once per board_store snapshot),
+    per-team position counts are plain ints, and run-heat is a rolling 2-round
+    window — so a pick costs its ~12 candidates, not a sort of the whole pool.
+    A full 180-pick room is a few milliseconds, which is what lets the wheel and
+    the tournament play hundreds of rooms. Room draws with the same RNG call, so
+    its picks are identical per seed (the self-test holds it to that).
+
 Deterministic per seed. No LLM, no network.
 """
 from __future__ import annotations
 
 import random
+from collections import deque
 
 try:
-    from pick_engine import normalize_pos, profile_prior, run_heat
+    import board_store
+    from pick_engine import BASE_SHARE, normalize_pos, profile_prior, run_heat
 except ImportError:  # pragma: no cover
-    from models.pick_engine import normalize_pos, profile_prior, run_heat
+    from models import board_store
+    from models.pick_engine import BASE_SHARE, normalize_pos, profile_prior, run_heat
 
 SLOTS = ["QB", "RB1", "RB2", "WR1", "WR2", "TE", "FLEX", "FLEX2", "IDP", "DST", "K"]
 SLOT_OPTS = {"RB": ["RB1", "RB2", "FLEX", "FLEX2"], "WR": ["WR1", "WR2", "FLEX", "FLEX2"],
@@ -48,6 +65,13 @@ class TeamState:
         self.slots: dict[str, dict | None] = {s: None for s in SLOTS}
         self.bench: list[dict] = []
 
+    def copy(self) -> "TeamState":
+        """Independent slots/bench (the player rows themselves are shared, never mutated)."""
+        t = self.__class__(self.name)
+        t.slots = dict(self.slots)
+        t.bench = list(self.bench)
+        return t
+
     def place(self, player: dict) -> str:
         pos = player["pos"]
         for s in SLOT_OPTS.get(pos, [pos]):
@@ -105,11 +129,11 @@ def build_state(board_rows: list[dict], picks_log: list[dict], team_order: list[
     return avail, states, drafted
 
 
-def _prior_mult(prof: dict | None, pos: str, rnd: int, team: TeamState) -> tuple[float, str]:
-    """Manager-tendency multiplier + a short label when it fires."""
+def _prior_mult(prof: dict | None, pos: str, rnd: int, n_qb: int) -> tuple[float, str]:
+    """Manager-tendency multiplier + a short label when it fires (`n_qb` = QBs rostered)."""
     if not prof or prof.get("confidence") == "low":
         return 1.0, ""
-    if pos == "QB" and team.count("QB") == 0:
+    if pos == "QB" and n_qb == 0:
         q = prof.get("qb_first_round_avg")
         if q is not None and q <= 4.1 and rnd >= 2:
             return 4.0, f"QB habit (hist ~rd {q:.1f})"
@@ -122,66 +146,80 @@ def _prior_mult(prof: dict | None, pos: str, rnd: int, team: TeamState) -> tuple
     return 1.0, ""
 
 
-def _best_at(avail: list[dict], pos: str, n: int = 2) -> list[dict]:
-    """Best available at a position by projected league points (ADP-blind — most IDP
-    and some late K carry no ADP at all, so an ADP window never surfaces them)."""
-    at = [r for r in avail if r["pos"] == pos]
-    at.sort(key=lambda r: -(_f(r.get("league_pts")) or _f(r.get("points")) or 0))
-    return at[:n]
+def _pos_counts(team: TeamState) -> dict[str, int]:
+    """Position -> how many `team` has rostered (starters + bench)."""
+    c: dict[str, int] = {}
+    for v in [*team.slots.values(), *team.bench]:
+        if v:
+            c[v["pos"]] = c.get(v["pos"], 0) + 1
+    return c
 
 
-def candidates(team: TeamState, avail: list[dict], rnd: int, rounds: int,
-               prof: dict | None = None, picks_log: list[dict] | None = None,
-               teams: int = 10, window: int = 12) -> list[tuple[dict, float, str]]:
-    """The pick distribution for one opponent: [(player_row, weight, why)]."""
-    cands = sorted(avail, key=lambda p: _f(p.get("adp"), 999))[:window]
+def _weigh(cands: list[int], team: TeamState, counts: dict[str, int], rnd: int, rounds: int,
+           prof: dict | None, window: int, pos_of, best_at, why_of,
+           heat_of) -> list[tuple[int, float, str]]:
+    """The opponent model, once: from the ADP window `cands`, the candidate field for
+    `team`'s pick and each candidate's weight, as [(key, weight, why)].
+
+    Keys are ints into the caller's pool (candidates(): positions in `avail`; Room:
+    board row indices). pos_of[key] -> position; best_at(pos, n) -> the n best
+    available keys there by projected points; why_of(key) -> the default "ADP 37" /
+    "best at need" label; `counts` is _pos_counts(team); heat_of(pos) -> run_heat's
+    value for the room's recent picks."""
     open_s = team.open_starters()
+    n_empty = len(open_s)
     picks_left = rounds - rnd + 1
     empty_stream = sum(1 for s in STREAM if team.slots[s] is None)
-    heat = run_heat(picks_log or [], teams)
 
     # The ADP window can't see players without an ADP (nearly all IDP). Inject the
     # best available at every empty streamer slot once its window opens, so rosters
     # actually complete: IDP from rd 8 (this room's habit), DST/K when time is short.
-    inject: list[dict] = []
+    inject: list = []
     if team.slots["IDP"] is None and rnd >= 8:
-        inject += _best_at(avail, "IDP")
+        inject += best_at("IDP", 2)
     for pos in ("DST", "K"):
         if team.slots[pos] is None and picks_left <= empty_stream + 3:
-            inject += _best_at(avail, pos)
-    seen_ids = {id(c) for c in cands}
-    cands += [c for c in inject if id(c) not in seen_ids]
+            inject += best_at(pos, 2)
+    seen = set(cands)
+    cands = cands + [c for c in inject if c not in seen]
 
     # Bench-shopping (all starters filled): the ADP window late in a draft is mostly
     # ADP-less IDPs, and every one of them is a near-zero-weight "2nd streamer" — a
     # weighted choice over all-tiny weights still fires. Shop skill depth instead.
-    if team.n_empty() == 0:
-        skill = [c for c in cands if c["pos"] in ("RB", "WR", "TE", "QB")]
+    if n_empty == 0:
+        skill = [c for c in cands if pos_of[c] in ("RB", "WR", "TE", "QB")]
         for pos in ("RB", "WR", "TE"):
-            have = {id(c) for c in skill}
-            skill += [c for c in _best_at(avail, pos) if id(c) not in have]
+            have = set(skill)
+            skill += [c for c in best_at(pos, 2) if c not in have]
         if skill:
             cands = skill[:window]
 
     # Endgame law: when remaining picks just cover the empty starters, every pick
     # MUST fill one — restrict the field to fillers (bench picks are no longer legal).
-    if picks_left <= team.n_empty():
+    open_set = set(open_s)
+    flex_open = "FLEX" in open_set
+    endgame = picks_left <= n_empty
+    if endgame:
         fillers = [c for c in cands
-                   if c["pos"] in open_s or (c["pos"] in ("RB", "WR", "TE") and "FLEX" in open_s)]
-        for pos in set(open_s):
+                   if pos_of[c] in open_set or (flex_open and pos_of[c] in ("RB", "WR", "TE"))]
+        for pos in open_set:
             if pos in ("FLEX",):
                 continue
-            if not any(c["pos"] == pos for c in fillers):
-                fillers += _best_at(avail, pos, 1)      # nothing in window fills it → fetch one
+            if not any(pos_of[c] == pos for c in fillers):
+                fillers += best_at(pos, 1)              # nothing in window fills it → fetch one
         if fillers:
             cands = fillers
+
+    filled = {p: team.slots[p] is not None for p in STREAM}
+    n_qb = counts.get("QB", 0)
+    heat: dict[str, float] = {}
     out = []
     for i, c in enumerate(cands):
         w = RANK_W[i] if i < len(RANK_W) else 0.15
-        pos = c["pos"]
-        why = f"ADP {(_f(c.get('adp')) or 0):.0f}" if _f(c.get("adp")) else "best at need"
+        pos = pos_of[c]
+        why = why_of(c)
         if pos in STREAM:
-            if team.slots[pos] is not None:
+            if filled[pos]:
                 w *= 0.001                                 # never a 2nd streamer
             elif picks_left <= empty_stream + 1:
                 w = max(w, 2.5)                            # out of slack — take the streamer
@@ -192,37 +230,62 @@ def candidates(team: TeamState, avail: list[dict], rnd: int, rounds: int,
             elif picks_left > empty_stream + 2:
                 w *= 0.02                                  # too early to stream
         elif pos == "QB":
-            if team.count("QB") >= 1:
+            if n_qb >= 1:
                 w *= 0.02 if rnd < 12 else 0.3
             else:
-                m, tag = _prior_mult(prof, pos, rnd, team)
+                m, tag = _prior_mult(prof, pos, rnd, 0)
                 w *= m
                 if tag:
                     why = tag
-        elif pos == "TE" and team.count("TE") >= 1:
+        elif pos == "TE" and counts.get("TE", 0) >= 1:
             w *= 0.15
         elif pos in ("RB", "WR"):
-            m, tag = _prior_mult(prof, pos, rnd, team)
+            m, tag = _prior_mult(prof, pos, rnd, n_qb)
             w *= m
             if tag:
                 why = tag
-            if pos not in open_s and "FLEX" not in open_s and team.count(pos) >= 6:
+            if pos not in open_set and not flex_open and counts.get(pos, 0) >= 6:
                 w *= 0.2
             # mild run-following: humans chase a hot position
-            h = heat.get(pos, 1.0)
-            if h >= 1.8:
+            if pos not in heat:
+                heat[pos] = heat_of(pos)
+            if heat[pos] >= 1.8:
                 w *= 1.25
                 why = f"chasing the {pos} run"
-        if pos in open_s or (pos in ("RB", "WR", "TE") and "FLEX" in open_s):
-            if picks_left <= team.n_empty():
+        if pos in open_set or (flex_open and pos in ("RB", "WR", "TE")):
+            if endgame:
                 w *= 3.0                                    # endgame: must fill starters
                 why = f"forced fill: open {pos}"
-            elif pos in open_s and pos in ("RB", "WR", "TE", "QB"):
+            elif pos in open_set and pos in ("RB", "WR", "TE", "QB"):
                 why = f"fills open {pos}"
         out.append((c, max(w, 1e-6), why))
     return out
 
 
+def candidates(team: TeamState, avail: list[dict], rnd: int, rounds: int,
+               prof: dict | None = None, picks_log: list[dict] | None = None,
+               teams: int = 10, window: int = 12) -> list[tuple[dict, float, str]]:
+    """The pick distribution for one opponent: [(player_row, weight, why)]."""
+    heat = run_heat(picks_log or [], teams)
+    by_adp = sorted(range(len(avail)), key=lambda i: _f(avail[i].get("adp"), 999))
+
+    def best_at(pos, n):
+        """Best available at a position by projected league points (ADP-blind — most
+        IDP and some late K carry no ADP at all, so an ADP window never surfaces them)."""
+        at = [i for i, r in enumerate(avail) if r["pos"] == pos]
+        at.sort(key=lambda i: -(_f(avail[i].get("league_pts")) or _f(avail[i].get("points")) or 0))
+        return at[:n]
+
+    def why_of(i):
+        adp = _f(avail[i].get("adp"))
+        return f"ADP {adp:.0f}" if adp else "best at need"
+
+    cw = _weigh(by_adp[:window], team, _pos_counts(team), rnd, rounds, prof, window,
+                pos_of=[r["pos"] for r in avail], best_at=best_at, why_of=why_of,
+                heat_of=lambda pos: heat.get(pos, 1.0))
+    return [(avail[i], w, why) for i, w, why in cw]
+
+
 def pick_one(team: TeamState, avail: list[dict], rnd: int, rounds: int,
              rng: random.Random, prof: dict | None = None,
              picks_log: list[dict] | None = None, teams: int = 10) -> tuple[dict, str]:
@@ -246,20 +309,162 @@ def predict(team: TeamState, avail: list[dict], rnd: int, rounds: int,
             for c, w, y in ranked]
 
 
+def team_profiles(team_order: list[str], profiles: dict | None = None,
+                  alias_map: dict | None = None) -> dict[str, dict | None]:
+    """UI team name -> manager profile (None when the alias map can't resolve it)."""
+    prof_of = {}
+    for nm in team_order or []:
+        owner = (alias_map or {}).get(nm)
+        prof_of[nm] = (profiles or {}).get(owner) if owner else None
+    return prof_of
+
+
+def _orders(board) -> dict:
+    """Board-only orderings Room walks — candidates()'s two sort keys, precomputed."""
+    rows = board.rows
+    adp_key = [_f(r.get("adp"), 999) for r in rows]
+    pts_key = [-(_f(r.get("league_pts")) or _f(r.get("points")) or 0) for r in rows]
+    by_pos: dict[str, list[int]] = {}
+    for i in sorted(range(len(rows)), key=pts_key.__getitem__):       # stable: board order on ties
+        by_pos.setdefault(board.pos[i], []).append(i)
+    return {"adp_order": sorted(range(len(rows)), key=adp_key.__getitem__),
+            "by_pos": by_pos,
+            "why": [f"ADP {a:.0f}" if (a := _f(r.get("adp"))) else "best at need" for r in rows]}
+
+
+def replay(board, picks_log: list[dict], team_order: list[str]) -> tuple[list[bool], dict[str, TeamState]]:
+    """build_state() on a board_store.Board: (availability mask over board rows,
+    per-team states). Same row resolution — logged position first, then name-only."""
+    rows = board.rows
+    states = {nm: TeamState(nm) for nm in team_order}
+    drafted = set()
+    for pk in picks_log or []:
+        nm = pk.get("name")
+        drafted.add(nm)
+        t = pk.get("team")
+        named = board.indices_named(nm)
+        want = normalize_pos(pk.get("pos")) if pk.get("pos") else None
+        row = (next((rows[i] for i in named if want and rows[i]["pos"] == want), None)
+               or (rows[named[0]] if named else {"name": nm, "pos": want or "IDP", "adp": None}))
+        if t in states:
+            states[t].place(row)
+    return [r["name"] not in drafted for r in rows], states
+
+
+class Room:
+    """The simulation kernel: one room's availability, rosters and recent picks,
+    advanced a pick at a time. `avail` is any bool sequence over board.rows (copied);
+    `states` are used in place (pass copies). See the module docstring."""
+
+    def __init__(self, board, avail, states: dict[str, TeamState], picks_log: list[dict],
+                 teams: int = 10, rounds: int = 18):
+        o = board.cached("opponent_ai", _orders)
+        self.rows, self.pos = board.rows, board.pos
+        self._adp_order, self._by_pos, self._why = o["adp_order"], o["by_pos"], o["why"]
+        self.avail = bytearray(bool(a) for a in avail)
+        self.left = sum(self.avail)
+        self._heads = {"ADP": 0, **dict.fromkeys(self._by_pos, 0)}
+        self.states = states
+        self.counts: dict[str, dict[str, int]] = {}
+        for nm in states:
+            self._count_team(nm)
+        self.teams, self.rounds = teams, rounds
+        self._recent = deque(maxlen=2 * teams)
+        self._heat: dict[str, int] = {}
+        for pk in (picks_log or [])[-2 * teams:]:
+            self._push(normalize_pos(pk.get("pos") or pk.get("position")))
+
+    def _count_team(self, name: str) -> None:
+        self.counts[name] = _pos_counts(self.states[name])
+
+    def _push(self, pos: str) -> None:
+        if len(self._recent) == self._recent.maxlen:
+            self._heat[self._recent[0]] -= 1
+        self._recent.append(pos)
+        self._heat[pos] = self._heat.get(pos, 0) + 1
+
+    def heat(self, pos: str) -> float:
+        """run_heat(log, teams).get(pos, 1.0), from the rolling window."""
+        n = len(self._recent)
+        cnt = self._heat.get(pos, 0)
+        if not cnt:
+            return 1.0
+        base = BASE_SHARE.get(pos, 0.10)
+        return round((cnt / n) / base, 2) if base else 0.0
+
+    def team(self, name: str) -> TeamState:
+        if name not in self.states:
+            self.states[name] = TeamState(name)
+            self._count_team(name)
+        return self.states[name]
+
+    def _first(self, order: list[int], head: str, n: int) -> list[int]:
+        """The first `n` available indices in `order`; the head cursor only moves forward."""
+        av, end = self.avail, len(order)
+        h = self._heads[head]
+        while h < end and not av[order[h]]:
+            h += 1
+        self._heads[head] = h
+        out = []
+        for j in range(h, end):
+            if av[order[j]]:
+                out.append(order[j])
+                if len(out) == n:
+                    break
+        return out
+
+    def best_at(self, pos: str, n: int = 2) -> list[int]:
+        return self._first(self._by_pos[pos], pos, n) if pos in self._by_pos else []
+
+    def candidates(self, name: str, rnd: int, prof: dict | None = None,
+                   window: int = 12) -> list[tuple[int, float, str]]:
+        """candidates() for team `name`, as [(row index, weight, why)]."""
+        team = self.team(name)
+        return _weigh(self._first(self._adp_order, "ADP", window), team, self.counts[name],
+                      rnd, self.rounds, prof, window, pos_of=self.pos, best_at=self.best_at,
+                      why_of=self._why.__getitem__, heat_of=self.heat)
+
+    def pick(self, name: str, rnd: int, rng: random.Random,
+             prof: dict | None = None) -> tuple[int, str]:
+        """pick_one(): one weighted draw → (row index, why). Does not take the player."""
+        cw = self.candidates(name, rnd, prof)
+        k = rng.choices(range(len(cw)), weights=[w for _, w, _ in cw], k=1)[0]
+        return cw[k][0], cw[k][2]
+
+    def take(self, i: int, name: str) -> None:
+        """Row `i` goes to team `name`: roster, counts, availability, run window."""
+        row = self.rows[i]
+        self.team(name).place(row)
+        c = self.counts[name]
+        c[row["pos"]] = c.get(row["pos"], 0) + 1
+        self.avail[i] = 0
+        self.left -= 1
+        self._push(normalize_pos(row["pos"]))
+
+
 def simulate(board_rows: list[dict], picks_log: list[dict], team_order: list[str],
              overall_pick: int, my_slot: int, teams: int = 10, rounds: int = 18,
              profiles: dict | None = None, alias_map: dict | None = None,
              seed: int | None = None, stop_at_my_pick: bool = True) -> dict:
     """Play the room forward from `overall_pick`. Stops when the user's seat is up
     (or the draft ends). Returns the picks it made, each with a one-line why."""
+    board = board_store.board_for(board_rows)
+    avail, states = replay(board, picks_log, team_order)
+    return play(board, avail, states, picks_log, team_order, overall_pick, my_slot, teams,
+                rounds, team_profiles(team_order, profiles, alias_map), seed, stop_at_my_pick)
+
+
+def play(board, avail, states: dict[str, TeamState], picks_log: list[dict],
+         team_order: list[str], overall_pick: int, my_slot: int, teams: int = 10,
+         rounds: int = 18, prof_of: dict | None = None, seed: int | None = None,
+         stop_at_my_pick: bool = True) -> dict:
+    """simulate()'s loop over an already-built state: `avail` a bool mask over
+    board.rows, `states` consumed (pass copies — models/draft_session.py hands in
+    its live state this way)."""
     rng = random.Random(seed if seed is not None else overall_pick * 7919)
-    avail, states, _drafted = build_state(board_rows, picks_log, team_order, teams)
-    prof_of = {}
-    for nm in team_order:
-        owner = (alias_map or {}).get(nm)
-        prof_of[nm] = (profiles or {}).get(owner) if owner else None
-
-    log = list(picks_log or [])
+    prof_of = prof_of or {}
+    room = Room(board, avail, states, picks_log, teams, rounds)
+    rows = board.rows
     made = []
     p = overall_pick
     last = rounds * teams
@@ -268,18 +473,15 @@ def simulate(board_rows: list[dict], picks_log: list[dict], team_order: list[str
         if stop_at_my_pick and seat == my_slot:
             break
         name = team_order[seat - 1] if seat - 1 < len(team_order) else f"Seat{seat}"
-        team = states.setdefault(name, TeamState(name))
         rnd = (p - 1) // teams + 1
-        if not avail:
+        if not room.left:
             break
-        chosen, why = pick_one(team, avail, rnd, rounds, rng, prof_of.get(name), log, teams)
-        team.place(chosen)
-        avail.remove(chosen)
-        entry = {"overall": p, "team": name, "seat": seat, "round": rnd,
-                 "name": chosen["name"], "pos": chosen["pos"], "why": why,
-                 "playerId": chosen.get("playerId")}
-        made.append(entry)
-        log.append(entry)
+        i, why = room.pick(name, rnd, rng, prof_of.get(name))
+        room.take(i, name)
+        chosen = rows[i]
+        made.append({"overall": p, "team": name, "seat": seat, "round": rnd,
+                     "name": chosen["name"], "pos": chosen["pos"], "why": why,
+                     "playerId": chosen.get("playerId")})
         p += 1
     return {"picks": made, "nextPick": p, "done": p > last}
 
@@ -314,3 +516,28 @@ if __name__ == "__main__":     # python models/opponent_ai.py — quick self-tes
             print(f"  PROBLEM {nm}: empty={empty} doubled={dbl}")
     print(f"\nfull 18-round sim: {len(res2['picks'])} picks; "
           f"{'ALL 10 ROSTERS LEGAL' if not bad else f'{bad} bad rosters'}")
+
+    # the Room kernel must draw exactly what the list-based reference draws
+    import time
+    for seed in range(6):
+        avail, states, _ = build_state(rows, [], order, 10)
+        rng, log = random.Random(seed), []
+        for p in range(1, 181):
+            nm = order[slot_for_pick(p, 10) - 1]
+            chosen, why = pick_one(states[nm], avail, (p - 1) // 10 + 1, 18, rng,
+                                   team_profiles(order, profiles, aliases)[nm], log, 10)
+            states[nm].place(chosen)
+            avail.remove(chosen)
+            log.append({"name": chosen["name"], "pos": chosen["pos"], "why": why})
+        kern = simulate(rows, [], order, 1, 0, profiles=profiles, alias_map=aliases,
+                        seed=seed, stop_at_my_pick=False)["picks"]
+        assert [(k["name"], k["pos"], k["why"]) for k in kern] == \
+            [(r["name"], r["pos"], r["why"]) for r in log], f"kernel diverged (seed {seed})"
+    board = board_store.board_for(rows)
+    t0 = time.perf_counter()
+    for seed in range(50):
+        play(board, [True] * len(board), {nm: TeamState(nm) for nm in order}, [], order, 1, 0,
+             prof_of=team_profiles(order, profiles, aliases), seed=seed, stop_at_my_pick=False)
+    print(f"kernel matches the reference; full 180-pick room in "
+          f"{(time.perf_counter() - t0) / 50 * 1000:.1f}ms")
+    print("SELF-TEST PASSED" if not bad else "SELF-TEST FAILED")
@@ -8,17 +8,15 @@ Run: python models/opponent_profiles.py
 """
 from __future__ import annotations
 
-import glob
 import json
-import os
 from pathlib import Path
 
 import pandas as pd
 
+import espn_store
 from backtest import load_picks  # reuse the draft<->actuals join
 
 ROOT = Path(__file__).resolve().parents[1]
-RAW = ROOT / "data" / "raw" / "espn"
 PROC = ROOT / "data" / "processed"
 CFG = json.loads((ROOT / "data" / "league_config.json").read_text(encoding="utf-8"))
 DEPARTING = set(CFG["2026"].get("departing_owners", []))
@@ -31,11 +29,7 @@ TENDENCY_SINCE = 2019
 
 
 def standings_all() -> pd.DataFrame:
-    frames = []
-    for f in sorted(glob.glob(str(RAW / "*" / "standings.csv"))):
-        year = int(os.path.basename(os.path.dirname(f)))
-        s = pd.read_csv(f); s["year"] = year; frames.append(s)
-    s = pd.concat(frames, ignore_index=True)
+    s = espn_store.load("standings")
     s["final_standing"] = s["final_standing"].fillna(s["reg_season_standing"])
     return s
 
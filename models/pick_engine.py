@@ -21,18 +21,26 @@ Graceful by default: "who picks before me / what they need" is pure snake math o
 the live pick log with ZERO manager-profile data. Profiles add an optional
 confidence-weighted prior only once data/team_aliases.json resolves UI names.
 
+Scoring is one NumPy pass over the available pool: position ranks, the ADP queue,
+survival, flat detection and pickNowValue are array ops, and the board-only inputs
+are typed once per board version (models/board_store.py). wheel/tournament call
+shortlist dozens to hundreds of times per request, so this is their inner loop.
+
 Pure / deterministic. Run `python models/pick_engine.py` for a self-test.
 """
 from __future__ import annotations
 
 import json
-import math
 from collections import Counter
 from pathlib import Path
 
+import numpy as np
+
 try:  # works both as `python models/pick_engine.py` and `from models import pick_engine`
+    import board_store
     from value_engine import League, rank_board, picks_until_next, survival, normalize_pos
 except ImportError:  # pragma: no cover
+    from models import board_store
     from models.value_engine import League, rank_board, picks_until_next, survival, normalize_pos
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -78,11 +86,6 @@ def _f(x):
         return None
 
 
-def _pts(r) -> float:
-    v = r.get("points")
-    return float(v) if isinstance(v, (int, float)) else 0.0
-
-
 def _norm_name(s) -> str:
     return "".join(ch for ch in str(s or "").lower() if ch.isalnum())
 
@@ -196,20 +199,52 @@ def run_heat(picks_log: list[dict], teams: int) -> dict:
     return heat
 
 
+def _board_arrays(board) -> dict:
+    """Board-only inputs to shortlist's scoring pass, typed once per board version
+    (board_store memoizes this per snapshot, so a live pick only pays the array math)."""
+    lp, pt = board.col("league_pts"), board.col("points")
+    adp, ecr = board.col("adp"), np.trunc(board.col("ecr"))
+    pos = np.array(board.pos, dtype=str)
+    pos_names = sorted(set(board.pos))
+    ecr_int = np.where(np.isnan(ecr) | (ecr == 0), np.nan, ecr)
+    return {
+        "pos": pos, "pos_names": pos_names,
+        "pos_code": np.array([pos_names.index(p) for p in board.pos], dtype=np.int64),
+        "pts": np.where(np.isnan(lp) | (lp == 0), np.nan_to_num(pt), lp),
+        "adp": adp,
+        "vorp": np.nan_to_num(board.col("vorp")),
+        "val": np.nan_to_num(board.col("draft_value")),
+        # market sort key: expert rank, else adp, else last
+        "mkt_missing": np.isnan(ecr_int) & np.isnan(adp),
+        "mkt_val": np.where(np.isnan(ecr_int), np.nan_to_num(adp, nan=1e9), ecr_int),
+        # ADP-queue sort key: a blank (or zero) adp queues behind every real one
+        "adpq_val": np.where(np.isnan(adp) | (adp == 0), 99999.0, adp),
+        "tier_size": np.array([TIER_SIZE.get(p, 6) for p in board.pos], dtype=np.int64),
+        "stream": np.isin(pos, sorted(STREAM)),
+        "kdst": np.isin(pos, ["K", "DST"]),
+    }
+
+
 def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log: list[dict],
               overall_pick: int, teams: int = 10, team_order: list[str] | None = None,
               team_rosters: dict | None = None, my_slot: int | None = None, rounds: int = 18,
               bench: list | None = None, profiles: dict | None = None,
-              alias_map: dict | None = None, top: int = 12) -> dict:
-    """Primary entry. Returns {shortlist, anchor, flat, intervening, meta}. Deterministic."""
+              alias_map: dict | None = None, top: int = 12,
+              available: np.ndarray | None = None) -> dict:
+    """Primary entry. Returns {shortlist, anchor, flat, intervening, meta}. Deterministic.
+    `available` — a bool mask over board_rows kept live by models/draft_session.py —
+    replaces the drafted_names match when given."""
     league = league_2026()
-    drafted = {_norm_name(n) for n in (drafted_names or [])}
-    pool = []
-    for r in board_rows:
-        if _norm_name(r.get("name")) in drafted:
-            continue
-        pool.append({**r, "points": _f(r.get("league_pts")) or _f(r.get("points")) or 0.0,
-                     "position": r.get("pos") or r.get("position"), "adp": _f(r.get("adp"))})
+    board = board_store.board_for(board_rows)
+    B = board.cached("pick_engine", _board_arrays)
+    if available is not None:
+        avail = available
+    else:
+        avail = np.ones(len(board), dtype=bool)
+        for n in (drafted_names or []):
+            for i in board.indices_of(_norm_name(n)):
+                avail[i] = False
+    idx = np.flatnonzero(avail)                  # available rows, in board order
     gap = picks_until_next(overall_pick, teams)
     next_pick = overall_pick + gap
     # at the snake turn you pick back-to-back, then wait — use the gap to the pick AFTER
@@ -221,47 +256,39 @@ def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log:
     meta = {"nextPick": next_pick, "picksUntilNext": gap,
             "nextTurnPick": overall_pick + horizon, "backToBack": gap == 1,
             "round": (overall_pick - 1) // teams + 1}
-    if not pool:
+    if not idx.size:
         return {"shortlist": [], "anchor": None, "flat": False, "intervening": [], "meta": meta}
 
     # Use the board's (full-pool, CORRECT) vorp + draft_value. Re-running rank_board on
     # only the remaining pool would recompute replacement against a depleted pool and
     # INFLATE vorp. We compute survival / scarcity / tiers live; value stays the board's.
-    ranked = [{
-        "name": p.get("name"), "team": p.get("team"),
-        "pos": normalize_pos(p.get("position")), "points": p["points"],
-        "adp": p.get("adp"), "vorp": _f(p.get("vorp")) or 0.0, "val": _f(p.get("draft_value")) or 0.0,
-        "ecr": (int(_f(p.get("ecr"))) if _f(p.get("ecr")) else None),
-        "sos": (int(_f(p.get("sos"))) if _f(p.get("sos")) else None),
-    } for p in pool]
-
-    pos_groups: dict[str, list] = {}
-    for r in ranked:
-        pos_groups.setdefault(r["pos"], []).append(r)
-    pts_rank, adp_rank, cliff_by = {}, {}, {}
-    for pos, lst in pos_groups.items():
-        by_pts = sorted(lst, key=lambda x: -_pts(x))
-        for i, r in enumerate(by_pts):
-            pts_rank[id(r)] = i + 1
-            nxt = _pts(by_pts[i + 1]) if i + 1 < len(by_pts) else _pts(r)
-            cliff_by[id(r)] = round(_pts(r) - nxt, 2)        # drop to the next available at pos
-        # ceiling_proxy's market rank comes from HONEST market data: FP consensus ADP,
-        # then expert rank, then the raw adp column LAST — SportsData's skill ADP is
-        # junk-compressed (camp bodies at "pick 60"), and ranking on it made the
-        # flatten-rescue's upside term noise exactly in the dart zone it serves.
-        # (IDP/K/DST rows have no fp_adp/ecr, so they still rank on `adp` — which for
-        # IDP is the league-derived market curve, the correct price.)
-        def _mkt(x):
-            v = x.get("fp_adp") or x.get("ecr") or x.get("adp")
-            try:
-                return (v is None, float(v) if v is not None else 1e9)
-            except (TypeError, ValueError):
-                return (True, 1e9)
-        for i, r in enumerate(sorted(lst, key=_mkt)):
-            adp_rank[id(r)] = i + 1
-    adp_queue = {}   # 0-indexed position in the GLOBAL ADP queue among AVAILABLE players
-    for i, r in enumerate(sorted(ranked, key=lambda x: (x.get("adp") is None, x.get("adp") or 99999))):
-        adp_queue[id(r)] = i
+    # Everything below is one array pass over the available pool (index-aligned with idx).
+    n = idx.size
+    pos, code = B["pos"][idx], B["pos_code"][idx]
+    pts, adp, vorp, val = B["pts"][idx], B["adp"][idx], B["vorp"][idx], B["val"][idx]
+    stream, kdst = B["stream"][idx], B["kdst"][idx]
+    ar = np.arange(n)
+
+    def _group_rank(order):
+        """1-based rank within position for a (position-major) stable sort order."""
+        c = code[order]
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = ar - np.searchsorted(c, c, side="left") + 1
+        return rank
+
+    o = np.lexsort((-pts, code))                 # per position, best projection first
+    pts_rank = _group_rank(o)
+    so = pts[o]
+    same = np.append(code[o][1:] == code[o][:-1], False)
+    cliff = np.empty(n)
+    cliff[o] = so - np.where(same, np.append(so[1:], 0.0), so)   # drop to the next available at pos
+    # ceiling_proxy's market rank: expert consensus rank first, the raw adp column
+    # LAST — SportsData's skill ADP is junk-compressed (camp bodies at "pick 60").
+    # (IDP/K/DST rows have no ecr, so they still rank on `adp` — which for IDP is
+    # the league-derived market curve, the correct price.)
+    adp_rank = _group_rank(np.lexsort((B["mkt_val"][idx], B["mkt_missing"][idx], code)))
+    adp_queue = np.empty(n, dtype=np.int64)      # 0-indexed position in the GLOBAL ADP queue
+    adp_queue[np.lexsort((B["adpq_val"][idx], np.isnan(adp)))] = ar
 
     rs = roster_state(my_roster)
     openStarter, flexOpen, filled = rs["openStarter"], rs["flexOpen"], rs["filled"]
@@ -277,18 +304,15 @@ def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log:
     else:
         my_picks_left = max(1, rounds - meta["round"] + 1)
     stream_late = my_picks_left <= empty_stream   # prioritize streamers only when out of slack picks
-    startable_depth: dict[str, int] = {}
-    for r in ranked:
-        if r["vorp"] > 0:
-            startable_depth[r["pos"]] = startable_depth.get(r["pos"], 0) + 1
+    startable_depth: dict[str, int] = dict(Counter(pos[vorp > 0].tolist()))
 
     interv = intervening_teams(overall_pick, teams, gap, team_order or [], team_rosters or {},
                                my_slot, profiles, alias_map)
     demand: dict[str, float] = {}
     for t in interv:
         prof = t.get("_prof")
-        for pos in t["needs"]:                       # weight by each manager's tendency (1.0 if unmapped)
-            demand[pos] = demand.get(pos, 0) + profile_prior(prof, pos)
+        for p in t["needs"]:                         # weight by each manager's tendency (1.0 if unmapped)
+            demand[p] = demand.get(p, 0) + profile_prior(prof, p)
     heat = run_heat(picks_log, teams)
 
     # IDP is market-timed, not streamed. The room's 7 draft histories put the first
@@ -296,8 +320,8 @@ def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log:
     # holds IDP as "cheap later" — until the market window (best available IDP's
     # league-derived ADP, models/espn_proj.market_adp) closes on the trip to your
     # next pick. Then it acts like any scarce open starter.
-    _idp_best_adp = min((r["adp"] for r in ranked
-                         if r["pos"] == "IDP" and r.get("adp") is not None), default=None)
+    _idp_adp = adp[(pos == "IDP") & ~np.isnan(adp)]
+    _idp_best_adp = float(_idp_adp.min()) if _idp_adp.size else None
     idp_window_closing = (_idp_best_adp is not None
                           and (_idp_best_adp - overall_pick) <= horizon)
 
@@ -332,57 +356,49 @@ def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log:
             base *= DEPTH_DECAY.get(pos, 0.4) ** (have - keep)
         return base
 
-    def base_survival(r) -> float:
-        # conditional on being available NOW: over `horizon` more picks, ~the top `horizon`
-        # available players (by ADP) get taken; you survive if your queue position is deeper.
-        z = 0.4 * (adp_queue.get(id(r), len(ranked)) - horizon)
-        if z > 30:
-            return 1.0
-        if z < -30:
-            return 0.0
-        return 1.0 / (1.0 + math.exp(-z))
-
-    def adj_survival(r) -> float:
-        base = base_survival(r)
-        pos = r["pos"]
+    def surv_factor(pos: str) -> float:
         pressure = demand.get(pos, 0) / max(1, gap)        # upcoming picks needing this pos
         rh = max(0.0, heat.get(pos, 1.0) - 1.0)            # live run heat above baseline
-        factor = max(0.02, 1.0 - 0.5 * pressure - 0.12 * rh)
-        return max(0.0, min(1.0, base * factor))
-
-    def ceiling_proxy(r) -> float:    # market (ADP) ranks them above their raw points -> upside
-        return (pts_rank.get(id(r), 99) - adp_rank.get(id(r), 99))
-
-    def tier_cliff(r) -> float:   # only EARLY-tier cliffs matter; deep-tier "cliffs" are noise
-        pr = pts_rank.get(id(r), 1)
-        t = tier_for(r["pos"], pr)
-        return 1.0 if (t <= 3 and t < tier_for(r["pos"], pr + 1)) else 0.0
+        return max(0.02, 1.0 - 0.5 * pressure - 0.12 * rh)
 
     def run_term(pos: str) -> float:
         return max(0.0, min(1.0, heat.get(pos, 0.0) - 1.0))
 
-    def need_fit(r) -> float:
-        if openStarter.get(r["pos"], 0) > 0:
+    def need_fit(pos: str) -> float:
+        if openStarter.get(pos, 0) > 0:
             # an empty K/DST/IDP slot earns full fill-credit only once it's actually time
             # to stream — until then a 100%-survival kicker must not outscore skill depth.
-            if r["pos"] in STREAM and not stream_late:
+            if pos in STREAM and not stream_late:
                 return 0.12
             return 1.0
-        if r["pos"] in FLEX_ELIG and flexOpen > 0:
-            return 0.5 if r["pos"] in ("RB", "WR") else 0.2   # TE ~never starts in flex here
+        if pos in FLEX_ELIG and flexOpen > 0:
+            return 0.5 if pos in ("RB", "WR") else 0.2   # TE ~never starts in flex here
         return 0.15
 
-    def reach_penalty(r) -> float:
-        # demote (NEVER hide) players drafted well before their ADP, scaled by how early —
-        # keeps a deep scrub from anchoring while still surfacing real late-round flier options.
-        a = r.get("adp")
-        reach = (a - overall_pick) if a else 30
-        return 1.0 if reach <= 20 else max(0.15, 1.0 - (reach - 20) / 120.0)
+    def per_pos(fn) -> np.ndarray:          # every term above depends on position alone
+        return np.array([fn(p) for p in B["pos_names"]], dtype=float)[code]
+
+    nm = per_pos(need_mult)
+    # survival: conditional on being available NOW, over `horizon` more picks ~the top
+    # `horizon` available players (by ADP) get taken; you survive if your queue position
+    # is deeper. Then discounted by upcoming positional demand and live run heat.
+    z = 0.4 * (adp_queue - horizon)
+    surv = np.where(z > 30, 1.0, np.where(z < -30, 0.0, 1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))))
+    adjs = np.clip(surv * per_pos(surv_factor), 0.0, 1.0)
+    # ceiling proxy: the market (ADP) ranks them above their raw points -> upside
+    ceil = (pts_rank - adp_rank).astype(float)
+    # only EARLY-tier cliffs matter; deep-tier "cliffs" are noise
+    tier = 1 + (pts_rank - 1) // B["tier_size"][idx]
+    tcliff = ((tier <= 3) & (tier < 1 + pts_rank // B["tier_size"][idx])).astype(float)
+    # demote (NEVER hide) players drafted well before their ADP, scaled by how early —
+    # keeps a deep scrub from anchoring while still surfacing real late-round flier options.
+    reach = np.where(np.isnan(adp) | (adp == 0), 30.0, adp - overall_pick)
+    reach_pen = np.where(reach <= 20, 1.0, np.maximum(0.15, 1.0 - (reach - 20) / 120.0))
 
     # flatten detection over the need-eligible candidates
-    elig = [r for r in ranked if need_mult(r["pos"]) > 0]
-    top_vorps = sorted((r["vorp"] for r in elig), reverse=True)[:8]
-    flat = (len(top_vorps) >= 2 and (top_vorps[0] - top_vorps[-1]) < 3.0)
+    elig = nm > 0
+    top_vorps = np.sort(vorp[elig])[::-1][:8]
+    flat = bool(top_vorps.size >= 2 and (top_vorps[0] - top_vorps[-1]) < 3.0)
 
     # A 2nd TE's board VORP is measured against TE replacement (TE11) — but with the
     # TE starter filled his only landing spot is FLEX, where the real alternative is
@@ -390,113 +406,106 @@ def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log:
     # 11.4 pts/wk LOSES to the RB20/WR20 (12.6/12.2) you'd start instead. So a
     # flex-only TE's value is capped at the best available RB/WR's value — he can
     # ride the shortlist, never anchor over the flex alternative he'd displace.
-    _rbwr_val_cap = max((r["val"] for r in ranked if r["pos"] in ("RB", "WR")), default=None)
+    _rbwr = val[(pos == "RB") | (pos == "WR")]
+    val_used = val
+    if _rbwr.size and openStarter.get("TE", 0) == 0:
+        val_used = np.where(pos == "TE", np.minimum(val, _rbwr.max()), val)   # flex-only TE
 
-    def _mk_norm(vals):
-        if not vals:
-            return lambda x: 0.0
-        lo, hi = min(vals), max(vals)
-        return (lambda x: 0.0 if hi == lo else (x - lo) / (hi - lo))
     # normalize value over the TOP band (not the whole eligible pool) so deep-negative bench
     # depth can't compress the top tier — keeps Bijan >> a tier-cliff TE at pick 1.
-    _vals = sorted((r["val"] for r in elig), reverse=True)
-    _hi = _vals[0] if _vals else 1.0
-    _lo = _vals[min(len(_vals) - 1, 23)] if _vals else 0.0
-    n_val = (lambda x: 0.0 if _hi <= _lo else max(0.0, min(1.0, (x - _lo) / (_hi - _lo))))
-    n_ceil = _mk_norm([ceiling_proxy(r) for r in elig])
-
-    for r in ranked:
-        nm = need_mult(r["pos"])
-        r["_nm"] = nm
-        if nm <= 0:
-            r["_pnv"] = -1.0
-            continue
-        adjs = adj_survival(r)
-        # tier-cliff / ceiling are skill-position signals; for streamers they're artifacts
-        # (a "tier 1 kicker cliff" is noise) — zero them so K/DST/IDP score on value+timing.
-        tcb = 0.0 if r["pos"] in STREAM else tier_cliff(r)
-        # A kicker/defense's preseason VORP is fiction — you stream the best matchup weekly,
-        # so replacement ≈ equal and their DRAFT value is ~zero. Their pick is pure timing
-        # (need_fit × needMult in the final rounds). IDP keeps its (modest) real value —
-        # required starter; tackles 1.0 flat per commish ruling 2026-08-11.
-        val_used = r["val"]
-        if (r["pos"] == "TE" and openStarter.get("TE", 0) == 0
-                and _rbwr_val_cap is not None):
-            val_used = min(val_used, _rbwr_val_cap)     # flex-only TE: see cap comment above
-        val_term = 0.0 if r["pos"] in ("K", "DST") else n_val(val_used)
-        if flat:    # VORP is noise → ceiling / tier-cliff / runs / survival drive the pick
-            ceil_term = 0.0 if r["pos"] in STREAM else n_ceil(ceiling_proxy(r))
-            pnv = (0.34 * val_term + 0.22 * ceil_term
-                   + 0.15 * tcb + 0.17 * (1 - adjs) + 0.12 * run_term(r["pos"])
-                   + (0.12 * need_fit(r) if r["pos"] in ("K", "DST") else 0.0))
-        else:       # value-dominant: draft-VORP wins this league (validated +0.56)
-            pnv = (0.70 * val_term + 0.10 * tcb
-                   + 0.08 * (1 - adjs) + 0.12 * need_fit(r))
-        pr = pts_rank.get(id(r), 1)
-        # urgency (deterministic, server-authoritative)
-        if r["pos"] not in STREAM and openStarter.get(r["pos"], 0) > 0 and startable_depth.get(r["pos"], 0) <= horizon:
-            urg = "pick-now"   # streamers are never forced — their survival (≈1.0) decides → can-wait
-        elif adjs < 0.10:
-            urg = "pick-now"
-        elif adjs < 0.35:
-            urg = "lean-now"
-        elif adjs >= 0.65:
-            urg = "can-wait"
-        else:
-            urg = "lean-now"
-        fits = (r["pos"] if openStarter.get(r["pos"], 0) > 0
-                else ("FLEX" if (r["pos"] in FLEX_ELIG and flexOpen > 0) else "BENCH"))
-        why = (f"fills your open {r['pos']} starter" if openStarter.get(r["pos"], 0) > 0
-               else f"stream {r['pos']} late" if r["pos"] in STREAM
-               else "FLEX/upside depth" if fits == "FLEX" else "bench/upside")
-        r.update({
-            "_pnv": round(pnv * nm * reach_penalty(r), 4), "_tier": tier_for(r["pos"], pr),
-            "_adjS": round(adjs, 3), "_urg": urg, "_fits": fits, "_why": why,
-        })
+    _vals = np.sort(val[elig])[::-1]
+    _hi = _vals[0] if _vals.size else 1.0
+    _lo = _vals[min(_vals.size - 1, 23)] if _vals.size else 0.0
+    n_val = (np.zeros(n) if _hi <= _lo else np.clip((val_used - _lo) / (_hi - _lo), 0.0, 1.0))
+    _ceils = ceil[elig]
+    c_lo, c_hi = (_ceils.min(), _ceils.max()) if _ceils.size else (0.0, 0.0)
+    n_ceil = np.zeros(n) if c_hi == c_lo else (ceil - c_lo) / (c_hi - c_lo)
+
+    # tier-cliff / ceiling are skill-position signals; for streamers they're artifacts
+    # (a "tier 1 kicker cliff" is noise) — zero them so K/DST/IDP score on value+timing.
+    tcb = np.where(stream, 0.0, tcliff)
+    # A kicker/defense's preseason VORP is fiction — you stream the best matchup weekly,
+    # so replacement ≈ equal and their DRAFT value is ~zero. Their pick is pure timing
+    # (need_fit × needMult in the final rounds). IDP keeps its (modest) real value —
+    # required starter; tackles 1.0 flat per commish ruling 2026-08-11.
+    val_term = np.where(kdst, 0.0, n_val)
+    fit = per_pos(need_fit)
+    if flat:    # VORP is noise → ceiling / tier-cliff / runs / survival drive the pick
+        ceil_term = np.where(stream, 0.0, n_ceil)
+        pnv = (0.34 * val_term + 0.22 * ceil_term
+               + 0.15 * tcb + 0.17 * (1 - adjs) + 0.12 * per_pos(run_term)
+               + np.where(kdst, 0.12 * fit, 0.0))
+    else:       # value-dominant: draft-VORP wins this league (validated +0.56)
+        pnv = (0.70 * val_term + 0.10 * tcb
+               + 0.08 * (1 - adjs) + 0.12 * fit)
+    score = np.full(n, -1.0)
+    e = np.flatnonzero(elig)
+    score[e] = [round(x, 4) for x in (pnv * nm * reach_pen)[e].tolist()]
 
     # ---- shortlist selection: positionally diverse, not just top-N by score ----
-    ranked_elig = sorted((r for r in ranked if r.get("_pnv", -1) >= 0), key=lambda r: -r["_pnv"])
+    ranked_elig = e[np.argsort(-score[e], kind="stable")]
+    re_pos = pos[ranked_elig]
+    names = [board.rows[i].get("name") for i in idx.tolist()]
     seen, picked = set(), []
 
-    def _add(r):
-        if r["name"] not in seen:
-            seen.add(r["name"])
-            picked.append(r)
+    def _add(i):
+        if names[i] not in seen:
+            seen.add(names[i])
+            picked.append(int(i))
 
     need_positions = [p for p in ("QB", "RB", "WR", "TE") if openStarter.get(p, 0) > 0]
     if flexOpen > 0:
         need_positions += [p for p in FLEX_ELIG if p not in need_positions]
     need_positions += [p for p in ("IDP", "DST", "K") if need_mult(p) > 0]   # eligible streamers
-    for pos in need_positions:
-        n = 4 if pos in ("RB", "WR") else 3
-        for r in [x for x in ranked_elig if x["pos"] == pos][:n]:
-            _add(r)
-    for r in ranked_elig[:2]:   # global best-pick-now guard
-        _add(r)
-    for r in sorted(ranked_elig, key=lambda r: -r["vorp"])[:2]:   # elite value / fallers always surface
-        _add(r)
-    for pos in FLEX_ELIG:       # bench skill depth is ALWAYS on the menu (never K-by-forfeit)
-        for r in [x for x in ranked_elig if x["pos"] == pos][:2]:
-            _add(r)
-
-    picked.sort(key=lambda r: -r["_pnv"])
+    for p in need_positions:
+        for i in ranked_elig[re_pos == p][:4 if p in ("RB", "WR") else 3]:
+            _add(i)
+    for i in ranked_elig[:2]:   # global best-pick-now guard
+        _add(i)
+    for i in ranked_elig[np.argsort(-vorp[ranked_elig], kind="stable")][:2]:   # elite value / fallers always surface
+        _add(i)
+    for p in FLEX_ELIG:         # bench skill depth is ALWAYS on the menu (never K-by-forfeit)
+        for i in ranked_elig[re_pos == p][:2]:
+            _add(i)
+
+    picked.sort(key=lambda i: -score[i])
     out, stream_n, bench_n = [], 0, 0
-    for r in picked:
-        if r["pos"] in STREAM:
+    for i in picked:
+        p, a = str(pos[i]), float(adjs[i])
+        if p in STREAM:
             if stream_n >= 1:
                 continue
             stream_n += 1
-        if r["_nm"] == 0.55:
+        if nm[i] == 0.55:
             if bench_n >= 3:
                 continue
             bench_n += 1
+        # urgency (deterministic, server-authoritative)
+        if p not in STREAM and openStarter.get(p, 0) > 0 and startable_depth.get(p, 0) <= horizon:
+            urg = "pick-now"   # streamers are never forced — their survival (≈1.0) decides → can-wait
+        elif a < 0.10:
+            urg = "pick-now"
+        elif a < 0.35:
+            urg = "lean-now"
+        elif a >= 0.65:
+            urg = "can-wait"
+        else:
+            urg = "lean-now"
+        fits = (p if openStarter.get(p, 0) > 0
+                else ("FLEX" if (p in FLEX_ELIG and flexOpen > 0) else "BENCH"))
+        why = (f"fills your open {p} starter" if openStarter.get(p, 0) > 0
+               else f"stream {p} late" if p in STREAM
+               else "FLEX/upside depth" if fits == "FLEX" else "bench/upside")
+        row = board.rows[idx[i]]
+        ecr, sos = _f(row.get("ecr")), _f(row.get("sos"))
         out.append({
-            "name": r["name"], "position": r["pos"], "team": r.get("team"),
-            "proj": round(_pts(r)), "adp": r.get("adp"), "vorp": round(r["vorp"], 1),
-            "cliff": cliff_by.get(id(r)), "tier": r["_tier"], "survival": round(base_survival(r), 3),
-            "adjSurvival": r["_adjS"], "needMult": r["_nm"], "fits": r["_fits"],
-            "pickNowValue": r["_pnv"], "urgency": r["_urg"], "why": r["_why"],
-            "ecr": r.get("ecr"), "sos": r.get("sos"),
+            "name": names[i], "position": p, "team": row.get("team"),
+            "proj": round(float(pts[i])), "adp": None if np.isnan(adp[i]) else float(adp[i]),
+            "vorp": round(float(vorp[i]), 1), "cliff": round(float(cliff[i]), 2),
+            "tier": int(tier[i]), "survival": round(float(surv[i]), 3),
+            "adjSurvival": round(a, 3), "needMult": float(nm[i]), "fits": fits,
+            "pickNowValue": float(score[i]), "urgency": urg, "why": why,
+            "ecr": int(ecr) if ecr else None, "sos": int(sos) if sos else None,
         })
         if len(out) >= top:
             break
@@ -522,10 +531,7 @@ def shortlist(board_rows: list[dict], drafted_names, my_roster: dict, picks_log:
 # Self-test — `python models/pick_engine.py`
 # --------------------------------------------------------------------------- #
 if __name__ == "__main__":
-    import csv
-
-    path = ROOT / "data" / "processed" / "board_2026.csv"
-    rows = list(csv.DictReader(open(path, encoding="utf-8")))
+    rows = board_store.rows()
     print(f"loaded {len(rows)} board rows\n")
 
     # Simulate a value-drained mid-draft: top ~78 names gone, my team has its skill
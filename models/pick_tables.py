@@ -0,0 +1,247 @@
+"""Per-pick lookup tables — survival and next-available value for any pick and seat.
+
+value_engine.rank_board runs once at build time with overall_pick=1, so the
+survival / VONA it computes only ever described pick 1, and anything that wanted
+them at pick 73 for seat 4 had to re-run the math. Both depend on the pick only
+through two small numbers, so build_board precomputes them for the whole draft:
+
+  * survival[q, i]    P(row i still on the board at overall pick q) —
+                      value_engine.survival(adp, q), for every q a seat can be
+                      waiting on (picks 1..rounds*teams, plus the turn after).
+  * next_value[g, i]  league_pts of the player rank_board's VONA measures row i
+                      against when the seat picks again `g` picks later (the one
+                      ~g/len(positions) deeper at the position, on the full board).
+
+(pick, seat) maps to q = that seat's next pick after `pick` (`next_picks`, pure
+snake math) and g = q - pick, so every lookup is two index reads. The arrays are
+written next to the board as .npy files (data/processed/pick_*_2026.npy), each
+swapped in whole, and read whole on load (1.2MB — not memory-mapped, so a rebuild
+can replace them under a running API, Windows included); a small JSON sidecar
+fingerprints the board they were built from. When the files are missing or
+describe a different board, `get()` builds the same tables in memory instead —
+the answers never depend on which.
+
+Pure / no network. Run `python models/pick_tables.py` for a self-test.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+try:  # works both as `python models/pick_tables.py` and `from models import pick_tables`
+    import board_store
+    from value_engine import SURVIVAL_STEEPNESS
+except ImportError:  # pragma: no cover
+    from models import board_store
+    from models.value_engine import SURVIVAL_STEEPNESS
+
+ROOT = Path(__file__).resolve().parents[1]
+OUT_DIR = ROOT / "data" / "processed"
+META_PATH = OUT_DIR / "pick_tables_2026.json"
+SURVIVAL_PATH = OUT_DIR / "pick_survival_2026.npy"
+NEXT_VALUE_PATH = OUT_DIR / "pick_next_value_2026.npy"
+TEAMS, ROUNDS = 10, 18
+
+
+def seat_at(pick: int, teams: int = TEAMS) -> int:
+    """The seat (1..teams) on the clock at overall `pick` in a snake draft."""
+    r, k = (pick - 1) // teams, (pick - 1) % teams
+    return k + 1 if r % 2 == 0 else teams - k
+
+
+def next_picks(teams: int = TEAMS, rounds: int = ROUNDS) -> np.ndarray:
+    """[pick, seat] -> that seat's next overall pick after `pick` (1-indexed; row
+    and column 0 unused). Past the last round it keeps counting snake turns, so
+    the final picks still have a horizon."""
+    last = (rounds + 2) * teams
+    seat_of = np.zeros(last + 1, dtype=np.int64)
+    seat_of[1:] = [seat_at(q, teams) for q in range(1, last + 1)]
+    out = np.zeros((rounds * teams + 1, teams + 1), dtype=np.int16)
+    nxt = np.zeros(teams + 1, dtype=np.int64)
+    for p in range(last, 0, -1):          # walk back: nxt[s] = first pick > p for seat s
+        if p <= rounds * teams:
+            out[p] = nxt
+        nxt[seat_of[p]] = p
+    return out
+
+
+def fingerprint(names, pos, pts, adp) -> str:
+    """Identity of the board the tables describe (rows, positions, points, ADP)."""
+    h = hashlib.sha1()
+    for n, p, x, a in zip(names, pos, np.asarray(pts, dtype=float).tolist(),
+                          np.asarray(adp, dtype=float).tolist()):
+        h.update(f"{n}|{p}|{x!r}|{a!r}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def build(pos, pts, adp, teams: int = TEAMS, rounds: int = ROUNDS) -> dict[str, np.ndarray]:
+    """{survival [q, row], next_value [gap, row]} for rows in board order. `pts` is
+    league_pts (NaN = no projection, ranks last like rank_board's None); `adp`
+    NaN = no ADP (survival 0.5)."""
+    pos = np.asarray(pos, dtype=str)
+    pts = np.asarray(pts, dtype=float)
+    adp = np.asarray(adp, dtype=float)
+    n = pts.size
+    q = np.arange((rounds + 2) * teams, dtype=float)[:, None]
+    with np.errstate(over="ignore"):
+        surv = 1.0 / (1.0 + np.exp(-SURVIVAL_STEEPNESS * (adp[None, :] - q)))
+    surv = np.where(np.isnan(adp)[None, :], 0.5, surv).astype(np.float32)
+
+    # rank_board's VONA partner: the player `slide` deeper at the position, where
+    # slide = max(1, gap // len(positions)), on the positional sort it uses.
+    names = sorted(set(pos.tolist()))
+    gaps = np.arange(2 * teams)
+    slide = np.maximum(1, gaps // max(1, len(names)))
+    nv = np.zeros((2 * teams, n), dtype=np.float32)
+    val = np.nan_to_num(pts, nan=0.0)
+    for p in names:
+        ix = np.flatnonzero(pos == p)
+        ix = ix[np.lexsort((-val[ix], np.isnan(pts[ix])))]
+        rank = np.arange(ix.size)
+        partner = np.minimum(ix.size - 1, rank[None, :] + slide[:, None])
+        nv[:, ix] = val[ix][partner]
+    return {"survival": surv, "next_value": nv}
+
+
+def _board_inputs(board):
+    pts = board.col("league_pts")
+    return board.names, board.pos, pts, board.col("adp")
+
+
+def _replace(path: Path, save) -> None:
+    """save(tmp) into a scratch file beside `path`, then swap it in whole — a reader
+    opening `path` gets the old file or the new one, never a truncated one."""
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        save(tmp)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _save(path: Path, arr: np.ndarray) -> None:
+    with open(path, "wb") as f:      # a handle, so np.save doesn't append ".npy"
+        np.save(f, arr)
+
+
+def write(board, teams: int = TEAMS, rounds: int = ROUNDS) -> dict:
+    """Build and persist the tables for a freshly written board (build_board passes
+    the board_store snapshot of the CSV it just wrote, so the fingerprint is the
+    one every reader will compute). The sidecar goes first and comes back last: while
+    the arrays are being swapped no reader trusts them, it builds in memory instead."""
+    names, pos, pts, adp = _board_inputs(board)
+    t = build(pos, pts, adp, teams, rounds)
+    META_PATH.unlink(missing_ok=True)
+    for path, arr in ((SURVIVAL_PATH, t["survival"]), (NEXT_VALUE_PATH, t["next_value"])):
+        _replace(path, lambda tmp, arr=arr: _save(tmp, arr))
+    meta = {"rows": len(names), "teams": teams, "rounds": rounds,
+            "board": fingerprint(names, pos, pts, adp),
+            "survival": SURVIVAL_PATH.name, "nextValue": NEXT_VALUE_PATH.name}
+    _replace(META_PATH, lambda tmp: tmp.write_text(json.dumps(meta, indent=2) + "\n",
+                                                  encoding="utf-8"))
+    return meta
+
+
+class PickTables:
+    """The tables for one board snapshot. Row arrays are read-only views."""
+
+    def __init__(self, survival: np.ndarray, next_value: np.ndarray, pts: np.ndarray,
+                 teams: int, rounds: int, source: str):
+        self.survival_table = survival
+        self.next_value_table = next_value
+        self.pts = pts
+        self.teams, self.rounds = teams, rounds
+        self.source = source                   # "file" (build_board's .npy) or "memory"
+        self._next = next_picks(teams, rounds)
+
+    def next_pick(self, pick: int, seat: int) -> int:
+        return int(self._next[pick, seat])
+
+    def survival(self, pick: int, seat: int) -> np.ndarray:
+        """Every row's P(still there at `seat`'s next pick after `pick`)."""
+        return self.survival_table[self._next[pick, seat]]
+
+    def next_value(self, pick: int, seat: int) -> np.ndarray:
+        return self.next_value_table[self._next[pick, seat] - pick]
+
+    def vona(self, pick: int, seat: int) -> np.ndarray:
+        """league_pts over the next-available player at the position, per row."""
+        return self.pts - self.next_value(pick, seat)
+
+
+def _load(board, teams: int, rounds: int) -> PickTables:
+    names, pos, pts, adp = _board_inputs(board)
+    pts0 = np.nan_to_num(pts, nan=0.0).astype(np.float32)
+    t, source = None, "file"
+    try:            # read whole, not mmap'd: write() must be able to replace the files
+        meta = json.loads(META_PATH.read_text(encoding="utf-8"))
+        if (meta["rows"], meta["teams"], meta["rounds"]) == (len(board), teams, rounds) \
+                and meta["board"] == fingerprint(names, pos, pts, adp):
+            t = {"survival": np.load(OUT_DIR / meta["survival"]),
+                 "next_value": np.load(OUT_DIR / meta["nextValue"])}
+    except (OSError, ValueError, KeyError):
+        t = None
+    if t is None:
+        t, source = build(pos, pts, adp, teams, rounds), "memory"
+    for a in t.values():
+        a.setflags(write=False)
+    return PickTables(t["survival"], t["next_value"], pts0, teams, rounds, source)
+
+
+def get(board=None, teams: int = TEAMS, rounds: int = ROUNDS) -> PickTables:
+    """The tables for `board` (default: the stored board), once per snapshot."""
+    board = board if board is not None else board_store.get()
+    return board.cached(f"pick_tables:{teams}:{rounds}", lambda b: _load(b, teams, rounds))
+
+
+if __name__ == "__main__":     # python models/pick_tables.py — self-test
+    import time
+
+    try:
+        import value_engine as ve
+    except ImportError:  # pragma: no cover
+        from models import value_engine as ve
+
+    board = board_store.get()
+    t0 = time.perf_counter()
+    pt = get(board)
+    t1 = time.perf_counter()
+    print(f"{len(board)} rows, tables from {pt.source} in {(t1 - t0) * 1000:.1f}ms "
+          f"(survival {pt.survival_table.shape}, next value {pt.next_value_table.shape})")
+
+    if pt.source == "file":        # the persisted copy is exactly what build() makes
+        fresh = build(*_board_inputs(board)[1:])
+        assert np.array_equal(pt.survival_table, fresh["survival"])
+        assert np.array_equal(pt.next_value_table, fresh["next_value"])
+
+    # the snake map: seat 10 picks 10, 11, 30, 31 ...; seat 1 picks 1, 20, 21 ...
+    assert pt.next_pick(10, 10) == 11 and pt.next_pick(11, 10) == 30 and pt.next_pick(1, 1) == 20
+    assert pt.next_pick(5, 3) == 18 and pt.next_pick(180, 1) == 181
+    for p in (1, 7, 10, 55, 120, 179):
+        assert pt.next_pick(p, seat_at(p)) == p + ve.picks_until_next(p, 10)
+
+    # survival and VONA agree with rank_board run AT that pick (the full board)
+    players = [{"name": r["name"], "team": r["team"], "position": r["pos"],
+                "points": r["league_pts"], "adp": r["adp"]} for r in board.rows]
+    for p in (1, 37, 80):
+        seat = seat_at(p)
+        ranked = ve.rank_board(players, ve.League(teams=10), overall_pick=p)
+        want = {(r["name"], r["pos"], r["team"]): r for r in ranked}
+        surv, vona = pt.survival(p, seat), pt.vona(p, seat)
+        bad = sum(1 for i, r in enumerate(board.rows)
+                  if abs(round(float(surv[i]), 3) - want[(r["name"], r["pos"], r["team"])]["survival"]) > 1e-3
+                  or abs(float(vona[i]) - want[(r["name"], r["pos"], r["team"])]["vona"]) > 0.02)
+        print(f"  pick {p:>3} seat {seat:>2}: survival/vona mismatches vs rank_board: {bad}")
+        assert bad == 0
+
+    # O(1) lookups: a thousand (pick, seat) reads for one player
+    t0 = time.perf_counter()
+    for k in range(1000):
+        float(pt.survival(1 + k % 180, 1 + k % 10)[42])
+    print(f"  1000 survival lookups: {(time.perf_counter() - t0) * 1000:.2f}ms")
+    print("SELF-TEST PASSED")
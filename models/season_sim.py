@@ -19,7 +19,12 @@ Mid-draft, unfilled starter slots are filled with a realistic expectation: the
 k-th best player still available at that position, where k = half the teams that
 still need one (you won't get the best remaining; you won't get the worst).
 
-Pure numpy, ~1000 sims in well under a second. No LLM, no network.
+Pure numpy and fully batched — the schedule is index arrays and the bracket is
+resolved for every sim at once — so 50k sims cost what 1k used to. With `target_se`
+the count is adaptive (models/montecarlo.py): batches run until the title/playoff
+odds that matter are that tight, and every number ships with its 95% interval.
+compare() scores several versions of one roster on common random numbers, for
+"does this pick raise my title odds" questions. No LLM, no network.
 """
 from __future__ import annotations
 
@@ -30,8 +35,12 @@ import numpy as np
 import pandas as pd
 
 try:
+    import espn_store
+    import montecarlo
     from pick_engine import normalize_pos
 except ImportError:  # pragma: no cover
+    from models import espn_store
+    from models import montecarlo
     from models.pick_engine import normalize_pos
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -42,6 +51,12 @@ SEASON_WEEKS = 17            # projections are full-season totals
 SEASON_SHOCK = 0.08          # sd of the per-season draft-luck shock, as a share of mean
 STARTER_SLOTS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "FLEX", "IDP", "DST", "K"]
 FLEX_ELIG = ("RB", "WR", "TE")
+MAX_SIMS = 50_000
+LIVE_SE = 0.003              # /api/odds default target: 0.3pt standard error on the odds that matter
+LIVE_BUDGET_MS = 400
+FIRST_BATCH = 2_000          # adaptive runs start here
+COMPARE_SIMS = 10_000        # compare(): paired deltas need far fewer sims than two separate runs
+COMPARE_CHUNK = 2_000        # sims per vectorized chunk (memory ~ variants × chunk × weeks × teams)
 
 
 @functools.lru_cache(maxsize=1)
@@ -49,10 +64,8 @@ def weekly_sd() -> float:
     """Pooled within-team-season sd of real weekly scores in this league."""
     resids = []
     for yr in range(2019, 2026):
-        p = ROOT / "data" / "raw" / "espn" / str(yr) / "weekly_scores.csv"
-        if not p.exists():
-            continue
-        df = pd.read_csv(p)
+        df = espn_store.load("weekly_scores", years=[yr], add_year=False,
+                             columns=["team_id", "points", "is_regular", "is_bye"])
         df = df[df["is_regular"].astype(str).str.lower().eq("true")]
         df = df[~df["is_bye"].astype(str).str.lower().eq("true")]
         df = df[pd.to_numeric(df["points"], errors="coerce").notna()]
@@ -143,61 +156,166 @@ def schedule(n_teams: int, weeks: int = REG_WEEKS) -> list[list[tuple[int, int]]
     return [rounds[w % len(rounds)] for w in range(weeks)]
 
 
-def title_odds(team_rosters: dict[str, list[dict]], board_avail: list[dict],
-               pts_lookup, n_sims: int = 1000, seed: int = 2026) -> dict:
-    """{team: {title, playoff, expWins, weeklyMean}} via Monte Carlo.
-    `pts_lookup(name, pos)` -> season league points for a rostered player."""
-    teams = list(team_rosters.keys())
-    n = len(teams)
+def _per_sim_counts(idx: np.ndarray, n: int) -> np.ndarray:
+    """(sims × k) team indices -> (sims × n) occurrence counts, one bincount."""
+    sims = idx.shape[0]
+    flat = (idx + (np.arange(sims) * n)[:, None]).ravel()
+    return np.bincount(flat, minlength=sims * n).reshape(sims, n)
+
+
+def _means(team_rosters: dict, board_avail: list[dict], pts_lookup) -> np.ndarray:
+    """Per-week scoring mean for each team: best lineup + expected fills for the holes."""
     fills = fill_values(team_rosters, board_avail)
-    means = np.zeros(n)
-    for i, t in enumerate(teams):
-        total, empty = lineup_points(team_rosters[t], pts_lookup)
-        total += sum(fills.get(slot, 0.0) for slot in empty)   # expected future picks
-        means[i] = total / SEASON_WEEKS
+    out = np.zeros(len(team_rosters))
+    for i, players in enumerate(team_rosters.values()):
+        total, empty = lineup_points(players, pts_lookup)
+        out[i] = (total + sum(fills.get(slot, 0.0) for slot in empty)) / SEASON_WEEKS
+    return out
 
-    sd_w = weekly_sd()
-    rng = np.random.default_rng(seed)
+
+def _season(means: np.ndarray, sd_w: float, n_sims: int, rng) -> dict:
+    """One batch of seasons: {title, playoff} counts and summed wins, per team."""
+    n = len(means)
     shock = rng.normal(1.0, SEASON_SHOCK, size=(n_sims, n))      # draft luck / injuries
     sim_means = means[None, :] * shock
-    sched = schedule(n)
-    weekly = rng.normal(sim_means[:, None, :], sd_w,
-                        size=(n_sims, REG_WEEKS, n))             # sims × weeks × teams
-
-    wins = np.zeros((n_sims, n), dtype=np.int16)
-    for w, pairs in enumerate(sched):
-        for a, b in pairs:
-            a_w = weekly[:, w, a] > weekly[:, w, b]
-            wins[:, a] += a_w
-            wins[:, b] += ~a_w
+    # sims × weeks × teams; same draws as rng.normal(sim_means, sd_w), built in place
+    weekly = rng.standard_normal((n_sims, REG_WEEKS, n))
+    weekly *= sd_w
+    weekly += sim_means[:, None, :]
+
+    # every matchup of the season as (week, home, away) index arrays
+    games = [(w, a, b) for w, pairs in enumerate(schedule(n)) for a, b in pairs]
+    wk, home, away = np.array(games, dtype=np.intp).reshape(-1, 3).T
+    home_won = weekly[:, wk, home] > weekly[:, wk, away]        # sims × games
+    wins = _per_sim_counts(np.where(home_won, home, away), n)
     points_for = weekly.sum(axis=1)
 
     # seed by record, points-for tiebreak → top-6, byes for 1-2
     order = np.lexsort((-points_for, -wins), axis=1)             # per sim: best first
-    titles = np.zeros(n)
-    playoffs = np.zeros(n)
+    seeds = order[:, :PLAYOFF_TEAMS]
+    playoffs = _per_sim_counts(seeds, n).sum(axis=0)
     po_sd = sd_w
-    for s in range(n_sims):
-        seeds = order[s, :PLAYOFF_TEAMS]
-        playoffs[seeds] += 1
-        m = sim_means[s]
+    sim = np.arange(n_sims)
 
-        def game(x, y):
-            return x if rng.normal(m[x], po_sd) > rng.normal(m[y], po_sd) else y
+    def game(x, y):                                              # one round, all sims
+        return np.where(rng.normal(sim_means[sim, x], po_sd)
+                        > rng.normal(sim_means[sim, y], po_sd), x, y)
 
-        w45 = game(seeds[3], seeds[4])                            # QF: 4v5, 3v6
-        w36 = game(seeds[2], seeds[5])
-        f1 = game(seeds[0], w45)                                  # SF vs byes
-        f2 = game(seeds[1], w36)
-        titles[game(f1, f2)] += 1
+    w45 = game(seeds[:, 3], seeds[:, 4])                          # QF: 4v5, 3v6
+    w36 = game(seeds[:, 2], seeds[:, 5])
+    f1 = game(seeds[:, 0], w45)                                   # SF vs byes
+    f2 = game(seeds[:, 1], w36)
+    return {"title": np.bincount(game(f1, f2), minlength=n), "playoff": playoffs,
+            "wins": wins.sum(axis=0)}
 
+
+def title_odds(team_rosters: dict[str, list[dict]], board_avail: list[dict],
+               pts_lookup, n_sims: int = 1000, seed: int = 2026,
+               target_se: float | None = None, budget_ms: float | None = None,
+               focus: list[str] | None = None, max_sims: int = MAX_SIMS) -> dict:
+    """{team: {title, playoff, titleCI, playoffCI, expWins, weeklyMean, sims}} via
+    Monte Carlo. `pts_lookup(name, pos)` -> season league points for a rostered player.
+
+    Fixed count by default (`n_sims`, one draw stream from `seed`). With `target_se`
+    it's adaptive: `n_sims` is the first batch, then batches (each its own stream,
+    seeded (seed, start)) run until the `focus` teams' (default all) title and
+    playoff odds have standard error <= target_se, `budget_ms` runs out, or `max_sims`."""
+    teams = list(team_rosters.keys())
+    n = len(teams)
+    means = _means(team_rosters, board_avail, pts_lookup)
+    sd_w = weekly_sd()
+    if target_se is None:
+        tot = _season(means, sd_w, n_sims, np.random.default_rng(seed))
+    else:
+        gov = [teams.index(t) for t in focus if t in teams] if focus else list(range(n))
+        tot, n_sims = montecarlo.adaptive(
+            lambda start, k: _season(means, sd_w, k, np.random.default_rng((seed, start))),
+            lambda t: np.concatenate([t["title"][gov], t["playoff"][gov]]),
+            target_se, min_n=n_sims, max_n=max(n_sims, max_sims), budget_ms=budget_ms)
+    titles, playoffs = tot["title"], tot["playoff"]
+    title_ci, playoff_ci = montecarlo.ci(titles, n_sims), montecarlo.ci(playoffs, n_sims)
     return {t: {"title": round(float(titles[i]) / n_sims, 4),
                 "playoff": round(float(playoffs[i]) / n_sims, 4),
-                "expWins": round(float(wins[:, i].mean()), 2),
-                "weeklyMean": round(float(means[i]), 1)}
+                "titleCI": title_ci[i], "playoffCI": playoff_ci[i],
+                "expWins": round(float(tot["wins"][i]) / n_sims, 2),
+                "weeklyMean": round(float(means[i]), 1), "sims": n_sims}
             for i, t in enumerate(teams)}
 
 
+def compare(team_rosters: dict[str, list[dict]], my_team: str, variants: list[list[dict]],
+            board_avail: list[dict], pts_lookup, n_sims: int = COMPARE_SIMS,
+            seed: int = 2026) -> dict:
+    """Title odds for several versions of ONE team's roster on common random numbers.
+
+    `variants[0]` is the baseline (usually the current roster), the rest are
+    alternatives ("current + player X"). Every variant plays the same seasons:
+    the same per-team draft-luck shocks, the same weekly noise per team-week, and
+    the same playoff-round noise per team. So a variant's title odds differ from the
+    baseline's only through the roster, never through which draws it happened to
+    get, and the paired deltas carry a fraction of the noise of two separate
+    title_odds calls.
+
+    Returns {sims, variants: [{title, playoff, titleCI, dTitle, dTitleSE, dPlayoff,
+    dPlayoffSE}]}; the deltas are against variants[0]. Playoff games draw per team
+    per round, not per game as in title_odds, so the two don't match draw for draw."""
+    teams = list(team_rosters.keys())
+    if my_team not in teams or not variants:
+        raise ValueError("compare needs my_team in team_rosters and at least one variant")
+    me, n, V = teams.index(my_team), len(teams), len(variants)
+    means = np.empty((V, n))
+    for v, roster in enumerate(variants):
+        taken = {p.get("name") for p in roster or []}
+        means[v] = _means({**team_rosters, my_team: roster},
+                          [r for r in board_avail if r.get("name") not in taken], pts_lookup)
+    sd_w = weekly_sd()
+    games = [(w, a, b) for w, pairs in enumerate(schedule(n)) for a, b in pairs]
+    wk, home, away = np.array(games, dtype=np.intp).reshape(-1, 3).T
+    onehot_home = np.eye(n)[home]                                # games × teams
+    onehot_away = np.eye(n)[away]
+
+    rng = np.random.default_rng(seed)
+    title = np.empty((V, n_sims), dtype=bool)
+    playoff = np.empty((V, n_sims), dtype=bool)
+    for lo in range(0, n_sims, COMPARE_CHUNK):                   # bounded memory, one stream
+        S = min(COMPARE_CHUNK, n_sims - lo)
+        shock = rng.normal(1.0, SEASON_SHOCK, size=(S, n))
+        noise = rng.standard_normal((S, REG_WEEKS, n)) * sd_w
+        po_noise = rng.standard_normal((S, 3, n)) * sd_w          # QF, SF, final
+        sim_means = means[:, None, :] * shock[None]              # V × S × n
+        weekly = sim_means[:, :, None, :] + noise[None]          # V × S × weeks × n
+        home_won = (weekly[:, :, wk, home] > weekly[:, :, wk, away]).astype(float)
+        wins = home_won @ onehot_home + (1.0 - home_won) @ onehot_away
+        order = np.lexsort((-weekly.sum(axis=2), -wins), axis=-1)
+        seeds = order[..., :PLAYOFF_TEAMS]                        # V × S × 6
+        playoff[:, lo:lo + S] = (seeds == me).any(axis=-1)
+
+        def game(x, y, rnd):
+            sx = np.take_along_axis(sim_means, x[..., None], -1)[..., 0] \
+                + po_noise[:, rnd][np.arange(S), x]
+            sy = np.take_along_axis(sim_means, y[..., None], -1)[..., 0] \
+                + po_noise[:, rnd][np.arange(S), y]
+            return np.where(sx > sy, x, y)
+
+        f1 = game(seeds[..., 0], game(seeds[..., 3], seeds[..., 4], 0), 1)
+        f2 = game(seeds[..., 1], game(seeds[..., 2], seeds[..., 5], 0), 1)
+        title[:, lo:lo + S] = game(f1, f2, 2) == me
+
+    def paired(x):
+        d = x.astype(float) - x[0].astype(float)
+        return d.mean(axis=1), d.std(axis=1, ddof=1) / np.sqrt(n_sims) if n_sims > 1 else 0 * d[:, 0]
+
+    d_t, se_t = paired(title)
+    d_p, se_p = paired(playoff)
+    t_hits = title.sum(axis=1)
+    t_ci = montecarlo.ci(t_hits, n_sims)
+    return {"sims": n_sims, "variants": [
+        {"title": round(float(t_hits[v]) / n_sims, 4),
+         "playoff": round(float(playoff[v].mean()), 4), "titleCI": t_ci[v],
+         "dTitle": round(float(d_t[v]), 4), "dTitleSE": round(float(se_t[v]), 4),
+         "dPlayoff": round(float(d_p[v]), 4), "dPlayoffSE": round(float(se_p[v]), 4)}
+        for v in range(V)]}
+
+
 if __name__ == "__main__":     # python models/season_sim.py — self-test
     import csv
     import time
@@ -230,3 +348,27 @@ if __name__ == "__main__":     # python models/season_sim.py — self-test
           f"(was {odds['Ray']['title']:.1%}), expWins {odds2['Ray']['expWins']}")
     assert odds2["Ray"]["title"] > odds["Ray"]["title"] + 0.02, "stacked roster must move the needle"
     print("sanity PASSED: elite roster lifts title odds")
+
+    # adaptive: stop once Ray's odds are within 0.5pt SE, and say how sure we are
+    t0 = time.time()
+    odds3 = title_odds(stacked, rows, lookup, n_sims=500, target_se=0.005, focus=["Ray"])
+    r = odds3["Ray"]
+    print(f"adaptive to se 0.005 on Ray ({(time.time()-t0)*1000:.0f}ms, {r['sims']} sims): "
+          f"title {r['title']:.1%} [{r['titleCI'][0]:.1%}, {r['titleCI'][1]:.1%}]")
+    assert r["titleCI"][0] <= r["title"] <= r["titleCI"][1]
+    assert (r["titleCI"][1] - r["titleCI"][0]) / 3.92 <= 0.0051 and r["sims"] < MAX_SIMS
+
+    # common random numbers: the same three candidates, paired vs. two separate runs
+    cands = [{"name": "Ja'Marr Chase", "position": "WR"}, {"name": "Derrick Henry", "position": "RB"},
+             {"name": "Harrison Butker", "position": "K"}]
+    t0 = time.time()
+    cmp = compare(stacked, "Ray", [stacked["Ray"]] + [stacked["Ray"] + [c] for c in cands], rows, lookup)
+    print(f"\ncompare: {len(cands)} candidates on {cmp['sims']} shared seasons ({(time.time()-t0)*1000:.0f}ms)")
+    for c, v in zip(cands, cmp["variants"][1:]):
+        unpaired = ((v["titleCI"][1] - v["titleCI"][0]) ** 2
+                    + (cmp["variants"][0]["titleCI"][1] - cmp["variants"][0]["titleCI"][0]) ** 2) ** 0.5 / 3.92
+        print(f"  + {c['name']:<16} title {v['dTitle']:+.2%} ± {v['dTitleSE']:.2%} paired "
+              f"(± {unpaired:.2%} if run separately)")
+        assert v["dTitleSE"] < unpaired / 2, "pairing should cut the noise by well over half"
+    assert cmp["variants"][1]["dTitle"] > cmp["variants"][3]["dTitle"], "a WR1 beats a kicker"
+    print("SELF-TEST PASSED")
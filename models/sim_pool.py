@@ -0,0 +1,45 @@
+"""One process pool for the Monte-Carlo fan-outs (wheel room sims, war-games runs).
+
+Sims are pure functions of (board, draft state, seed), so they split cleanly
+across processes. Everything here is built around that:
+
+  * WORKERS — DRAFTIQ_SIM_WORKERS, else min(8, cpus). 1 means "always serial".
+  * executor() — one long-lived pool, SPAWNED (not forked): the API process is
+    threaded, and forking a process that holds locks in other threads is unsafe.
+  * board_at(path, version) — the worker side of the handoff. The board is never
+    pickled across; workers re-read it through board_store (parsed once per
+    worker) and refuse a snapshot that changed underneath the request (None),
+    so the caller falls back to serial rather than mixing two boards.
+
+Callers own their fallbacks: any pool failure must still produce the serial answer.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import board_store
+except ImportError:  # pragma: no cover
+    from models import board_store
+
+WORKERS = int(os.environ.get("DRAFTIQ_SIM_WORKERS") or 0) or min(8, os.cpu_count() or 1)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=mp.get_context("spawn"))
+        return _pool
+
+
+def board_at(path, version):
+    """The stored board if it is still `version`, else None (worker side)."""
+    board = board_store.get(path)
+    return board if board.version == version else None
@@ -0,0 +1,277 @@
+"""Speculative precompute of my next pick while the opponents are on the clock.
+
+/api/ai/best-pick used to start from zero when my turn came up: sync the room,
+run pick_engine.shortlist, then a blocking coach call that can take most of a
+pick clock — while the room had just given us minutes of idle time.
+
+Now every synced pick (the UI posts /api/ai/best-pick/prefetch when it isn't my
+turn) starts a speculation in the background:
+
+  * likely_states() — a beam search over the picks between now and my next
+    turn. Each step expands every kept room with the on-clock team's most likely
+    picks (opponent_ai.predict through DraftSession.spy — the same probabilities
+    spy mode shows) and keeps the `width` most likely rooms by joint probability.
+  * the caller precomputes what it would serve at my pick in each of the `keep`
+    likeliest rooms (the deterministic shortlist), and may pre-warm the coach
+    call for the likeliest one.
+  * results are stored under draft_session.state_key — board snapshot, pick log
+    and request params — so a precomputed answer is only ever served for exactly
+    the room and request it was computed for. Anything else is an ordinary miss.
+
+A newer pick supersedes an older speculation (its beam stops at the next step),
+so the worker is only ever busy with the current room. Coverage sharpens as my
+turn approaches: with one pick to go the kept rooms usually cover most of it.
+
+Pure / no network (the coach call is whatever `warm` the caller hands in).
+Run `python models/speculate.py` for a self-test.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:  # works both as `python models/speculate.py` and `from models import speculate`
+    import opponent_ai as oa
+except ImportError:  # pragma: no cover
+    from models import opponent_ai as oa
+
+WIDTH = 6              # rooms kept per beam step
+KEEP = 4               # rooms precomputed at my pick
+MAX_ENTRIES = 64
+
+
+def next_turn(overall_pick: int, my_slot: int, teams: int = 10, rounds: int = 18) -> int | None:
+    """My first pick at or after `overall_pick` (None past the last round)."""
+    for p in range(overall_pick, rounds * teams + 1):
+        if oa.slot_for_pick(p, teams) == my_slot:
+            return p
+    return None
+
+
+def likely_states(sess, overall_pick: int, my_slot: int, rounds: int = 18,
+                  prof_of: dict | None = None, width: int = WIDTH, keep: int = KEEP,
+                  stale=None) -> list[tuple[float, object]]:
+    """The `keep` most likely rooms at my next turn, as (probability, DraftSession)
+    — copies of `sess` with the predicted picks applied (their log entries look
+    exactly like the UI's: overall, team, name, pos). [] when it's already my
+    turn, the room can't be predicted (a seat without a team), or `stale()`."""
+    q = next_turn(overall_pick, my_slot, sess.teams, rounds)
+    if q is None or q == overall_pick:
+        return []
+    beam = [(1.0, sess.copy())]
+    for p in range(overall_pick, q):
+        if stale is not None and stale():
+            return []
+        seat = oa.slot_for_pick(p, sess.teams)
+        team = sess.team_order[seat - 1] if seat - 1 < len(sess.team_order) else None
+        grown = []
+        for prob, s in beam:
+            ranked = s.spy(team, p, rounds, (prof_of or {}).get(team), top=width) if team else None
+            if not ranked:
+                return []
+            for c in ranked:
+                grown.append((prob * c["prob"], s, c))
+        grown.sort(key=lambda x: -x[0])
+        beam = []
+        for prob, s, c in grown[:width]:
+            child = s.copy()
+            child.apply({"overall": p, "team": team, "name": c["name"], "pos": c["pos"]})
+            beam.append((prob, child))
+    return beam[:keep]
+
+
+class Speculator:
+    """Background precompute keyed by draft state, with hit-rate counters.
+
+    run(job, key) queues job(emit, stale) on the single speculation worker; the
+    job calls emit(key, prob, value, warm=None) per room it precomputes, and
+    should check stale() between rooms — it turns True once a newer job is
+    queued. A job for the same `key` (draft state) as the latest one is dropped.
+    `warm`, if given, runs on the coach pool and its Future is kept with the
+    entry; a newer job cancels the older jobs' pre-warms that haven't started
+    (a mispredicted room shouldn't hold a coach slot or cost a model call), and a
+    stale job's emit() submits none. `coach` is any executor with .submit (api.py passes its CoachPool, so
+    pre-warms count against the same in-flight limit as live coach calls); the
+    default is a private one. lookup(key) returns the entry (value, prob, warm
+    Future) or None."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, coach_workers: int = 2, coach=None):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._gen, self._last = 0, None
+        self._warm: list[Future] = []          # the latest job's pre-warms
+        self._work = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculate")
+        self._coach = coach or ThreadPoolExecutor(max_workers=coach_workers,
+                                                  thread_name_prefix="speculate-coach")
+        self._stats = {"jobs": 0, "superseded": 0, "rooms": 0, "warmed": 0, "warmCancelled": 0,
+                       "hits": 0, "warmHits": 0, "misses": 0, "jobMsTotal": 0.0}
+
+    def run(self, job, key=None) -> Future | None:
+        with self._lock:
+            if key is not None and key == self._last:
+                return None
+            self._gen += 1
+            gen, self._last = self._gen, key
+            old, self._warm = self._warm, []
+        cancelled = sum(f.cancel() for f in old)    # queued ones never run; running ones finish unread
+        if cancelled:
+            with self._lock:
+                self._stats["warmCancelled"] += cancelled
+        return self._work.submit(self._run, job, gen)
+
+    def _run(self, job, gen):
+        def stale():
+            return self._gen != gen
+
+        def emit(key, prob, value, warm=None):
+            with self._lock:
+                fut = None
+                if warm is not None and self._gen == gen:   # no pre-warm for a stale job
+                    fut = self._coach.submit(warm)
+                    self._warm.append(fut)
+                self._entries[key] = {"value": value, "prob": prob, "warm": fut}
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self._stats["rooms"] += 1
+                self._stats["warmed"] += fut is not None
+
+        if stale():
+            with self._lock:
+                self._stats["superseded"] += 1
+            return
+        t0 = time.perf_counter()
+        job(emit, stale)
+        with self._lock:
+            self._stats["jobs"] += 1
+            self._stats["superseded"] += stale()
+            self._stats["jobMsTotal"] += (time.perf_counter() - t0) * 1000
+
+    def lookup(self, key) -> dict | None:
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            if ent["warm"] is not None and ent["warm"].cancelled():
+                ent = {**ent, "warm": None}
+            self._stats["hits"] += 1
+            self._stats["warmHits"] += ent["warm"] is not None
+            return ent
+
+    def stats(self) -> dict:
+        """Counters for /api/health: rooms precomputed, hit/miss, coach pre-warms."""
+        with self._lock:
+            st = dict(self._stats)
+            st["entries"] = len(self._entries)
+        asked = st["hits"] + st["misses"]
+        st["hitRate"] = round(st["hits"] / asked, 3) if asked else None
+        st["jobMsAvg"] = round(st["jobMsTotal"] / st["jobs"], 1) if st["jobs"] else None
+        st["jobMsTotal"] = round(st["jobMsTotal"], 1)
+        return st
+
+
+if __name__ == "__main__":     # python models/speculate.py — self-test
+    try:
+        import board_store
+        import draft_session as ds
+    except ImportError:  # pragma: no cover
+        from models import board_store
+        from models import draft_session as ds
+
+    board = board_store.get()
+    rows = board.rows
+    order = [f"Team{i}" for i in range(1, 11)]
+    my_slot = 3
+
+    def room(upto):
+        return [{"overall": p, "team": order[oa.slot_for_pick(p, 10) - 1],
+                 "name": rows[p - 1]["name"], "pos": rows[p - 1]["pos"]} for p in range(1, upto)]
+
+    # a played-out room: every beam leaf is a legal continuation of the real log
+    log = room(24)                      # pick 24 on the clock (seat 7); my next turn is 38
+    sess = ds.DraftSession(board, order, 10)
+    sess.sync(log)
+    t0 = time.perf_counter()
+    states = likely_states(sess, 24, my_slot)
+    ms = (time.perf_counter() - t0) * 1000
+    assert next_turn(24, my_slot) == 38 and len(states) == KEEP
+    assert len(sess.log) == 23, "the live session must not move"
+    probs = [p for p, _ in states]
+    assert probs == sorted(probs, reverse=True) and 0 < sum(probs) <= 1
+    for prob, s in states:
+        assert [pk["overall"] for pk in s.log] == list(range(1, 38))
+        assert len({pk["name"] for pk in s.log}) == 37
+        fresh = ds.DraftSession(board, order, 10)
+        fresh.sync(s.log)               # the copy is exactly the from-the-log state
+        assert [r["name"] for r in fresh.available_rows()] == [r["name"] for r in s.available_rows()]
+    print(f"14 picks ahead: {KEEP} likeliest rooms cover p={sum(probs):.1e} in {ms:.0f}ms")
+
+    # one pick ahead: the rooms are the on-clock team's top predictions
+    log = room(37)
+    sess.sync(log)
+    states = likely_states(sess, 37, my_slot)
+    spy = sess.spy(order[oa.slot_for_pick(37, 10) - 1], 37, top=KEEP)
+    assert [s.log[-1]["name"] for _, s in states] == [c["name"] for c in spy]
+    print(f" 1 pick ahead:  {KEEP} likeliest rooms cover {sum(p for p, _ in states):.1%}")
+    assert next_turn(38, my_slot) == 38 and likely_states(states[0][1], 38, my_slot) == []
+
+    # the worker: keyed hits, superseded jobs, warm futures
+    spec = Speculator()
+    gate = threading.Event()
+
+    def slow(emit, stale):
+        gate.wait()
+        emit("old", 0.5, "x")
+
+    def job(emit, stale):
+        for prob, s in states:
+            if stale():
+                return
+            emit(ds.state_key(board, s.log, pick=38), prob, s.log[-1]["name"],
+                 warm=lambda s=s: "coach:" + s.log[-1]["name"])
+
+    spec.run(slow)                      # running: finishes, but is already stale when it does
+    spec.run(lambda emit, stale: emit("skipped", 1.0, "y"))   # queued, superseded unrun
+    done = spec.run(job)
+    gate.set()
+    done.result()
+    truth = states[0][1].log
+    hit = spec.lookup(ds.state_key(board, truth, pick=38))
+    assert hit["value"] == truth[-1]["name"] and hit["warm"].result() == "coach:" + truth[-1]["name"]
+    assert spec.lookup(ds.state_key(board, truth, pick=39)) is None
+    st = spec.stats()
+    assert st["hits"] == 1 and st["misses"] == 1 and st["warmed"] == KEEP
+    assert st["superseded"] == 2 and spec.lookup("skipped") is None
+    assert spec.run(job, key="room") is not None and spec.run(job, key="room") is None
+
+    # a newer pick cancels the older job's queued pre-warms; a stale job submits none
+    coach = ThreadPoolExecutor(max_workers=1)
+    spec = Speculator(coach=coach)
+    block = threading.Event()
+    coach.submit(block.wait)                # the coach slot is busy: pre-warms queue
+    ran = []
+    spec.run(lambda emit, stale: [emit(f"r{k}", 0.5, k, warm=lambda k=k: ran.append(k))
+                                  for k in range(3)]).result()
+    started, late = threading.Event(), threading.Event()
+
+    def slow_job(emit, stale):
+        started.set()
+        late.wait()
+        emit("late", 0.5, 0, warm=lambda: ran.append("late"))
+
+    first = spec.run(slow_job)
+    started.wait()
+    spec.run(lambda emit, stale: None)      # supersedes both
+    late.set()
+    first.result()
+    block.set()
+    coach.shutdown(wait=True)
+    assert ran == [] and spec.stats()["warmCancelled"] == 3
+    assert spec.lookup("r0")["warm"] is None and spec.lookup("late")["warm"] is None
+    print(f"worker: {st}")
+    print("SELF-TEST PASSED")
@@ -10,23 +10,38 @@ league is Monte-Carlo'd for title odds. Across N runs you get:
   * your most-drafted players ("the model keeps buying these")
   * the single best draft found, in full
 
+Run s is a pure function of the draft state and its seed, so runs are independent:
+iter_runs() farms them out over models/sim_pool.py's process pool (one future per
+run) and yields each one the moment it finishes — /api/sim/tournament streams
+them so the UI draws the distribution while the rest are still playing.
+summarize() folds them back in seed order, identical to the serial answer.
+
 Deterministic per seed set; no LLM. Served at /api/sim/tournament.
 """
 from __future__ import annotations
 
 import random
 from collections import Counter
+from concurrent.futures import as_completed
 
 try:
+    import board_store
     import opponent_ai as oa
     import pick_engine as pe
     import season_sim
+    import sim_pool
 except ImportError:  # pragma: no cover
+    from models import board_store
     from models import opponent_ai as oa
     from models import pick_engine as pe
     from models import season_sim
+    from models import sim_pool
 
-ODDS_SIMS = 400          # per finished draft — plenty for a distribution read
+ODDS_SIMS = 400          # first batch per finished draft...
+ODDS_SE = 0.02           # ...then more until my title/playoff odds are this tight (2pt SE)
+ODDS_MAX_SIMS = 4000
+MAX_RUNS = 200           # per request (the endpoint's `n`)
+PARALLEL_MIN_RUNS = 4    # fewer runs than this aren't worth a round-trip to the pool
 
 
 def _my_pick(board_rows, drafted, team, log, overall, my_slot, teams, rounds):
@@ -43,11 +58,11 @@ class _Team(oa.TeamState):
                 for s, v in self.slots.items()}
 
 
-def run(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
-        rounds=18, n=12, profiles=None, alias_map=None) -> dict:
+def _runs(board, picks_log, team_order, overall_pick, my_slot, teams, rounds, prof_of, seeds):
+    """Play the draft out and sim the season once per seed; yields one result each."""
     me_name = team_order[my_slot - 1] if team_order and my_slot - 1 < len(team_order) else "ME"
     by_key = {}
-    for r in board_rows:
+    for r in board.rows:
         try:
             pts = float(r.get("league_pts") or 0)
         except (TypeError, ValueError):
@@ -57,47 +72,38 @@ def run(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
     def lookup(name, pos):
         return by_key.get((name, pos), 0.0)
 
-    prof_of = {}
-    for nm in (team_order or []):
-        owner = (alias_map or {}).get(nm)
-        prof_of[nm] = (profiles or {}).get(owner) if owner else None
-
-    results = []
-    my_player_counts = Counter()
-    for s in range(n):
+    avail0, states0 = oa.replay(board, picks_log, team_order)
+    drafted0 = {pk.get("name") for pk in picks_log or []}
+    for s in seeds:
         rng = random.Random(4242 + s * 101)
-        avail, states0, drafted = oa.build_state(board_rows, picks_log, team_order, teams)
-        states = {nm: _Team(nm) for nm in team_order}
-        # replay existing picks into upgraded state objects
-        for nm, st in states0.items():
-            if nm in states:
-                states[nm].slots = st.slots
-                states[nm].bench = st.bench
+        states = {}
+        for nm in team_order:
+            states[nm] = _Team(nm)
+            states[nm].slots = dict(states0[nm].slots)
+            states[nm].bench = list(states0[nm].bench)
+        room = oa.Room(board, avail0, states, picks_log, teams, rounds)
+        drafted = set(drafted0)
         log = list(picks_log or [])
-        by_name = {}
-        for r in avail:
-            by_name.setdefault(r["name"], r)
-        avail_set = {id(r) for r in avail}
 
         p = overall_pick
         last = rounds * teams
-        while p <= last and avail:
+        while p <= last and room.left:
             seat = oa.slot_for_pick(p, teams)
             nm = team_order[seat - 1]
             team = states[nm]
             rnd = (p - 1) // teams + 1
+            i = None
             if seat == my_slot:
-                anchor = _my_pick(board_rows, drafted, team, log, p, my_slot, teams, rounds)
-                chosen = by_name.get(anchor)
-                if chosen is None or id(chosen) not in avail_set:
-                    chosen, _ = oa.pick_one(team, avail, rnd, rounds, rng,
-                                            prof_of.get(nm), log, teams)
-            else:
-                chosen, _ = oa.pick_one(team, avail, rnd, rounds, rng, prof_of.get(nm), log, teams)
-            team.place(chosen)
+                anchor = _my_pick(board.rows, drafted, team, log, p, my_slot, teams, rounds)
+                # the first same-name row that was on the board when this run started
+                i = next((j for j in board.indices_named(anchor) if avail0[j]), None)
+                if i is not None and not room.avail[i]:
+                    i = None
+            if i is None:
+                i, _ = room.pick(nm, rnd, rng, prof_of.get(nm))
+            room.take(i, nm)
+            chosen = board.rows[i]
             drafted.add(chosen["name"])
-            avail.remove(chosen)
-            avail_set.discard(id(chosen))
             log.append({"overall": p, "team": nm, "name": chosen["name"], "pos": chosen["pos"]})
             p += 1
 
@@ -105,17 +111,59 @@ def run(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
         for pk in log:
             if pk["team"] in rosters:
                 rosters[pk["team"]].append({"name": pk["name"], "position": pk["pos"]})
-        odds = season_sim.title_odds(rosters, [], lookup, n_sims=ODDS_SIMS, seed=777 + s)
+        odds = season_sim.title_odds(rosters, [], lookup, n_sims=ODDS_SIMS, seed=777 + s,
+                                     target_se=ODDS_SE, focus=[me_name],
+                                     max_sims=ODDS_MAX_SIMS)
         me = odds.get(me_name, {})
         my_picks = [pk for pk in log if pk["team"] == me_name]
-        seq = "-".join(pk["pos"] for pk in my_picks[:6])
         proj, _ = season_sim.lineup_points(rosters[me_name], lookup)
-        for pk in my_picks[:10]:
+        yield {"seed": s, "title": me.get("title", 0), "playoff": me.get("playoff", 0),
+               "titleCI": me.get("titleCI"), "seasons": me.get("sims"),
+               "expWins": me.get("expWins", 0), "proj": round(proj),
+               "seq": "-".join(pk["pos"] for pk in my_picks[:6]), "myPicks": my_picks}
+
+
+def _runs_stored(path, version, *args) -> list[dict] | None:
+    """Pool-worker entry: the board is re-read from the store, not pickled across."""
+    board = sim_pool.board_at(path, version)
+    return None if board is None else list(_runs(board, *args))
+
+
+def iter_runs(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
+              rounds=18, n=12, profiles=None, alias_map=None):
+    """Yield each run's result ({seed, title, playoff, expWins, proj, seq, myPicks})
+    as it finishes — completion order, not seed order, when the pool is in use."""
+    board = board_store.board_for(board_rows)
+    prof_of = oa.team_profiles(team_order, profiles, alias_map)
+    args = (picks_log, team_order, overall_pick, my_slot, teams, rounds, prof_of)
+    todo = list(range(max(1, min(int(n), MAX_RUNS))))
+    futs = {}
+    if sim_pool.WORKERS > 1 and len(todo) >= PARALLEL_MIN_RUNS and board.path is not None:
+        try:
+            pool = sim_pool.executor()
+            futs = {pool.submit(_runs_stored, board.path, board.version, *args, [s]): s
+                    for s in todo}
+            for f in as_completed(futs):
+                part = f.result()
+                if part is None:              # board rebuilt mid-request — finish serially
+                    break
+                todo.remove(futs[f])
+                yield from part
+        except Exception:      # broken pool (worker killed, etc.) — serial still answers
+            pass
+        finally:               # also runs when a streaming client hangs up
+            for f in futs:
+                f.cancel()
+    yield from _runs(board, *args, todo)
+
+
+def summarize(results: list[dict]) -> dict:
+    """The WAR GAMES read over finished runs (any order — folded in seed order)."""
+    results = sorted(results, key=lambda r: r["seed"])
+    my_player_counts = Counter()
+    for r in results:
+        for pk in r["myPicks"][:10]:
             my_player_counts[f'{pk["name"]} ({pk["pos"]})'] += 1
-        results.append({"seed": s, "title": me.get("title", 0), "playoff": me.get("playoff", 0),
-                        "expWins": me.get("expWins", 0), "proj": round(proj),
-                        "seq": seq, "myPicks": my_picks})
-
     results.sort(key=lambda r: -r["title"])
     titles = sorted(r["title"] for r in results)
     med = titles[len(titles) // 2]
@@ -129,7 +177,7 @@ def run(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
         key=lambda x: -x["meanTitle"])
     best = results[0]
     return {
-        "n": n,
+        "n": len(results),
         "titleMin": titles[0], "titleMedian": med, "titleMax": titles[-1],
         "titles": [r["title"] for r in results],
         "projRange": [min(r["proj"] for r in results), max(r["proj"] for r in results)],
@@ -141,13 +189,18 @@ def run(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
     }
 
 
+def run(board_rows, picks_log, team_order, overall_pick, my_slot=10, teams=10,
+        rounds=18, n=12, profiles=None, alias_map=None) -> dict:
+    return summarize(list(iter_runs(board_rows, picks_log, team_order, overall_pick, my_slot,
+                                    teams, rounds, n, profiles, alias_map)))
+
+
 if __name__ == "__main__":     # python models/tournament.py — self-test
-    import csv
     import json as _json
     import time as _time
     from pathlib import Path
     ROOT = Path(__file__).resolve().parents[1]
-    rows = list(csv.DictReader(open(ROOT / "data/processed/board_2026.csv", encoding="utf-8")))
+    rows = pe.board_store.rows()
     profiles = _json.loads((ROOT / "data/processed/manager_profiles.json").read_text(encoding="utf-8"))
     aliases = {k: v for k, v in _json.loads((ROOT / "data/team_aliases.json").read_text(
         encoding="utf-8")).items() if not k.startswith("_")}
@@ -23,6 +23,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 # --------------------------------------------------------------------------- #
 # League configuration (this league's reality; override per season from the pull)
@@ -94,7 +96,10 @@ def replacement_baselines(league: League) -> dict[str, float]:
 
 
 def replacement_levels(players: list[dict], league: League) -> dict[str, float]:
-    by_pos = _by_pos(players)
+    return _levels(_by_pos(players), league)
+
+
+def _levels(by_pos: dict[str, list[dict]], league: League) -> dict[str, float]:
     counts = replacement_baselines(league)
     levels: dict[str, float] = {}
     for pos, lst in by_pos.items():
@@ -120,7 +125,11 @@ def picks_until_next(overall_pick: int, teams: int) -> int:
     return nxt - overall_pick
 
 
-def survival(adp: float | None, next_pick_number: int, steepness: float = 0.18) -> float:
+SURVIVAL_STEEPNESS = 0.18
+
+
+def survival(adp: float | None, next_pick_number: int,
+             steepness: float = SURVIVAL_STEEPNESS) -> float:
     """Logistic on (adp - next_pick): players whose ADP is well past your next pick
     are very likely to survive; those before it usually won't."""
     if adp is None:
@@ -131,58 +140,116 @@ def survival(adp: float | None, next_pick_number: int, steepness: float = 0.18)
 # --------------------------------------------------------------------------- #
 # Board ranking
 # --------------------------------------------------------------------------- #
+def _first_equal(lst: list[dict]) -> list[int]:
+    """`lst.index(p)` for every p in a `_by_pos` list, in linear time.
+
+    list.index matches by EQUALITY, so a duplicate row ranks at its first equal
+    copy. Equal dicts share a sort key and so sit in the same run of equal keys;
+    only those runs need the comparison, via a hashable fingerprint where the
+    values allow it and pairwise inside the run where they don't."""
+    out = list(range(len(lst)))
+    i = 0
+    while i < len(lst):
+        key = (lst[i].get("points") is None, -(lst[i].get("points") or 0))
+        j = i + 1
+        while j < len(lst) and (lst[j].get("points") is None, -(lst[j].get("points") or 0)) == key:
+            j += 1
+        if j - i > 1:
+            seen: dict = {}
+            for k in range(i, j):
+                try:
+                    out[k] = seen.setdefault(tuple(sorted(lst[k].items())), k)
+                except TypeError:                # unhashable / unorderable values
+                    out[k] = next(m for m in range(i, k + 1) if lst[m] == lst[k])
+        i = j
+    return out
+
+
+def _norm(vals: np.ndarray) -> np.ndarray:
+    lo, hi = vals.min(), vals.max()
+    return np.zeros_like(vals) if hi == lo else (vals - lo) / (hi - lo)
+
+
+def _round(vals: np.ndarray, nd: int) -> np.ndarray:
+    # Python round, element-wise: np.round rounds some halves the other way
+    return np.array([round(v, nd) for v in vals.tolist()])
+
+
 def rank_board(players: list[dict], league: League | None = None,
                overall_pick: int = 1, weights: dict | None = None) -> list[dict]:
     """Annotate every available player with vorp / vona / survival / scarcity and a
     single DraftIQ score, sorted best-first. `players` should be the players still
-    available (drafted ones removed)."""
+    available (drafted ones removed).
+
+    Linear in the pool: each position is sorted once, every player's rank in it
+    comes from that sort (not a list.index scan), and the signals are column
+    arithmetic over the whole pool — cheap enough to re-rank the full board at
+    every live pick, or at several what-if pick numbers."""
     league = league or League()
     w = {"vorp": 0.55, "vona": 0.30, "scarcity": 0.15, **(weights or {})}
+    if not players:
+        return []
 
     by_pos = _by_pos(players)
-    levels = replacement_levels(players, league)
+    levels = _levels(by_pos, league)
     gap = picks_until_next(overall_pick, league.teams)
     next_pick_number = overall_pick + gap
 
-    out = []
-    for p in players:
-        pos = normalize_pos(p.get("position"))
-        lst = by_pos.get(pos, [])
-        rank_in_pos = lst.index(p) if p in lst else len(lst)
-        repl = levels.get(pos, 0.0)
-        vorp = _pts(p) - repl
-
-        # VONA: value over the best you'd expect to still be available at THIS
-        # position by your next pick (≈ slide `gap`-worth of positional picks down).
-        # Approximate the next-available as the player ~gap/len(positions) deeper.
-        slide = max(1, gap // max(1, len(by_pos)))
-        nxt_idx = min(len(lst) - 1, rank_in_pos + slide)
-        vona = _pts(p) - (_pts(lst[nxt_idx]) if lst else 0.0)
-
-        # Scarcity / tier cliff: drop to the very next player at the position.
-        cliff = _pts(p) - (_pts(lst[rank_in_pos + 1]) if rank_in_pos + 1 < len(lst) else _pts(p))
-
-        surv = survival(p.get("adp"), next_pick_number)
-
-        out.append({**p, "pos": pos, "vorp": round(vorp, 2), "vona": round(vona, 2),
-                    "cliff": round(cliff, 2), "survival": round(surv, 3)})
+    # VONA: value over the best you'd expect to still be available at THIS
+    # position by your next pick (≈ slide `gap`-worth of positional picks down).
+    # Approximate the next-available as the player ~gap/len(positions) deeper.
+    slide = max(1, gap // max(1, len(by_pos)))
+
+    n = len(players)
+    row_of: dict[int, list[int]] = {}           # the same dict may be passed twice
+    for i, p in enumerate(players):
+        row_of.setdefault(id(p), []).append(i)
+    taken = dict.fromkeys(row_of, 0)
+    pos = [""] * n
+    pts = np.empty(n)
+    repl = np.empty(n)
+    nxt_pts = np.empty(n)          # the player `slide` deeper (VONA)
+    below_pts = np.empty(n)        # the very next player (cliff); self for the last
+    for ps, lst in by_pos.items():
+        lp = np.array([_pts(p) for p in lst])
+        rank = np.array(_first_equal(lst))
+        ix = []
+        for p in lst:
+            ix.append(row_of[id(p)][taken[id(p)]])
+            taken[id(p)] += 1
+        ix = np.array(ix)
+        for i in ix.tolist():
+            pos[i] = ps
+        pts[ix] = lp
+        repl[ix] = levels.get(ps, 0.0)
+        nxt_pts[ix] = lp[np.minimum(len(lst) - 1, rank + slide)]
+        below_pts[ix] = np.where(rank + 1 < len(lst), lp[np.minimum(len(lst) - 1, rank + 1)], lp)
+
+    vorp = _round(pts - repl, 2)
+    vona = _round(pts - nxt_pts, 2)
+    # Scarcity / tier cliff: drop to the very next player at the position.
+    cliff = _round(pts - below_pts, 2)
+    no_adp = np.array([p.get("adp") is None for p in players])
+    adp = np.array([0.0 if p.get("adp") is None else p["adp"] for p in players], dtype=float)
+    with np.errstate(over="ignore"):
+        surv = np.where(no_adp, 0.5,
+                        1.0 / (1.0 + np.exp(-SURVIVAL_STEEPNESS * (adp - next_pick_number))))
+    surv = _round(surv, 3)
 
     # normalize the three value signals to 0..1 across the available pool, then blend
-    def _norm(key):
-        vals = [r[key] for r in out]
-        lo, hi = min(vals), max(vals)
-        return (lambda x: 0.0 if hi == lo else (x - lo) / (hi - lo))
-    nv, nva, nsc = _norm("vorp"), _norm("vona"), _norm("cliff")
-
-    for r in out:
-        base = w["vorp"] * nv(r["vorp"]) + w["vona"] * nva(r["vona"]) + w["scarcity"] * nsc(r["cliff"])
-        # urgency: a strong player unlikely to survive to your next pick is worth
-        # taking now — tilt the score by how little of them is expected to remain.
-        urgency = base * (1.0 + 0.5 * (1.0 - r["survival"]))
-        # ...then discount streamable positions (IDP/K/DST) so they don't crowd the early board.
-        r["score"] = round(urgency * STREAM_DISCOUNT.get(r["pos"], 1.0), 4)
-
-    out.sort(key=lambda r: -r["score"])
+    base = w["vorp"] * _norm(vorp) + w["vona"] * _norm(vona) + w["scarcity"] * _norm(cliff)
+    # urgency: a strong player unlikely to survive to your next pick is worth
+    # taking now — tilt the score by how little of them is expected to remain.
+    urgency = base * (1.0 + 0.5 * (1.0 - surv))
+    # ...then discount streamable positions (IDP/K/DST) so they don't crowd the early board.
+    score = _round(urgency * np.array([STREAM_DISCOUNT.get(ps, 1.0) for ps in pos]), 4)
+
+    out = []
+    for i in np.argsort(-score, kind="stable").tolist():
+        r = {**players[i], "pos": pos[i], "vorp": float(vorp[i]), "vona": float(vona[i]),
+             "cliff": float(cliff[i]), "survival": float(surv[i])}
+        r["score"] = float(score[i])
+        out.append(r)
     return out
 
 
@@ -219,3 +286,20 @@ if __name__ == "__main__":
     for i, r in enumerate(board[:12], 1):
         print(f"{i:>2} {r['name']:<7} {r['pos']:<4} {_pts(r):>6.1f} "
               f"{r['vorp']:>6.1f} {r['vona']:>6.1f} {r['survival']:>5.2f} {r['score']:>6.3f}")
+
+    # duplicate rows rank like list.index did (at the first equal copy) ...
+    dup = rank_board(players + [dict(players[0])], lg, overall_pick=7)
+    twins = [r for r in dup if r["name"] == players[0]["name"]]
+    assert len(twins) == 2 and twins[0] == twins[1], "duplicate rows must score identically"
+    # ... and the pool scales linearly: 16x the rows is nowhere near 256x the time
+    import time
+    big = [{**p, "name": f"{p['name']}-{k}"} for k in range(16) for p in players]
+    t0 = time.perf_counter()
+    rank_board(players, lg, overall_pick=7)
+    t1 = time.perf_counter()
+    rank_board(big, lg, overall_pick=7)
+    t2 = time.perf_counter()
+    print(f"\nrank_board: {len(players)} rows {(t1 - t0) * 1000:.1f}ms, "
+          f"{len(big)} rows {(t2 - t1) * 1000:.1f}ms")
+    assert (t2 - t1) < 64 * (t1 - t0) + 0.05, "rank_board is no longer linear in the pool"
+    print("SELF-TEST PASSED")
@@ -36,11 +36,11 @@ sys.path.insert(0, str(ROOT / "models"))
 
 try:
     from espn_proj import _league
-    from inseason import bucket, optimal_lineup, slot_spec, waiver_targets
+    from inseason import Lineup, bucket, optimal_lineup, slot_spec, waiver_targets
     import week1_odds
 except ImportError:  # pragma: no cover
     from models.espn_proj import _league
-    from models.inseason import bucket, optimal_lineup, slot_spec, waiver_targets
+    from models.inseason import Lineup, bucket, optimal_lineup, slot_spec, waiver_targets
     from models import week1_odds
 
 CFG = json.loads((ROOT / "data" / "league_config.json").read_text(encoding="utf-8"))
@@ -198,9 +198,9 @@ def report(season: int = 2026, week: int | None = None) -> dict:
         without = [({**q, "proj": 0.0} if q["name"] == p["name"] else q) for q in my]
         cands = [f for f in fas if f["pos"] == p["pos"]][:8]
         best, best_gain = None, 0.0
-        base = optimal_lineup(without, spec)["total"]
+        lineup_without = Lineup(without, spec)
         for f in cands:
-            gain = optimal_lineup(without + [f], spec)["total"] - base
+            gain = lineup_without.total_with(f) - lineup_without.total
             if gain > best_gain:
                 best, best_gain = f, gain
         if best and best_gain > 1 and best["name"] not in claimed:
@@ -156,12 +156,23 @@ def get(season: int = 2026, week: int = 1, force: bool = False) -> dict:
         return {"season": season, "week": week, "games": [], "teams": {}, "error": str(e)}
 
 
-def dst_ranks(season: int = 2026, week: int = 1) -> dict:
+def peek(season: int = 2026, week: int = 1) -> dict | None:
+    """The on-disk copy whatever its age, or None — never touches the network.
+    Seeds the API's background refresher (feeds.py)."""
+    try:
+        blob = json.loads(_cache_path(season).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return blob if blob.get("week") == week else None
+
+
+def dst_ranks(season: int = 2026, week: int = 1, blob: dict | None = None) -> dict:
     """{TEAM: {...matchup..., w1Rank, w1Tier}} ranked by implied OPPONENT total (asc).
 
     Rank 1 = faces the offense Vegas expects to score least. This is the number
-    that should drive which defense you draft in the last rounds."""
-    blob = get(season, week)
+    that should drive which defense you draft in the last rounds. Pass `blob`
+    (an already-fetched get()) to rank without any I/O."""
+    blob = blob if blob is not None else get(season, week)
     teams = {k: dict(v) for k, v in (blob.get("teams") or {}).items()
              if v.get("impliedOppTotal") is not None}
     order = sorted(teams.values(), key=lambda t: t["impliedOppTotal"])
@@ -173,10 +184,10 @@ def dst_ranks(season: int = 2026, week: int = 1) -> dict:
     return {t["team"]: t for t in order}
 
 
-def k_context(season: int = 2026, week: int = 1) -> dict:
+def k_context(season: int = 2026, week: int = 1, blob: dict | None = None) -> dict:
     """{TEAM: {...}} with implied OWN total. Exposed for tie-breaking only —
     kicker scoring is barely predictable (r=+0.114, ~+6 pts/season)."""
-    blob = get(season, week)
+    blob = blob if blob is not None else get(season, week)
     teams = {k: dict(v) for k, v in (blob.get("teams") or {}).items()
              if v.get("impliedTeamTotal") is not None}
     order = sorted(teams.values(), key=lambda t: -t["impliedTeamTotal"])
@@ -22,20 +22,25 @@ Split: train 2019-2023, test 2024-2025 (two full held-out seasons).
 Metrics: MAE, Pearson r, and DECISION accuracy — among same-position pairs
 whose projections are within 3 pts (the coin-flip start/sit calls the portal
 actually faces), how often does each ranker pick the player who scored more?
+Scored on every such pair, with week-slate bootstrap 95% intervals.
 
 Run: python models/weekly_model.py   (trains, evaluates, saves the model +
 verdict to data/processed/weekly_model.json for the portal to consult)
 """
 from __future__ import annotations
 
-import glob
+import inspect
 import json
-import os
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+try:
+    import espn_store
+except ImportError:  # pragma: no cover
+    from models import espn_store
+
 ROOT = Path(__file__).resolve().parents[1]
 OUT = ROOT / "data" / "processed"
 POS = ["QB", "RB", "WR", "TE", "K", "DST", "IDP"]
@@ -51,14 +56,8 @@ def bucket(p: str) -> str:
 
 
 def load_frames() -> pd.DataFrame:
-    frames = []
-    for f in sorted(glob.glob(str(ROOT / "data" / "raw" / "espn" / "*" / "box_players.csv"))):
-        year = int(os.path.basename(os.path.dirname(f)))
-        d = pd.read_csv(f)
-        d["year"] = year
-        frames.append(d)
-    df = pd.concat(frames, ignore_index=True)
-    df = df[(df["is_playoff"] == False) & (df["on_bye"] == False)]          # noqa: E712
+    df = espn_store.load("box_players", where=[("is_playoff", "==", False),
+                                               ("on_bye", "==", False)])
     df = df[pd.to_numeric(df["points"], errors="coerce").notna()
             & pd.to_numeric(df["projected_points"], errors="coerce").notna()]
     df["pos"] = df["position"].map(bucket)
@@ -67,13 +66,22 @@ def load_frames() -> pd.DataFrame:
 
 
 def engineer(df: pd.DataFrame) -> pd.DataFrame:
-    g = df.groupby(["player_id", "year"], group_keys=False)
+    # All grouped work is cumulative (cumsum / cumcount / cummax, then a grouped
+    # shift), which pandas runs in compiled code — no per-player-season Python.
+    keys = [df["player_id"], df["year"]]
+    g = df.groupby(keys, sort=False)
     # trailing same-season signals, shifted so week N sees only weeks < N
-    df["trail_mean"] = g["points"].apply(lambda s: s.shift(1).expanding().mean())
-    df["trail_max"] = g["points"].apply(lambda s: s.shift(1).expanding().max())
-    df["games_so_far"] = g.cumcount()
+    games = g.cumcount()
+    prior = games.where(games > 0)                # NaN in week 1: no trailing signal yet
+
+    def trailing_mean(col: str) -> pd.Series:
+        return df[col].groupby(keys, sort=False).cumsum().groupby(keys, sort=False).shift(1) / prior
+
+    df["trail_mean"] = trailing_mean("points")
+    df["trail_max"] = g["points"].cummax().groupby(keys, sort=False).shift(1)
+    df["games_so_far"] = games
     df["bias"] = df["points"] - df["projected_points"]
-    df["trail_bias"] = g["bias"].apply(lambda s: s.shift(1).expanding().mean())
+    df["trail_bias"] = trailing_mean("bias")
     # prior-season points-per-week
     season_ppw = (df.groupby(["player_id", "year"])["points"].mean()
                   .rename("ppw").reset_index())
@@ -88,37 +96,104 @@ def engineer(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def feature_frame(refresh: bool = False) -> pd.DataFrame:
+    """engineer(load_frames()), cached on disk. The cache key is the box-score
+    data version plus engineer's own source, so a new pull or a feature edit
+    rebuilds it and an unchanged retrain starts from the cached matrix."""
+    salt = inspect.getsource(load_frames) + inspect.getsource(engineer)
+    return espn_store.cached("weekly_features", ["box_players"],
+                             lambda: engineer(load_frames()), salt=salt, refresh=refresh)
+
+
 FEATURES = (["projected_points", "trail_mean", "trail_max", "trail_bias",
              "games_so_far", "prev_ppw", "week"] + [f"pos_{p}" for p in POS])
 
 
-def decision_accuracy(d: pd.DataFrame, score_col: str, n_pairs: int = 20000,
+def coin_flip_pairs(d: pd.DataFrame, max_diff: float = 3.0) -> tuple[np.ndarray, np.ndarray]:
+    """Every same-(year, week, pos) pair whose projections are within `max_diff`
+    and whose actual points differ — the start/sit coin flips — as two positional
+    index arrays into `d`. Built by sorting on (group, projection) and taking, for
+    each row, the run of later rows still inside the window: no per-group loop."""
+    grp = d.groupby(["year", "week", "pos"], sort=False).ngroup().to_numpy()
+    proj = d["projected_points"].to_numpy(dtype=float)
+    pts = d["points"].to_numpy(dtype=float)
+    order = np.lexsort((proj, grp))
+    g, p = grp[order], proj[order]
+    n = len(order)
+    # rows [k+1, hi[k]) share k's group and sit within max_diff above it
+    grp_end = np.searchsorted(g, g, side="right")
+    key = g * (np.ptp(p) + 2 * max_diff + 1 if n else 1.0) + p
+    hi = np.minimum(np.searchsorted(key, key + max_diff * (1 + 1e-9), side="right"), grp_end)
+    cnt = np.maximum(hi - np.arange(n) - 1, 0)
+    a = np.repeat(np.arange(n), cnt)
+    b = a + 1 + (np.arange(cnt.sum()) - np.repeat(np.cumsum(cnt) - cnt, cnt))
+    i, j = order[a], order[b]
+    keep = (np.abs(proj[i] - proj[j]) <= max_diff) & (pts[i] != pts[j])
+    return i[keep], j[keep]
+
+
+def decision_eval(d: pd.DataFrame, score_cols: list[str], max_diff: float = 3.0,
+                  sample: int | None = None, n_boot: int = 1000, seed: int = 7) -> dict:
+    """Coin-flip decision accuracy for several score columns on the SAME pairs.
+
+    Every eligible pair is scored (or a uniform `sample` of them), each column
+    in one vectorized pass: a column is right when it orders the pair the way
+    the actual points did; a tied score earns half credit. 95% intervals come
+    from a bootstrap over (year, week) slates — pairs in one slate share players
+    and game scripts, so they are not independent — and `vs` gives each column's
+    accuracy minus the first column's, with its own paired interval.
+
+    Returns {pairs, acc: {col: x}, ci: {col: [lo, hi]}, vs: {col: {diff, ci}}}."""
+    rng = np.random.default_rng(seed)
+    i, j = coin_flip_pairs(d, max_diff)
+    if sample is not None and sample < i.size:
+        pick = rng.choice(i.size, sample, replace=False)
+        i, j = i[pick], j[pick]
+    if not i.size:
+        nan = float("nan")
+        return {"pairs": 0, "acc": dict.fromkeys(score_cols, nan),
+                "ci": {c: [nan, nan] for c in score_cols}, "vs": {}}
+    actual = np.sign(d["points"].to_numpy(dtype=float)[i] - d["points"].to_numpy(dtype=float)[j])
+    S = d[score_cols].to_numpy(dtype=float)
+    call = np.sign(S[i] - S[j])                                   # (pairs, cols)
+    credit = np.where(call == 0, 0.5, (call == actual[:, None]).astype(float))
+
+    slate = d.groupby(["year", "week"], sort=False).ngroup().to_numpy()[i]
+    k = int(slate.max()) + 1
+    hits = np.stack([np.bincount(slate, credit[:, c], minlength=k) for c in range(len(score_cols))], 1)
+    n = np.bincount(slate, minlength=k).astype(float)
+    draws = rng.integers(0, k, (n_boot, k))                      # slates, with replacement
+    w = np.bincount((draws + k * np.arange(n_boot)[:, None]).ravel(),
+                    minlength=n_boot * k).reshape(n_boot, k)
+    boot = (w @ hits) / np.maximum(w @ n, 1)[:, None]            # (n_boot, cols)
+    acc = credit.mean(axis=0)
+
+    def interval(x):
+        if not x.size:
+            return [float("nan"), float("nan")]
+        lo, hi = np.percentile(x, [2.5, 97.5])
+        return [round(float(lo), 4), round(float(hi), 4)]
+
+    return {
+        "pairs": int(i.size),
+        "acc": {c: float(acc[m]) for m, c in enumerate(score_cols)},
+        "ci": {c: interval(boot[:, m]) for m, c in enumerate(score_cols)},
+        "vs": {c: {"diff": float(acc[m] - acc[0]), "ci": interval(boot[:, m] - boot[:, 0])}
+               for m, c in enumerate(score_cols) if m},
+    }
+
+
+def decision_accuracy(d: pd.DataFrame, score_col: str, n_pairs: int | None = None,
                       seed: int = 7) -> float:
     """Among same-position, same-week pairs with |proj diff| <= 3 (real start/sit
-    coin flips), how often does `score_col` pick the player who actually scored more?"""
-    rng = np.random.default_rng(seed)
-    correct = total = 0
-    for (_, _, _), grp in d.groupby(["year", "week", "pos"]):
-        if len(grp) < 2:
-            continue
-        arr = grp[[score_col, "projected_points", "points"]].to_numpy()
-        k = min(len(arr) * 2, 40)
-        for _ in range(k):
-            i, j = rng.choice(len(arr), 2, replace=False)
-            if abs(arr[i][1] - arr[j][1]) > 3 or arr[i][2] == arr[j][2]:
-                continue
-            pick = i if arr[i][0] > arr[j][0] else j
-            actual = i if arr[i][2] > arr[j][2] else j
-            correct += (pick == actual)
-            total += 1
-            if total >= n_pairs:
-                return correct / total
-    return correct / total if total else float("nan")
+    coin flips), how often does `score_col` pick the player who actually scored more?
+    Every such pair by default; `n_pairs` scores a random sample instead."""
+    return decision_eval(d, [score_col], sample=n_pairs, n_boot=0, seed=seed)["acc"][score_col]
 
 
 def main() -> None:
     from sklearn.ensemble import HistGradientBoostingRegressor
-    df = engineer(load_frames())
+    df = feature_frame()
     train = df[df["year"] <= 2023]
     test = df[df["year"] >= 2024].copy()
     print(f"train: {len(train)} player-weeks (2019-2023) · test: {len(test)} (2024-2025)")
@@ -133,13 +208,16 @@ def main() -> None:
     mae_ml = float((test["points"] - test["ml"]).abs().mean())
     r_espn = float(np.corrcoef(test["projected_points"], test["points"])[0, 1])
     r_ml = float(np.corrcoef(test["ml"], test["points"])[0, 1])
-    acc_espn = decision_accuracy(test, "projected_points")
-    acc_ml = decision_accuracy(test, "ml")
+    dec = decision_eval(test, ["projected_points", "ml"])
+    acc_espn, acc_ml = dec["acc"]["projected_points"], dec["acc"]["ml"]
 
     print(f"\n{'metric':<28}{'ESPN proj':>12}{'ML model':>12}")
     print(f"{'MAE (pts, lower=better)':<28}{mae_espn:>12.2f}{mae_ml:>12.2f}")
     print(f"{'Pearson r (higher=better)':<28}{r_espn:>12.3f}{r_ml:>12.3f}")
     print(f"{'coin-flip decision acc':<28}{acc_espn:>12.1%}{acc_ml:>12.1%}")
+    lo, hi = dec["vs"]["ml"]["ci"]
+    print(f"  ({dec['pairs']} coin-flip pairs; ML - ESPN {dec['vs']['ml']['diff']:+.1%}, "
+          f"95% CI {lo:+.1%} to {hi:+.1%})")
 
     wins = (mae_ml < mae_espn) + (r_ml > r_espn) + (acc_ml > acc_espn)
     verdict = "SHIP" if wins >= 2 else "DO NOT SHIP"
@@ -156,7 +234,10 @@ def main() -> None:
         "verdict": verdict, "trainedThrough": 2023, "testedOn": [2024, 2025],
         "mae": {"espn": round(mae_espn, 3), "ml": round(mae_ml, 3)},
         "pearson": {"espn": round(r_espn, 4), "ml": round(r_ml, 4)},
-        "decisionAcc": {"espn": round(acc_espn, 4), "ml": round(acc_ml, 4)},
+        "decisionAcc": {"espn": round(acc_espn, 4), "ml": round(acc_ml, 4),
+                        "pairs": dec["pairs"],
+                        "ci": {"espn": dec["ci"]["projected_points"], "ml": dec["ci"]["ml"]},
+                        "mlMinusEspnCI": dec["vs"]["ml"]["ci"]},
         "features": FEATURES}, indent=1), encoding="utf-8")
     print(f"eval card -> {OUT / 'weekly_model.json'}")
 
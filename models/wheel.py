@@ -14,18 +14,39 @@ Drafting at the turn is a different game: you make TWO picks at once, then wait
      survival odds for the names you care about + expected best-at-position
      when the board comes back to you.
 
+Room sims all start from ONE DraftSession (built once, played on copies) and
+each sim's seed is fixed by its index, so they are independent: past
+PARALLEL_MIN_SIMS they are split into contiguous seed chunks across a process
+pool and merged back in seed order — identical to the serial answer. By default
+the count is adaptive (models/montecarlo.py): batches of N_SIMS rooms run until
+every watched player's survival odds have standard error <= SURVIVE_SE or
+BUDGET_MS is spent, and each surviveProb ships with its 95% interval. A fixed
+`n_sims` (the endpoint's `sims`) still runs exactly that many.
+
 Deterministic per seed set. No LLM. Served at /api/wheel-plan.
 """
 from __future__ import annotations
 
 try:
+    import board_store
+    import draft_session as ds
+    import montecarlo
     import opponent_ai as oa
     import pick_engine as pe
+    import sim_pool
 except ImportError:  # pragma: no cover
+    from models import board_store
+    from models import draft_session as ds
+    from models import montecarlo
     from models import opponent_ai as oa
     from models import pick_engine as pe
+    from models import sim_pool
 
-N_SIMS = 25          # room simulations for the survival forecast
+N_SIMS = 25          # room simulations per adaptive batch (and the smallest answer)
+MAX_SIMS = 2000      # per-call ceiling
+SURVIVE_SE = 0.04    # adaptive target: survival odds within ~±8 points (95%)
+BUDGET_MS = 1500     # adaptive time budget for the room sims
+PARALLEL_MIN_SIMS = 100   # below this a pool's startup costs more than it saves
 TOP_A = 5            # first-pick candidates to branch on
 SLOT_ORDER = {"RB": ["RB1", "RB2", "FLEX", "FLEX2"], "WR": ["WR1", "WR2", "FLEX", "FLEX2"],
               "TE": ["TE", "FLEX", "FLEX2"]}
@@ -42,6 +63,54 @@ def _place(my_roster: dict, player: dict) -> dict:
     return out          # bench — roster dict unchanged (bench is sent separately)
 
 
+def _room_sims(board, log, gone, team_order, start, my_slot, teams, rounds, profiles,
+               alias_map, watch, seeds) -> list[tuple]:
+    """Play the room forward once per seed. Per sim: (nextPick, names in `watch`
+    that survived, {pos: best league_pts left outside `gone` + the sim's picks})."""
+    sess = ds.DraftSession(board, team_order or [], teams)
+    sess.sync(log)
+    order = ds.pos_boards(board)
+    pts = board.col("league_pts")
+    out = []
+    for seed in seeds:
+        res = sess.ghost(start, my_slot or 0, rounds=rounds, profiles=profiles,
+                         alias_map=alias_map, seed=seed)
+        taken = {p["name"] for p in res["picks"]} | gone
+        # best remaining at each position after the room has fed
+        rem: dict[str, float] = {}
+        for pos, ix in order.items():
+            i = next((i for i in ix if board.names[i] not in taken), None)
+            if i is not None and pts[i] > 0:
+                rem[pos] = float(pts[i])
+        out.append((res["nextPick"], [nm for nm in watch if nm not in taken], rem))
+    return out
+
+
+def _room_sims_stored(path, version, *args) -> list[tuple] | None:
+    """Pool-worker entry: the board is re-read from the store, not pickled across."""
+    board = sim_pool.board_at(path, version)
+    return None if board is None else _room_sims(board, *args)
+
+
+def _run_sims(board_rows, log, gone, team_order, start, my_slot, teams, rounds, profiles,
+              alias_map, watch, seeds) -> list[tuple]:
+    board = board_store.board_for(board_rows)
+    args = (log, gone, team_order, start, my_slot, teams, rounds, profiles, alias_map, watch)
+    workers = sim_pool.WORKERS
+    if workers > 1 and len(seeds) >= PARALLEL_MIN_SIMS and board.path is not None:
+        size = -(-len(seeds) // workers)
+        chunks = [seeds[i:i + size] for i in range(0, len(seeds), size)]
+        try:
+            parts = list(sim_pool.executor().map(_room_sims_stored, [board.path] * len(chunks),
+                                         [board.version] * len(chunks),
+                                         *[[a] * len(chunks) for a in args], chunks))
+        except Exception:      # broken pool (worker killed, etc.) — serial still answers
+            parts = [None]
+        if all(p is not None for p in parts):
+            return [r for p in parts for r in p]
+    return _room_sims(board, *args, seeds)
+
+
 def is_my_turn_pair(overall: int, my_slot: int, teams: int) -> bool:
     return (oa.slot_for_pick(overall, teams) == my_slot
             and overall + 1 <= 10 ** 9
@@ -50,8 +119,11 @@ def is_my_turn_pair(overall: int, my_slot: int, teams: int) -> bool:
 
 def plan(board_rows, drafted, my_roster, picks_log, overall_pick, teams=10,
          team_order=None, team_rosters=None, my_slot=None, rounds=18, bench=None,
-         profiles=None, alias_map=None) -> dict:
-    """The full wheel read for the CURRENT pick. Cheap enough to run every turn."""
+         profiles=None, alias_map=None, n_sims: int | None = None,
+         target_se: float | None = None, budget_ms: float | None = None) -> dict:
+    """The full wheel read for the CURRENT pick. Cheap enough to run every turn.
+    `n_sims` fixes the room-simulation count (capped at MAX_SIMS); otherwise it's
+    adaptive to `target_se` (default SURVIVE_SE) within `budget_ms` (BUDGET_MS)."""
     args = dict(teams=teams, team_order=team_order, team_rosters=team_rosters,
                 my_slot=my_slot, rounds=rounds, bench=bench,
                 profiles=profiles, alias_map=alias_map)
@@ -105,39 +177,44 @@ def plan(board_rows, drafted, my_roster, picks_log, overall_pick, teams=10,
     best_at_next: dict[str, list[float]] = {}
     next_pick = None
     took_pair = pairs[0] if pairs else None
-    for i in range(N_SIMS):
-        log = list(picks_log or [])
-        gone = set(drafted)
-        if pair_turn and took_pair:          # assume the recommended pair leaves with me
-            for c in (took_pair["first"], took_pair["second"]):
-                gone.add(c["name"])
-                log.append({"overall": overall_pick, "team": "ME",
-                            "name": c["name"], "pos": c["position"]})
-        res = oa.simulate(board_rows, log, team_order or [], start, my_slot or 0,
-                          teams=teams, rounds=rounds, profiles=profiles,
-                          alias_map=alias_map, seed=1000 + i * 17)
-        next_pick = res["nextPick"]
-        taken = {p["name"] for p in res["picks"]} | gone
-        for nm in survive:
-            if nm not in taken:
-                survive[nm] += 1
-        # best remaining at each position after the room has fed
-        rem: dict[str, float] = {}
-        for r in board_rows:
-            if r["name"] in taken:
-                continue
-            pos = pe.normalize_pos(r.get("pos") or r.get("position"))
-            try:
-                pts = float(r.get("league_pts") or 0)
-            except (TypeError, ValueError):
-                pts = 0.0
-            if pts > rem.get(pos, 0.0):
-                rem[pos] = pts
+    log = list(picks_log or [])
+    gone = set(drafted)
+    if pair_turn and took_pair:          # assume the recommended pair leaves with me
+        for c in (took_pair["first"], took_pair["second"]):
+            gone.add(c["name"])
+            log.append({"overall": overall_pick, "team": "ME",
+                        "name": c["name"], "pos": c["position"]})
+    watch_left = [nm for nm in survive if nm not in gone]
+
+    def batch(first, k):
+        return {"sims": _run_sims(board_rows, log, gone, team_order, start, my_slot, teams,
+                                  rounds, profiles, alias_map, watch_left,
+                                  [1000 + i * 17 for i in range(first, first + k)])}
+
+    def alive_counts(tot):
+        c = dict.fromkeys(watch_left, 0)
+        for _, alive, _ in tot["sims"]:
+            for nm in alive:
+                c[nm] += 1
+        return list(c.values())
+
+    if n_sims:
+        n_sims = max(1, min(int(n_sims), MAX_SIMS))
+        sims = batch(0, n_sims)["sims"]
+    else:
+        tot, n_sims = montecarlo.adaptive(batch, alive_counts, target_se or SURVIVE_SE,
+                                          min_n=N_SIMS, max_n=MAX_SIMS,
+                                          budget_ms=budget_ms or BUDGET_MS)
+        sims = tot["sims"]
+    for next_pick, alive, rem in sims:
+        for nm in alive:
+            survive[nm] += 1
         for pos, pts in rem.items():
             best_at_next.setdefault(pos, []).append(pts)
 
     forecast = [{"name": c["name"], "pos": c["position"],
-                 "surviveProb": round(survive[c["name"]] / N_SIMS, 2),
+                 "surviveProb": round(survive[c["name"]] / n_sims, 2),
+                 "surviveCI": montecarlo.ci([survive[c["name"]]], n_sims, 2)[0],
                  "proj": c.get("proj"), "vorp": c.get("vorp")}
                 for c in watch
                 if not (took_pair and c["name"] in
@@ -156,16 +233,15 @@ def plan(board_rows, drafted, my_roster, picks_log, overall_pick, teams=10,
 
     return {"isPairTurn": pair_turn, "pairs": pairs, "forecast": forecast,
             "expectedAtNextTurn": per_pos, "nextPick": next_pick,
-            "simCount": N_SIMS, "anchor": base["anchor"]}
+            "simCount": n_sims, "anchor": base["anchor"]}
 
 
 if __name__ == "__main__":     # python models/wheel.py — self-test at pick 10 (the wheel)
-    import csv
     import json
     import time
     from pathlib import Path
     ROOT = Path(__file__).resolve().parents[1]
-    rows = list(csv.DictReader(open(ROOT / "data/processed/board_2026.csv", encoding="utf-8")))
+    rows = pe.board_store.rows()
     profiles = json.loads((ROOT / "data/processed/manager_profiles.json").read_text(encoding="utf-8"))
     aliases = {k: v for k, v in json.loads((ROOT / "data/team_aliases.json").read_text(
         encoding="utf-8")).items() if not k.startswith("_")}
@@ -0,0 +1,210 @@
+"""BENCH — draft-night hot paths, timed against stored baselines.
+
+    python scripts/bench.py                  # run, compare, write data/processed/bench_latest.json
+    python scripts/bench.py --update         # ...and accept the results as the new baseline
+    python scripts/bench.py --only shortlist # substring filter on case names
+
+Every case runs on the committed board snapshot (data/processed/board_2026.csv)
+against one deterministic full-draft log, so numbers are comparable run to run:
+
+  shortlist@1/10/80/150   pick_engine.shortlist at representative picks
+  simulate_full           opponent_ai.simulate, all 180 picks from an empty board
+  wheel_turn              wheel.plan at pick 10 (slot 10's back-to-back)
+  tournament_n12          tournament.run, 12 futures
+  title_odds_1k/10k       season_sim.title_odds
+  rank_board_full         value_engine.rank_board over every board row (a live re-rank)
+  api_board_build/_304    /api/board through the Flask test client: a cold payload
+                          build, and a revalidation that answers 304
+
+A case FAILS when its median is over its pick-clock budget (an absolute ceiling —
+what the UI can afford while someone is on the clock) or more than --tolerance
+times its stored baseline (data/bench_baseline.json). Exit code 1 on any failure.
+No network: the API's feeds serve their disk-seeded snapshots and never poll.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from models import (board_store, opponent_ai, pick_engine, season_sim, tournament,  # noqa: E402
+                    value_engine, wheel)
+
+BASELINE_PATH = ROOT / "data" / "bench_baseline.json"
+OUT_PATH = ROOT / "data" / "processed" / "bench_latest.json"
+ORDER = ["Gilbert", "Bollinger", "Hubauer", "Putman", "Walker", "Wester", "Spivey", "Street",
+         "Munford", "Ray"]
+MY_SLOT = 10
+SLACK_MS = 2.0        # sub-millisecond cases jitter by more than any ratio; never flag under this
+
+
+def _load_json(p: Path) -> dict:
+    try:
+        return json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _context() -> dict:
+    rows = board_store.rows()
+    profiles = {k: v for k, v in _load_json(ROOT / "data/processed/manager_profiles.json").items()
+                if v.get("active_2026")}
+    aliases = {k: v for k, v in _load_json(ROOT / "data/team_aliases.json").items()
+               if not k.startswith("_")}
+    full = opponent_ai.simulate(rows, [], ORDER, 1, 0, teams=10, rounds=18, profiles=profiles,
+                                alias_map=aliases, seed=2026, stop_at_my_pick=False)["picks"]
+    return {"rows": rows, "profiles": profiles, "aliases": aliases, "log": full}
+
+
+def _state_at(ctx: dict, pick: int) -> dict:
+    """Everything the endpoints send at `pick`: log, drafted names, my roster/bench."""
+    log = ctx["log"][:pick - 1]
+    roster, bench = {}, []
+    for pk in log:
+        if pk["team"] != ORDER[MY_SLOT - 1]:
+            continue
+        for s in wheel.SLOT_ORDER.get(pk["pos"], [pk["pos"]]):
+            if not roster.get(s):
+                roster[s] = {"name": pk["name"], "position": pk["pos"]}
+                break
+        else:
+            bench.append({"name": pk["name"], "position": pk["pos"]})
+    return {"log": log, "drafted": [p["name"] for p in log], "roster": roster, "bench": bench}
+
+
+def cases(ctx: dict) -> list[tuple[str, float, int, object]]:
+    """(name, pick-clock budget ms, runs, fn)."""
+    rows, prof, al = ctx["rows"], ctx["profiles"], ctx["aliases"]
+    out = []
+    for pick in (1, 10, 80, 150):
+        st = _state_at(ctx, pick)
+        out.append((f"shortlist@{pick}", 50, 30, lambda st=st, pick=pick: pick_engine.shortlist(
+            rows, set(st["drafted"]), st["roster"], st["log"], pick, teams=10, team_order=ORDER,
+            my_slot=MY_SLOT, rounds=18, bench=st["bench"], profiles=prof, alias_map=al)))
+    out.append(("simulate_full", 1500, 5, lambda: opponent_ai.simulate(
+        rows, [], ORDER, 1, 0, teams=10, rounds=18, profiles=prof, alias_map=al, seed=7,
+        stop_at_my_pick=False)))
+    st = _state_at(ctx, 10)
+    out.append(("wheel_turn", 3000, 5, lambda: wheel.plan(
+        rows, st["drafted"], st["roster"], st["log"], 10, teams=10, team_order=ORDER,
+        my_slot=MY_SLOT, rounds=18, bench=st["bench"], profiles=prof, alias_map=al)))
+    st = _state_at(ctx, 30)
+    out.append(("tournament_n12", 10000, 3, lambda: tournament.run(
+        rows, st["log"], ORDER, 30, my_slot=MY_SLOT, teams=10, rounds=18, n=12,
+        profiles=prof, alias_map=al)))
+    st = _state_at(ctx, 80)
+    rosters = {}
+    for pk in st["log"]:
+        rosters.setdefault(pk["team"], []).append({"name": pk["name"], "position": pk["pos"]})
+    avail = [r for r in rows if r["name"] not in set(st["drafted"])]
+    from models import draft_session
+    lookup = draft_session.pts_lookup(board_store.get())
+    for n in (1000, 10000):
+        out.append((f"title_odds_{n // 1000}k", 250 if n == 1000 else 1000, 10,
+                    lambda n=n: season_sim.title_odds(rosters, avail, lookup, n_sims=n)))
+    pool = [{"name": r["name"], "team": r["team"], "position": r["pos"],
+             "points": r["league_pts"], "adp": r["adp"]} for r in rows]
+    out.append(("rank_board_full", 100, 20, lambda: value_engine.rank_board(
+        pool, value_engine.League(teams=10), overall_pick=80)))
+
+    os.environ.setdefault("ANTHROPIC_API_KEY", "")       # the board never calls the coach
+    import api
+    api.FEEDS.started = True      # requests read the disk-seeded snapshots; no pollers, no network
+    client = api.app.test_client()
+    etag = client.get("/api/board", headers={"Accept-Encoding": "gzip"}).headers.get("ETag")
+
+    def board_build():
+        api._board_payload["inputs"] = None
+        assert client.get("/api/board", headers={"Accept-Encoding": "gzip"}).status_code == 200
+
+    def board_304():
+        assert client.get("/api/board", headers={"Accept-Encoding": "gzip",
+                                                 "If-None-Match": etag}).status_code == 304
+    out.append(("api_board_build", 1000, 10, board_build))
+    out.append(("api_board_304", 20, 50, board_304))
+    return out
+
+
+def run(only: str | None = None) -> dict:
+    ctx = _context()
+    results = {}
+    for name, budget, runs, fn in cases(ctx):
+        if only and only not in name:
+            continue
+        fn()                                            # warm caches / lazy imports
+        times = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - t0) * 1000)
+        results[name] = {"medianMs": round(statistics.median(times), 2),
+                         "minMs": round(min(times), 2), "runs": runs, "budgetMs": budget}
+        print(f"  {name:<18} median {results[name]['medianMs']:>9.2f}ms   "
+              f"min {results[name]['minMs']:>9.2f}ms   budget {budget}ms")
+    return results
+
+
+def check(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    fails = []
+    for name, r in results.items():
+        base = (baseline.get(name) or {}).get("medianMs")
+        r["baselineMs"] = base
+        over_budget = r["medianMs"] > r["budgetMs"]
+        regressed = base is not None and r["medianMs"] > max(base * tolerance, base + SLACK_MS)
+        r["status"] = "FAIL" if (over_budget or regressed) else "ok"
+        if over_budget:
+            fails.append(f"{name}: {r['medianMs']}ms is over its {r['budgetMs']}ms budget")
+        if regressed:
+            fails.append(f"{name}: {r['medianMs']}ms vs baseline {base}ms "
+                         f"(> {tolerance:.2f}x)")
+    return fails
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--update", action="store_true", help="write results as the new baseline")
+    ap.add_argument("--only", help="run only cases whose name contains this")
+    ap.add_argument("--tolerance", type=float, default=1.5,
+                    help="fail when median > tolerance x baseline (default 1.5)")
+    ap.add_argument("--out", default=str(OUT_PATH), help="results JSON path")
+    args = ap.parse_args()
+
+    print("DraftIQ bench — draft-night hot paths")
+    results = run(args.only)
+    baseline = _load_json(BASELINE_PATH).get("results", {})
+    fails = check(results, baseline, args.tolerance)
+    import numpy as np
+    blob = {"at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+            "numpy": np.__version__, "cpus": os.cpu_count(), "machine": platform.machine(),
+            "tolerance": args.tolerance, "results": results}
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.out).write_text(json.dumps(blob, indent=2), encoding="utf-8")
+    print(f"\nwrote {args.out}")
+    if args.update:
+        merged = {**baseline, **{k: {"medianMs": v["medianMs"], "budgetMs": v["budgetMs"]}
+                                 for k, v in results.items()}}
+        BASELINE_PATH.write_text(json.dumps({"at": blob["at"], "python": blob["python"],
+                                             "cpus": blob["cpus"], "results": merged},
+                                            indent=2) + "\n", encoding="utf-8")
+        print(f"baseline updated: {BASELINE_PATH}")
+        return 0 if not any("budget" in f for f in fails) else 1
+    if fails:
+        print("\nREGRESSIONS:")
+        for f in fails:
+            print(f"  ✗ {f}")
+        return 1
+    print("all cases within budget and baseline" if baseline else
+          "all cases within budget (no baseline yet — run with --update to store one)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,7 +30,8 @@ RAW = ROOT / "data" / "raw" / "espn"
 PROC = ROOT / "data" / "processed"
 REPL = json.loads((PROC / "replacement_levels.json").read_text(encoding="utf-8"))["historical"]
 
-from inseason import CFG, optimal_lineup, slot_spec  # noqa: E402
+import espn_store  # noqa: E402
+from inseason import CFG, lineup_totals, slot_spec  # noqa: E402
 
 
 def bucket(pos: str) -> str:
@@ -54,8 +55,8 @@ def years() -> list[int]:
 def load_year(y: int) -> dict:
     d = {}
     for name in ("draft", "standings", "weekly_scores", "box_players", "rosters"):
-        f = RAW / str(y) / f"{name}.csv"
-        d[name] = pd.read_csv(f) if f.exists() else pd.DataFrame()
+        d[name] = (espn_store.load(name, years=[y], add_year=False)
+                   if y in espn_store.years(name) else pd.DataFrame())
     return d
 
 
@@ -97,6 +98,9 @@ def build() -> pd.DataFrame:
         # ---- box scores (regular season) ----
         bx = box[box.get("is_playoff", False) == False].copy() if len(box) else pd.DataFrame()
         drafted_by_team = dr.groupby("team_id")["player_id"].agg(set).to_dict()
+        # hindsight-optimal lineup for every team-week, solved in one pass
+        opt_by = lineup_totals(bx, spec, ["team_id", "week"]) if len(bx) else pd.DataFrame()
+        opt_by = dict(zip(opt_by.index, zip(opt_by.get("total", []), opt_by.get("players", []))))
 
         for _, s in standings.iterrows():
             tid, owner = int(s["team_id"]), str(s["owner"])
@@ -127,12 +131,10 @@ def build() -> pd.DataFrame:
                 eff, left, undrafted_started, started_total = [], [], 0.0, 0.0
                 streamers = set()
                 for wknum, gg in tb.groupby("week"):
-                    roster = [{"name": r["player_name"], "pos": r["position"], "proj": r["points"]}
-                              for _, r in gg.iterrows() if pd.notna(r["points"])]
-                    if len(roster) < len(spec):
+                    opt, n_players = opt_by.get((tid, wknum), (0.0, 0))
+                    if n_players < len(spec):
                         continue
                     actual = gg[gg["started"] == True]["points"].sum()
-                    opt = optimal_lineup(roster, spec)["total"]
                     if opt > 0:
                         eff.append(actual / opt)
                         left.append(opt - actual)